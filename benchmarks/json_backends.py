@@ -0,0 +1,85 @@
+"""
+Compare page encoding throughput across the JSON backends.
+
+Run from the repository root:
+
+    python benchmarks/json_backends.py [--rows 5000] [--repeat 20]
+"""
+
+import argparse
+import functools
+import os
+import sys
+import timeit
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "inertia.tests.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from inertia.encoding import JSON_BACKENDS  # noqa: E402
+from inertia.tests.testapp.models import Sport  # noqa: E402
+from inertia.utils import InertiaJsonEncoder  # noqa: E402
+
+
+def make_page(rows: int) -> dict[str, Any]:
+    return {
+        "component": "Reports/Index",
+        "props": {
+            "rows": [
+                {
+                    "id": i,
+                    "name": f"Row {i} <R&D>",
+                    "amount": Decimal("19.99"),
+                    "created": datetime(2024, 1, 1, 12, 30, i % 60),
+                    "due": date(2024, 2, 1),
+                    "tags": ["alpha", "beta", "gamma"],
+                    "sport": Sport(id=i, name="Hockey", season="Winter"),
+                }
+                for i in range(rows)
+            ],
+        },
+        "url": "/reports/",
+        "version": "1.0",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = make_page(args.rows)
+    baseline = None
+    for name, backend_class in JSON_BACKENDS.items():
+        try:
+            backend = backend_class()
+        except Exception as exc:
+            print(f"{name:>8}: skipped ({exc})")
+            continue
+
+        size = len(backend.encode(page, InertiaJsonEncoder))
+        seconds = min(
+            timeit.repeat(
+                functools.partial(backend.encode, page, InertiaJsonEncoder),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        baseline = baseline or seconds
+        print(
+            f"{name:>8}: {seconds * 1000:8.2f} ms/page"
+            f"  {size / seconds / 1e6:8.1f} MB/s"
+            f"  {baseline / seconds:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
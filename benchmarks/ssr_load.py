@@ -0,0 +1,247 @@
+"""
+Load-test server-side rendering of first loads against a local stub SSR server.
+
+Run from the repository root:
+
+    python benchmarks/ssr_load.py [--requests 2000] [--concurrency 32]
+        [--servers 1] [--latency 20] [--jitter 5] [--failure-rate 0.01]
+        [--payload 20000] [--path /props/]
+        [--setting INERTIA_SSR_DEADLINE=0.05 ...]
+
+Each stub answers each render after ``latency`` +/- ``jitter`` milliseconds
+with a body of ``payload`` bytes, and fails ``failure-rate`` of them with a
+503. First loads are driven through the testapp views with Django's test
+client from ``concurrency`` threads.
+"""
+
+import argparse
+import ast
+import contextlib
+import json
+import logging
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "inertia.tests.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import Client  # noqa: E402
+from django.test.utils import override_settings  # noqa: E402
+
+from inertia.ssr import get_ssr_client, reset_ssr_client  # noqa: E402
+
+
+class StubSSRHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; don't let Nagle's algorithm
+    # hold the body back until the client's delayed ACK.
+    disable_nagle_algorithm = True
+    server: "StubSSRServer"
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.connections.get_lock():
+            self.server.connections.value += 1
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        time.sleep(max(0.0, random.gauss(server.latency, server.jitter)))
+
+        with server.renders.get_lock():
+            server.renders.value += 1
+        if random.random() < server.failure_rate:
+            with server.failures.get_lock():
+                server.failures.value += 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(server.body)))
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class StubSSRServer(ThreadingHTTPServer):
+    """
+    Serves renders from a forked process, so the stub doesn't compete with
+    the Django side for the GIL. Counters are shared with the parent.
+    """
+
+    daemon_threads = True
+    # Accept bursts of new connections from large client pools.
+    request_queue_size = 1024
+
+    def __init__(
+        self, latency: float, jitter: float, failure_rate: float, payload: int
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), StubSSRHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.body = json.dumps(
+            {"head": ["<title>Stub</title>"], "body": f"<div>{'x' * payload}</div>"}
+        ).encode()
+        context = multiprocessing.get_context("fork")
+        self.connections = context.Value("i", 0)
+        self.renders = context.Value("i", 0)
+        self.failures = context.Value("i", 0)
+        self.process = context.Process(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self) -> "StubSSRServer":
+        self.process.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.server_close()
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients that gave up on a slow render have hung up.
+        pass
+
+
+def first_load(client: Client, path: str) -> tuple[float, str]:
+    start = time.perf_counter()
+    response = client.get(path)
+    elapsed = time.perf_counter() - start
+    if response.status_code != 200:
+        return elapsed, f"status {response.status_code}"
+    return elapsed, getattr(response, "ssr_fallback", None) or "ssr"
+
+
+def run(
+    path: str, requests: int, concurrency: int
+) -> tuple[float, list[tuple[float, str]]]:
+    local = threading.local()
+
+    def request(_: int) -> tuple[float, str]:
+        if not hasattr(local, "client"):
+            local.client = Client()
+        return first_load(local.client, path)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(request, range(requests)))
+    return time.perf_counter() - start, results
+
+
+def percentile(values: list[float], percent: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def parse_setting(value: str) -> tuple[str, Any]:
+    name, _, raw = value.partition("=")
+    try:
+        return name, ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return name, raw
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--path", default="/props/")
+    parser.add_argument("--servers", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=20, help="milliseconds")
+    parser.add_argument("--jitter", type=float, default=5, help="milliseconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--payload", type=int, default=20_000, help="body bytes")
+    parser.add_argument(
+        "--setting",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="override a setting, e.g. INERTIA_SSR_POOL_SIZE=32",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="show SSR fallback logging"
+    )
+    args = parser.parse_args()
+
+    if not args.verbose:
+        # Every fallback is logged; the counts are reported below instead.
+        logging.getLogger("inertia").setLevel(logging.CRITICAL)
+
+    servers = [
+        StubSSRServer(
+            args.latency / 1000, args.jitter / 1000, args.failure_rate, args.payload
+        )
+        for _ in range(args.servers)
+    ]
+    urls = [server.url for server in servers]
+    overrides = {
+        "INERTIA_SSR_ENABLED": True,
+        "INERTIA_SSR_URL": urls[0] if len(urls) == 1 else urls,
+        **dict(parse_setting(setting) for setting in args.setting),
+    }
+
+    with contextlib.ExitStack() as stack:
+        for server in servers:
+            stack.enter_context(server)
+        with override_settings(**overrides):
+            reset_ssr_client()
+            run(args.path, args.warmup, args.concurrency)
+            client = get_ssr_client()
+            rejected = client.bulkhead.rejected if client.bulkhead else 0
+            seconds, results = run(args.path, args.requests, args.concurrency)
+            if client.bulkhead:
+                rejected = client.bulkhead.rejected - rejected
+            circuits = [endpoint["circuit"] for endpoint in client.stats()]
+            reset_ssr_client()
+
+    latencies = sorted(elapsed for elapsed, _ in results)
+    outcomes = Counter(outcome for _, outcome in results)
+    print(f"{len(results)} first loads of {args.path} from {args.concurrency} threads")
+    print(f"  throughput: {len(results) / seconds:10.1f} req/s")
+    print(f"  mean:       {statistics.mean(latencies) * 1000:10.2f} ms")
+    for percent in (50, 90, 99):
+        ms = percentile(latencies, percent) * 1000
+        print(f"  p{percent}:        {ms:10.2f} ms")
+    print(f"  max:        {latencies[-1] * 1000:10.2f} ms")
+    print("outcomes:")
+    for outcome, count in outcomes.most_common():
+        print(f"  {outcome:<12}{count:>8}  {count / len(results):6.1%}")
+    if rejected:
+        print(f"bulkhead rejected: {rejected}")
+    for server, circuit in zip(servers, circuits, strict=True):
+        print(f"stub server {server.url} (including warmup):")
+        print(f"  renders:    {server.renders.value:>8}")
+        print(f"  failed:     {server.failures.value:>8}")
+        print(f"  connections:{server.connections.value:>8}")
+        if circuit is not None:
+            print(f"  circuit:    {circuit}")
+
+
+if __name__ == "__main__":
+    main()
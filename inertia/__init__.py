@@ -1,13 +1,36 @@
-from .http import InertiaResponse, inertia, location, preserve_fragment, render
+from .cache import cached, invalidate_cached
+from .http import (
+    InertiaResponse,
+    InertiaStreamingResponse,
+    InertiaTemplateResponse,
+    arender,
+    inertia,
+    location,
+    preserve_fragment,
+    render,
+)
 from .share import share
-from .utils import always, deep_merge, defer, lazy, merge, once, optional, scroll
+from .utils import (
+    always,
+    batch_loader,
+    deep_merge,
+    defer,
+    lazy,
+    merge,
+    once,
+    optional,
+    scroll,
+)
 
 __all__ = [
     "InertiaResponse",
+    "InertiaStreamingResponse",
+    "InertiaTemplateResponse",
     "inertia",
     "location",
     "preserve_fragment",
     "render",
+    "arender",
     "share",
     "defer",
     "always",
@@ -17,4 +40,7 @@ __all__ = [
     "scroll",
     "once",
     "optional",
+    "batch_loader",
+    "cached",
+    "invalidate_cached",
 ]
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+from .settings import settings
+
+
+class InertiaConfig(AppConfig):
+    name = "inertia"
+    verbose_name = "Inertia"
+
+    def ready(self) -> None:
+        # Resolve the settings now so misconfiguration fails at startup
+        # instead of on the first request.
+        settings.load()
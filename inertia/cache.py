@@ -0,0 +1,196 @@
+import hashlib
+import inspect
+import logging
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from asgiref.sync import async_to_sync
+from django.core.cache import BaseCache, caches
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest
+
+from .http import _submit_to_props_executor, resolving_request
+from .prop_classes import CallableProp
+from .settings import settings
+
+__all__ = ["CachedProp", "cached", "invalidate_cached"]
+
+logger = logging.getLogger(__name__)
+
+VaryOn = str | Callable[[HttpRequest], Any]
+
+
+class CachedProp(CallableProp):
+    """
+    A prop whose resolved value is shared across requests through Django's
+    cache framework.
+
+    Entries are fresh for ``ttl`` seconds. For ``stale_while_revalidate``
+    seconds after that the stale value is still served while a single
+    request refreshes it in the background. Every entry belongs to its key
+    and to each of its ``tags``, and invalidating either one bumps a version
+    that is part of the cache key, so all ``vary_on`` variants go at once.
+    """
+
+    def __init__(
+        self,
+        prop: Any,
+        *,
+        key: str,
+        ttl: float = 60,
+        stale_while_revalidate: float = 0,
+        vary_on: Iterable[VaryOn] = (),
+        tags: Iterable[str] = (),
+        cache_alias: str | None = None,
+        parallel: bool | None = None,
+    ) -> None:
+        super().__init__(prop, parallel=parallel)
+        self.key = key
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.vary_on = tuple(vary_on)
+        self.tags = tuple(tags)
+        self.cache_alias = cache_alias
+
+    def __call__(self) -> Any:
+        cache = _cache(self.cache_alias)
+        cache_key = self.cache_key(cache)
+        entry = cache.get(cache_key)
+        if entry is not None:
+            value, fresh_until = entry
+            if time.time() >= fresh_until:
+                self._revalidate(cache, cache_key)
+            return value
+
+        value = super().__call__()
+        if inspect.isawaitable(value):
+            return self._store_when_ready(cache, cache_key, value)
+        self._store(cache, cache_key, value)
+        return value
+
+    def cache_key(self, cache: BaseCache) -> str:
+        parts = [self.key, *_versions(cache, self.key, self.tags)]
+        if self.vary_on:
+            request = resolving_request.get()
+            if request is None:
+                raise RuntimeError(
+                    f"cached prop {self.key!r} varies on the request and can "
+                    "only be resolved while rendering an Inertia response"
+                )
+            parts.extend(_vary_value(request, vary) for vary in self.vary_on)
+        digest = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+        return f"inertia:prop:{digest}"
+
+    def _store(self, cache: BaseCache, cache_key: str, value: Any) -> None:
+        cache.set(
+            cache_key,
+            (value, time.time() + self.ttl),
+            self.ttl + self.stale_while_revalidate,
+        )
+
+    async def _store_when_ready(
+        self, cache: BaseCache, cache_key: str, value: Any
+    ) -> Any:
+        value = await value
+        self._store(cache, cache_key, value)
+        return value
+
+    def _revalidate(self, cache: BaseCache, cache_key: str) -> None:
+        lock_key = f"{cache_key}:refreshing"
+        # Only the request that takes the lock refreshes the entry; the lock
+        # expires on its own if the refresh dies without releasing it.
+        if not cache.add(lock_key, True, max(self.stale_while_revalidate, 1)):
+            return
+
+        def refresh() -> None:
+            try:
+                value = CallableProp.__call__(self)
+                if inspect.isawaitable(value):
+                    value = async_to_sync(_await)(value)
+                self._store(cache, cache_key, value)
+            except Exception:
+                logger.exception("Refreshing cached prop %r failed", self.key)
+            finally:
+                cache.delete(lock_key)
+
+        _submit_to_props_executor(refresh)
+
+
+def cached(
+    prop: Any,
+    *,
+    key: str,
+    ttl: float = 60,
+    stale_while_revalidate: float = 0,
+    vary_on: Iterable[VaryOn] = (),
+    tags: Iterable[str] = (),
+    cache_alias: str | None = None,
+    parallel: bool | None = None,
+) -> CachedProp:
+    return CachedProp(
+        prop,
+        key=key,
+        ttl=ttl,
+        stale_while_revalidate=stale_while_revalidate,
+        vary_on=vary_on,
+        tags=tags,
+        cache_alias=cache_alias,
+        parallel=parallel,
+    )
+
+
+def invalidate_cached(
+    key: str | None = None,
+    *,
+    tags: Iterable[str] = (),
+    cache_alias: str | None = None,
+) -> None:
+    """Expire every cached prop with the given key or any of the given tags."""
+    cache = _cache(cache_alias)
+    names = [f"tag:{tag}" for tag in tags]
+    if key is not None:
+        names.append(f"key:{key}")
+    version = time.time_ns()
+    cache.set_many({_version_key(name): version for name in names}, None)
+
+
+def _cache(alias: str | None) -> BaseCache:
+    return caches[alias or settings.INERTIA_CACHE_ALIAS]
+
+
+def _version_key(name: str) -> str:
+    return f"inertia:version:{name}"
+
+
+def _versions(cache: BaseCache, key: str, tags: Iterable[str]) -> list[str]:
+    names = [f"key:{key}", *(f"tag:{tag}" for tag in tags)]
+    keys = [_version_key(name) for name in names]
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        # A version that was never set or has been evicted starts fresh, so
+        # nothing cached under an earlier version can be served again.
+        fresh = time.time_ns()
+        for key in missing:
+            cache.add(key, fresh, None)
+        versions.update(cache.get_many(missing))
+    return [str(versions.get(key)) for key in keys]
+
+
+def _vary_value(request: HttpRequest, vary: VaryOn) -> str:
+    if callable(vary):
+        value = vary(request)
+    elif hasattr(request, vary):
+        value = getattr(request, vary)
+    else:
+        # Falling back to None would share one entry between every variant.
+        raise ImproperlyConfigured(
+            f"cached props cannot vary on {vary!r}: the request has no such "
+            "attribute (is the middleware that sets it installed?)"
+        )
+    return str(getattr(value, "pk", value))
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
@@ -0,0 +1,160 @@
+import math
+from abc import ABC, abstractmethod
+from json import JSONEncoder
+from json import dumps as json_encode
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from .settings import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+__all__ = [
+    "JsonBackend",
+    "OrjsonBackend",
+    "StdlibJsonBackend",
+    "encode_json",
+    "encode_script_json",
+    "escape_script_json",
+    "get_json_backend",
+]
+
+
+class JsonBackend(ABC):
+    """
+    Turns a page into JSON text.
+
+    Backends receive the configured ``JSONEncoder`` class and must honour its
+    ``default`` hook, which is where ``InertiaJsonEncoder`` handles models,
+    QuerySets, ``InertiaMeta`` and Django's own types.
+    """
+
+    @abstractmethod
+    def encode(self, obj: Any, encoder: type[JSONEncoder]) -> str:
+        pass
+
+    def encode_script(self, obj: Any, encoder: type[JSONEncoder]) -> str:
+        """
+        Encode ``obj`` as JSON that is safe to embed in a ``<script>`` tag.
+
+        Backends that can escape while encoding should override this.
+        """
+        return escape_script_json(self.encode(obj, encoder))
+
+
+class StdlibJsonBackend(JsonBackend):
+    def encode(self, obj: Any, encoder: type[JSONEncoder]) -> str:
+        return json_encode(obj, cls=encoder)
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    Encode with orjson, falling back to the encoder's ``default`` hook.
+
+    Dates and times are passed through to the hook so they are formatted
+    exactly as ``DjangoJSONEncoder`` formats them. Pages orjson can't encode
+    the same way, such as integers beyond 64 bits or NaN and infinities
+    (which orjson writes as ``null``), are encoded with the stdlib instead.
+    """
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImproperlyConfigured(
+                "The orjson JSON backend requires orjson to be installed."
+            )
+        self.options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+    def encode(self, obj: Any, encoder: type[JSONEncoder]) -> str:
+        encoder_default = encoder().default
+        converted = []
+
+        def default(value: Any) -> Any:
+            result = encoder_default(value)
+            converted.append(result)
+            return result
+
+        try:
+            data = orjson.dumps(obj, default=default, option=self.options)
+        except orjson.JSONEncodeError:
+            return json_encode(obj, cls=encoder)
+        # Only pages with a null can have lost a NaN or an infinity.
+        if b"null" in data and _has_non_finite([obj, *converted]):
+            return json_encode(obj, cls=encoder)
+        return data.decode()
+
+
+def _has_non_finite(values: list[Any]) -> bool:
+    stack = values
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is str or kind is int or value is None:
+            continue
+        if kind is float:
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float) and not math.isfinite(value):
+            return True
+    return False
+
+
+def escape_script_json(data: str) -> str:
+    # Page data is embedded in a JSON script tag for Inertia v3 clients.
+    # Escape the few characters that could terminate or alter that script.
+    # Each replace is a single C-level scan and returns ``data`` itself when
+    # nothing matches, so pages without these characters are never copied.
+    data = data.replace("&", "\\u0026").replace("<", "\\u003c").replace(">", "\\u003e")
+    if not data.isascii():
+        data = data.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    return data
+
+
+JSON_BACKENDS: dict[str, type[JsonBackend]] = {
+    "stdlib": StdlibJsonBackend,
+    "orjson": OrjsonBackend,
+}
+
+_backends: dict[str, JsonBackend] = {}
+
+
+def get_json_backend() -> JsonBackend:
+    name = settings.INERTIA_JSON_BACKEND
+    if name == "auto":
+        name = "stdlib" if orjson is None else "orjson"
+
+    backend = _backends.get(name)
+    if backend is None:
+        if name in JSON_BACKENDS:
+            backend_class = JSON_BACKENDS[name]
+        else:
+            try:
+                backend_class = import_string(name)
+            except ImportError as exc:
+                raise ImproperlyConfigured(
+                    f"Unknown INERTIA_JSON_BACKEND {name!r}."
+                ) from exc
+        backend = _backends[name] = backend_class()
+    return backend
+
+
+def encode_json(obj: Any, encoder: type[JSONEncoder] | None = None) -> str:
+    return get_json_backend().encode(obj, encoder or settings.INERTIA_JSON_ENCODER)
+
+
+def encode_script_json(obj: Any, encoder: type[JSONEncoder] | None = None) -> str:
+    return get_json_backend().encode_script(
+        obj, encoder or settings.INERTIA_JSON_ENCODER
+    )
@@ -1,17 +1,39 @@
+import asyncio
+import contextvars
+import inspect
+import itertools
 import logging
-from functools import wraps
+import re
+import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, partial, wraps
 from http import HTTPStatus
+from json import JSONEncoder
 from json import dumps as json_encode
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable, Generator, Iterable, Iterator, cast
 
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
 from django.contrib.messages import get_messages
 from django.core.exceptions import ImproperlyConfigured
-from django.http import HttpRequest, HttpResponse
+from django.core.signals import setting_changed
+from django.db import close_old_connections
+from django.dispatch import receiver
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.template.loader import render_to_string
+from django.template.response import SimpleTemplateResponse
+from django.utils import timezone, translation
+from django.utils.autoreload import file_changed
 from django.utils.cache import patch_vary_headers
 
+from .encoding import encode_script_json, escape_script_json
+from .prerender import load_prerendered
 from .prop_classes import (
     AlwaysProp,
+    BatchLoad,
+    BatchLoader,
     CallableProp,
     DeferredProp,
     IgnoreOnFirstLoadProp,
@@ -19,17 +41,20 @@ from .prop_classes import (
     ScrollProp,
 )
 from .settings import settings
-
-try:
-    # Must be early-imported so tests can patch it with
-    # a mock module
-    import requests
-except ImportError:
-    requests = None  # type: ignore[assignment]
+from .ssr import (
+    CircuitOpen,
+    SSRBusy,
+    SSRDeadlineExceeded,
+    arender_page,
+    render_page,
+)
+from .version import get_version
 
 logger = logging.getLogger(__name__)
 
 INERTIA_REQUEST_ENCRYPT_HISTORY = "_inertia_encrypt_history"
+INERTIA_REQUEST_PROTOCOL = "_inertia_protocol"
+INERTIA_REQUEST_VERSION = "_inertia_version"
 INERTIA_SESSION_CLEAR_HISTORY = "_inertia_clear_history"
 INERTIA_SESSION_PRESERVE_FRAGMENT = "_inertia_preserve_fragment"
 
@@ -37,6 +62,81 @@ INERTIA_TEMPLATE = "inertia.html"
 INERTIA_SSR_TEMPLATE = "inertia_ssr.html"
 SKIP_PROP = object()
 
+# Marks where per-request values go when a first-load template is rendered
+# ahead of time. Random per process so a layout can't contain it by chance.
+LAYOUT_SLOT_MARKER = f"inertia-slot-{secrets.token_hex(16)}"
+LAYOUT_SLOT = re.compile(rf"{LAYOUT_SLOT_MARKER}\[(\w+)\]")
+LAYOUT_SHELL_CACHE_SIZE = 256
+
+
+def _header_list(request: HttpRequest, name: str) -> list[str] | None:
+    if name not in request.headers:
+        return None
+    return [
+        value.strip() for value in request.headers[name].split(",") if value.strip()
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class InertiaProtocol:
+    """
+    The Inertia request headers, parsed once per request.
+
+    Use ``InertiaProtocol.for_request`` rather than constructing this
+    directly; it caches the parsed state on the request so the middleware,
+    the response and the props resolver all share a single instance.
+    """
+
+    is_inertia: bool
+    version: str | None
+    partial_component: str
+    partial_keys: tuple[str, ...] | None
+    partial_except_keys: tuple[str, ...] | None
+    reset_keys: frozenset[str]
+    except_once_prop_keys: frozenset[str]
+    merge_intent: str
+    is_prefetch: bool
+    # The same keys in header order, for the InertiaRequest accessors.
+    reset_keys_in_order: tuple[str, ...]
+    except_once_prop_keys_in_order: tuple[str, ...]
+
+    @classmethod
+    def from_request(cls, request: HttpRequest) -> "InertiaProtocol":
+        partial_keys = _header_list(request, "X-Inertia-Partial-Data")
+        partial_except_keys = _header_list(request, "X-Inertia-Partial-Except")
+        reset_keys = tuple(_header_list(request, "X-Inertia-Reset") or ())
+        except_once_prop_keys = tuple(
+            _header_list(request, "X-Inertia-Except-Once-Props") or ()
+        )
+        return cls(
+            is_inertia="X-Inertia" in request.headers,
+            version=request.headers.get("X-Inertia-Version"),
+            partial_component=request.headers.get("X-Inertia-Partial-Component", ""),
+            partial_keys=None if partial_keys is None else tuple(partial_keys),
+            partial_except_keys=(
+                None if partial_except_keys is None else tuple(partial_except_keys)
+            ),
+            reset_keys=frozenset(reset_keys),
+            except_once_prop_keys=frozenset(except_once_prop_keys),
+            merge_intent=request.headers.get(
+                "X-Inertia-Infinite-Scroll-Merge-Intent", "append"
+            ),
+            is_prefetch=request.headers.get("Purpose") == "prefetch",
+            reset_keys_in_order=reset_keys,
+            except_once_prop_keys_in_order=except_once_prop_keys,
+        )
+
+    @classmethod
+    def for_request(cls, request: HttpRequest) -> "InertiaProtocol":
+        protocol = getattr(request, INERTIA_REQUEST_PROTOCOL, None)
+        if protocol is None:
+            protocol = cls.from_request(request)
+            setattr(request, INERTIA_REQUEST_PROTOCOL, protocol)
+        return protocol
+
+    def is_partial_render(self, component: str) -> bool:
+        return self.partial_component == component
+
 
 class InertiaRequest(HttpRequest):
     def __init__(self, request: HttpRequest):
@@ -59,31 +159,33 @@ class InertiaRequest(HttpRequest):
             else []
         )
 
+    @cached_property
+    def protocol(self) -> InertiaProtocol:
+        return InertiaProtocol.for_request(self)
+
     def is_a_partial_render(self, component: str) -> bool:
-        return self.headers.get("X-Inertia-Partial-Component", "") == component
+        return self.protocol.is_partial_render(component)
 
     def header_list(self, name: str) -> list[str] | None:
-        if name not in self.headers:
-            return None
-        return [
-            value.strip() for value in self.headers[name].split(",") if value.strip()
-        ]
+        return _header_list(self, name)
 
     def partial_keys(self) -> list[str] | None:
-        return self.header_list("X-Inertia-Partial-Data")
+        keys = self.protocol.partial_keys
+        return None if keys is None else list(keys)
 
     def partial_except_keys(self) -> list[str] | None:
-        return self.header_list("X-Inertia-Partial-Except")
+        keys = self.protocol.partial_except_keys
+        return None if keys is None else list(keys)
 
     def reset_keys(self) -> list[str]:
-        return self.header_list("X-Inertia-Reset") or []
+        return list(self.protocol.reset_keys_in_order)
 
     def except_once_prop_keys(self) -> list[str]:
         """
         Return the list of once prop keys that the client reports as already
         loaded, sourced from the X-Inertia-Except-Once-Props request header.
         """
-        return self.header_list("X-Inertia-Except-Once-Props") or []
+        return list(self.protocol.except_once_prop_keys_in_order)
 
     def infinite_scroll_merge_intent(self) -> str:
         """
@@ -94,10 +196,17 @@ class InertiaRequest(HttpRequest):
         appended to or prepended before existing client-side data.  Returns
         "append" when the header is absent.
         """
-        return self.headers.get("X-Inertia-Infinite-Scroll-Merge-Intent", "append")
+        return self.protocol.merge_intent
 
     def is_inertia(self) -> bool:
-        return "X-Inertia" in self.headers
+        return self.protocol.is_inertia
+
+    def asset_version(self) -> Any:
+        """
+        The version the page reports: the client's own when the middleware
+        let an older build through, so it is still refreshed later.
+        """
+        return getattr(self, INERTIA_REQUEST_VERSION, None) or get_version()
 
     def should_encrypt_history(self) -> bool:
         should_encrypt = getattr(
@@ -110,6 +219,183 @@ class InertiaRequest(HttpRequest):
         return should_encrypt
 
 
+class PropPathTrie:
+    """Dotted prop paths compiled into a trie for partial reload filtering.
+
+    The resolver walks this alongside the prop tree, so deciding whether a
+    prop was requested is a single child lookup per key instead of a scan
+    over every requested path.
+    """
+
+    __slots__ = ("children", "terminal")
+
+    def __init__(self) -> None:
+        self.children: dict[str, PropPathTrie] = {}
+        self.terminal = False
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str] | None) -> "PropPathTrie | None":
+        if paths is None:
+            return None
+        root = cls()
+        for path in paths:
+            node = root
+            for segment in path.split("."):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = cls()
+                node = child
+            node.terminal = True
+        return root
+
+
+# Stand-in for the subtree under a key that no requested path reaches.
+_UNMATCHED = PropPathTrie()
+
+# The position of a mapping in the only/except tries; None means unfiltered.
+PartialScope = tuple[PropPathTrie | None, PropPathTrie | None]
+UNFILTERED: PartialScope = (None, None)
+
+
+class PendingProp:
+    """
+    A prop call that has been set aside while the rest of its level resolves.
+
+    Props marked parallel and batch loads are set aside before they are
+    called, and props whose call returned an awaitable are set aside with
+    that awaitable. The resolver then hands every pending prop on a level to
+    its driver in one batch, and the driver stores the outcome as ``result``.
+    """
+
+    __slots__ = ("prop", "path", "awaitable", "batch", "result")
+
+    def __init__(
+        self,
+        prop: Callable[[], Any],
+        path: str,
+        awaitable: Awaitable[Any] | None = None,
+        batch: BatchLoad | None = None,
+    ) -> None:
+        self.prop = prop
+        self.path = path
+        self.awaitable = awaitable
+        self.batch = batch
+        self.result: Callable[[], Any] = _unsettled
+
+
+def _unsettled() -> Any:
+    raise RuntimeError("Pending prop was not settled by the resolver")
+
+
+# Resolution steps yield batches of pending props to their driver and
+# return the resolved value once the driver has settled them.
+Resolution = Generator[list[PendingProp], None, Any]
+
+# The request whose props are being resolved, for props such as cached()
+# that vary on it. Worker threads and tasks inherit it with the context.
+resolving_request: contextvars.ContextVar[HttpRequest | None] = contextvars.ContextVar(
+    "inertia_resolving_request", default=None
+)
+
+_props_executor: ThreadPoolExecutor | None = None
+_props_executor_lock = threading.Lock()
+
+
+def _call_in_worker(prop: Callable[[], Any]) -> Any:
+    # Worker threads get their own database connections. Treat each call
+    # like a request so those connections honour CONN_MAX_AGE and are not
+    # left open after an error.
+    close_old_connections()
+    try:
+        return prop()
+    finally:
+        close_old_connections()
+
+
+def _submit_to_props_executor(prop: Callable[[], Any]) -> "Future[Any]":
+    global _props_executor
+    if _props_executor is None:
+        with _props_executor_lock:
+            if _props_executor is None:
+                _props_executor = ThreadPoolExecutor(
+                    max_workers=settings.INERTIA_PARALLEL_PROPS_MAX_WORKERS,
+                    thread_name_prefix="inertia-props",
+                )
+    context = contextvars.copy_context()
+    return _props_executor.submit(context.run, _call_in_worker, prop)
+
+
+def _completed_future(call: Callable[[], Any]) -> "Future[Any]":
+    future: Future[Any] = Future()
+    try:
+        future.set_result(call())
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+async def _gather_outcomes(awaitables: list[Awaitable[Any]]) -> list[Any]:
+    return await asyncio.gather(*awaitables, return_exceptions=True)
+
+
+def _group_batch_loads(
+    pending: list[PendingProp],
+) -> dict[BatchLoader, list[PendingProp]]:
+    groups: dict[BatchLoader, list[PendingProp]] = {}
+    for item in pending:
+        if item.batch is not None:
+            groups.setdefault(item.batch.loader, []).append(item)
+    return groups
+
+
+def _batch_keys(items: list[PendingProp]) -> list[Any]:
+    return list(dict.fromkeys(cast(BatchLoad, item.batch).key for item in items))
+
+
+def _fetch_batch(loader: BatchLoader, items: list[PendingProp]) -> Any:
+    try:
+        values = loader.fetch(_batch_keys(items))
+        if inspect.isawaitable(values):
+            values = async_to_sync(_await)(values)
+    except Exception as exc:
+        return exc
+    return values
+
+
+async def _afetch_batch(loader: BatchLoader, items: list[PendingProp]) -> Any:
+    keys = _batch_keys(items)
+    if iscoroutinefunction(loader.fetch):
+        return await loader.fetch(keys)
+    values = await asyncio.wrap_future(
+        _submit_to_props_executor(partial(loader.fetch, keys))
+    )
+    return await values if inspect.isawaitable(values) else values
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
+def _fan_out_batch(loader: BatchLoader, items: list[PendingProp], values: Any) -> None:
+    for item in items:
+        if isinstance(values, BaseException):
+            item.result = _outcome(values)
+        else:
+            item.result = partial(
+                loader.value_for, values, cast(BatchLoad, item.batch).key
+            )
+
+
+def _outcome(value: Any) -> Callable[[], Any]:
+    if isinstance(value, BaseException):
+
+        def reraise() -> Any:
+            raise value
+
+        return reraise
+    return lambda: value
+
+
 class PropsResolver:
     """Resolve props once and collect Inertia v3 metadata by dotted path."""
 
@@ -117,6 +403,9 @@ class PropsResolver:
         self.request = request
         self.component = component
         self.props = props
+        self.protocol = request.protocol
+        self.is_partial = self.protocol.is_partial_render(component)
+        self.parallel_by_default = bool(settings.INERTIA_PARALLEL_PROPS)
         self.metadata: dict[str, Any] = {
             "deferredProps": {},
             "mergeProps": [],
@@ -129,35 +418,148 @@ class PropsResolver:
         }
 
     def resolve(self) -> tuple[dict[str, Any], dict[str, Any]]:
-        resolved = self._resolve_mapping(self.props)
-        return resolved, {key: value for key, value in self.metadata.items() if value}
+        resolution = self._resolve_mapping(self.props, "", self._partial_scope())
+        token = resolving_request.set(self.request)
+        try:
+            while True:
+                self._run_pending(next(resolution))
+        except StopIteration as done:
+            resolved = done.value
+        finally:
+            resolving_request.reset(token)
+        return resolved, self._collected_metadata()
+
+    async def aresolve(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Resolve props without blocking the event loop on pending props.
+
+        Awaitable props on the same level are awaited together, and props
+        marked parallel run on the props thread pool in the meantime.
+        """
+        resolution = self._resolve_mapping(self.props, "", self._partial_scope())
+        token = resolving_request.set(self.request)
+        try:
+            while True:
+                await self._arun_pending(next(resolution))
+        except StopIteration as done:
+            resolved = done.value
+        finally:
+            resolving_request.reset(token)
+        return resolved, self._collected_metadata()
+
+    def _collected_metadata(self) -> dict[str, Any]:
+        return {key: value for key, value in self.metadata.items() if value}
+
+    def _run_pending(self, pending: list[PendingProp]) -> None:
+        """
+        Settle a batch of pending props from synchronous code.
+
+        Parallel props are fanned out to the shared thread pool, except for
+        one that runs on the current thread while the others are in flight.
+        Batch loads make one fetch per loader, and awaitables are awaited
+        together on a temporary event loop.
+        """
+        parallel = [
+            item for item in pending if item.awaitable is None and item.batch is None
+        ]
+        awaiting = [item for item in pending if item.awaitable is not None]
+        futures = [_submit_to_props_executor(item.prop) for item in parallel[1:]]
+        if parallel:
+            futures.insert(0, _completed_future(parallel[0].prop))
+        for loader, items in _group_batch_loads(pending).items():
+            _fan_out_batch(loader, items, _fetch_batch(loader, items))
+        if awaiting:
+            outcomes = async_to_sync(_gather_outcomes)(
+                [cast(Awaitable[Any], item.awaitable) for item in awaiting]
+            )
+            for item, outcome in zip(awaiting, outcomes, strict=True):
+                item.result = _outcome(outcome)
+        for item, future in zip(parallel, futures, strict=True):
+            item.result = future.result
+
+    async def _arun_pending(self, pending: list[PendingProp]) -> None:
+        single = [item for item in pending if item.batch is None]
+        batches = _group_batch_loads(pending)
+        outcomes = await _gather_outcomes(
+            [
+                item.awaitable
+                if item.awaitable is not None
+                else asyncio.wrap_future(_submit_to_props_executor(item.prop))
+                for item in single
+            ]
+            + [_afetch_batch(loader, items) for loader, items in batches.items()]
+        )
+        for item, outcome in zip(single, outcomes[: len(single)], strict=True):
+            item.result = _outcome(outcome)
+        for (loader, items), values in zip(
+            batches.items(), outcomes[len(single) :], strict=True
+        ):
+            _fan_out_batch(loader, items, values)
+
+    def _partial_scope(self) -> PartialScope:
+        if not self.is_partial:
+            return UNFILTERED
+        return (
+            PropPathTrie.from_paths(self.protocol.partial_keys),
+            PropPathTrie.from_paths(self.protocol.partial_except_keys),
+        )
 
     def _resolve_mapping(
-        self, props: dict[str, Any], prefix: str = "", parent_resolved: bool = False
-    ) -> dict[str, Any]:
+        self, props: dict[str, Any], prefix: str, scope: PartialScope
+    ) -> Resolution:
         resolved: dict[str, Any] = {}
+        pending: dict[str, PendingProp] = {}
         for key, prop in props.items():
+            excluded, child_scope = self._descend(scope, key)
+            if excluded and not isinstance(prop, AlwaysProp):
+                continue
             path = f"{prefix}.{key}" if prefix else key
-            value = self._resolve_prop(prop, path, parent_resolved)
+            value = yield from self._resolve_prop(
+                prop, path, UNFILTERED if excluded else child_scope
+            )
+            if isinstance(value, PendingProp):
+                pending[key] = value
             if value is not SKIP_PROP:
                 resolved[key] = value
+        if pending:
+            settled = yield from self._settle(list(pending.values()))
+            for key, value in zip(pending, settled, strict=True):
+                if value is SKIP_PROP:
+                    del resolved[key]
+                else:
+                    resolved[key] = value
         return resolved
 
-    def _resolve_prop(self, prop: Any, path: str, parent_resolved: bool = False) -> Any:
-        if (
-            not parent_resolved
-            and not isinstance(prop, AlwaysProp)
-            and self._excluded_by_partial_request(path)
-        ):
-            return SKIP_PROP
+    @staticmethod
+    def _descend(scope: PartialScope, key: str) -> tuple[bool, PartialScope]:
+        """
+        Step one key into the partial reload tries.
 
+        Returns whether the prop at that key is excluded by the request and
+        the scope its own children should be filtered with.
+        """
+        only, skip = scope
+        excluded = False
+        if only is not None:
+            only = only.children.get(key, _UNMATCHED)
+            if only is _UNMATCHED:
+                excluded = True
+            elif only.terminal:
+                only = None
+        if skip is not None:
+            skip = skip.children.get(key)
+            if skip is not None and skip.terminal:
+                excluded = True
+        return excluded, (only, skip)
+
+    def _resolve_prop(self, prop: Any, path: str, scope: PartialScope) -> Resolution:
         if isinstance(prop, dict):
             if not prop:
                 return {}
-            resolved = self._resolve_mapping(prop, path, parent_resolved)
+            resolved = yield from self._resolve_mapping(prop, path, scope)
             return resolved if resolved else SKIP_PROP
         if isinstance(prop, list):
-            return self._resolve_list(prop, path, parent_resolved)
+            return (yield from self._resolve_list(prop, path, scope))
 
         is_cached_once_prop = self._should_skip_loaded_once_prop(prop, path)
         self._collect_metadata(
@@ -167,80 +569,136 @@ class PropsResolver:
         )
         if is_cached_once_prop:
             return SKIP_PROP
-        if not self._is_partial() and (
+        if not self.is_partial and (
             isinstance(prop, IgnoreOnFirstLoadProp)
             or isinstance(prop, ScrollProp)
             and prop.defer
         ):
             return SKIP_PROP
 
+        if not callable(prop):
+            return prop
+        batch = self._batch_load(prop)
+        if batch is not None or self._resolves_in_parallel(prop):
+            return PendingProp(prop, path, batch=batch)
+        return (yield from self._call_prop(prop, path, prop))
+
+    def _call_prop(self, prop: Any, path: str, call: Callable[[], Any]) -> Resolution:
         try:
-            value = prop() if callable(prop) else prop
+            value = call()
         except Exception:
             if isinstance(prop, DeferredProp) and prop.rescue:
                 self.metadata["rescuedProps"].append(path)
                 return SKIP_PROP
             raise
 
+        if inspect.isawaitable(value):
+            return PendingProp(prop, path, value)
         if isinstance(value, CallableProp):
-            return self._resolve_prop(value, path, parent_resolved=True)
+            value = yield from self._resolve_prop(value, path, UNFILTERED)
+            if isinstance(value, PendingProp):
+                [value] = yield from self._settle([value])
+            return value
         if isinstance(value, dict):
             if not value:
                 return {}
-            resolved = self._resolve_mapping(value, path, parent_resolved=True)
+            resolved = yield from self._resolve_mapping(value, path, UNFILTERED)
             return resolved if resolved else SKIP_PROP
         if isinstance(value, list):
-            return self._resolve_list(value, path, parent_resolved=True)
+            return (yield from self._resolve_list(value, path, UNFILTERED))
         return value
 
+    @staticmethod
+    def _batch_load(prop: Any) -> BatchLoad | None:
+        if isinstance(prop, BatchLoad):
+            return prop
+        # Only wrappers that just call their prop can hand it to the batch;
+        # others, such as cached props, must be called themselves.
+        if (
+            isinstance(prop, CallableProp)
+            and isinstance(prop.prop, BatchLoad)
+            and type(prop).__call__ is CallableProp.__call__
+        ):
+            return prop.prop
+        return None
+
+    def _resolves_in_parallel(self, prop: Any) -> bool:
+        if isinstance(prop, CallableProp) and prop.parallel is not None:
+            return prop.parallel
+        return self.parallel_by_default
+
+    def _settle(self, pending: list[PendingProp]) -> Resolution:
+        """
+        Hand a batch of pending props to the driver and resolve the results.
+
+        Results are returned in the order given, so the resolved props keep
+        their declared key order.
+        """
+        yield pending
+        settled = []
+        for item in pending:
+            value = yield from self._call_prop(item.prop, item.path, item.result)
+            if isinstance(value, PendingProp):
+                [value] = yield from self._settle([value])
+            settled.append(value)
+        return settled
+
     def _resolve_list(
-        self, values: list[Any], path: str, parent_resolved: bool
-    ) -> list[Any]:
+        self, values: list[Any], path: str, scope: PartialScope
+    ) -> Resolution:
         resolved: list[Any] = []
+        pending: dict[int, PendingProp] = {}
         for index, value in enumerate(values):
-            item = self._resolve_list_item(value, path, index, parent_resolved)
+            item = yield from self._resolve_list_item(value, path, index, scope)
+            if isinstance(item, PendingProp):
+                pending[len(resolved)] = item
             if item is not SKIP_PROP:
                 resolved.append(item)
+        if pending:
+            settled = yield from self._settle(list(pending.values()))
+            for position, item in zip(pending, settled, strict=True):
+                resolved[position] = item
+            resolved = [item for item in resolved if item is not SKIP_PROP]
         return resolved
 
     def _resolve_list_item(
-        self, value: Any, path: str, index: int, parent_resolved: bool
-    ) -> Any:
-        item_path = f"{path}.{index}"
+        self, value: Any, path: str, index: int, scope: PartialScope
+    ) -> Resolution:
         if isinstance(value, dict):
-            return self._resolve_mapping(value, item_path, parent_resolved)
+            excluded, child_scope = self._descend(scope, str(index))
+            return (
+                yield from self._resolve_mapping(
+                    value,
+                    f"{path}.{index}",
+                    (_UNMATCHED, None) if excluded else child_scope,
+                )
+            )
         if isinstance(value, CallableProp):
-            return self._resolve_prop(value, item_path, parent_resolved)
-        return value() if callable(value) else value
-
-    def _is_partial(self) -> bool:
-        return self.request.is_a_partial_render(self.component)
-
-    def _excluded_by_partial_request(self, path: str) -> bool:
-        if not self._is_partial():
-            return False
-        only = self.request.partial_keys()
-        if only is not None and not any(self._paths_overlap(path, key) for key in only):
-            return True
-        except_keys = self.request.partial_except_keys() or []
-        return any(path == key or path.startswith(f"{key}.") for key in except_keys)
-
-    @staticmethod
-    def _paths_overlap(left: str, right: str) -> bool:
-        return (
-            left == right
-            or left.startswith(f"{right}.")
-            or right.startswith(f"{left}.")
-        )
+            excluded, child_scope = self._descend(scope, str(index))
+            if excluded and not isinstance(value, AlwaysProp):
+                return SKIP_PROP
+            return (
+                yield from self._resolve_prop(
+                    value, f"{path}.{index}", UNFILTERED if excluded else child_scope
+                )
+            )
+        if not callable(value):
+            return value
+        if isinstance(value, BatchLoad):
+            return PendingProp(value, f"{path}.{index}", batch=value)
+        item = value()
+        if inspect.isawaitable(item):
+            return PendingProp(value, f"{path}.{index}", item)
+        return item
 
     def _should_skip_loaded_once_prop(self, prop: Any, path: str) -> bool:
         return (
-            self.request.is_inertia()
-            and not self._is_partial()
+            self.protocol.is_inertia
+            and not self.is_partial
             and isinstance(prop, CallableProp)
             and prop.should_resolve_once()
             and not prop.should_be_fresh()
-            and prop.once_key(path) in self.request.except_once_prop_keys()
+            and prop.once_key(path) in self.protocol.except_once_prop_keys
         )
 
     def _collect_metadata(
@@ -255,7 +713,7 @@ class PropsResolver:
                 or isinstance(prop, ScrollProp)
                 and prop.defer
             )
-            and not self._is_partial()
+            and not self.is_partial
         ):
             self.metadata["deferredProps"].setdefault(prop.group, []).append(path)
         if isinstance(prop, MergeableProp) and prop.should_merge():
@@ -267,7 +725,7 @@ class PropsResolver:
             }
 
     def _collect_merge_metadata(self, prop: MergeableProp, path: str) -> None:
-        reset = path in self.request.reset_keys()
+        reset = path in self.protocol.reset_keys
         if isinstance(prop, ScrollProp):
             self.metadata["scrollProps"][path] = {**prop.metadata, "reset": reset}
         if reset:
@@ -279,10 +737,7 @@ class PropsResolver:
             append_paths = prop.merge_paths(path)
             if prepend_paths:
                 self.metadata["prependProps"].extend(prepend_paths)
-            elif (
-                self._is_partial()
-                and self.request.infinite_scroll_merge_intent() == "prepend"
-            ):
+            elif self.is_partial and self.protocol.merge_intent == "prepend":
                 self.metadata["prependProps"].extend(append_paths)
             else:
                 self.metadata["mergeProps"].extend(append_paths)
@@ -291,33 +746,140 @@ class PropsResolver:
         )
 
 
+_layout_shells: "OrderedDict[tuple[Any, ...], list[str] | None]" = OrderedDict()
+_layout_shells_lock = threading.Lock()
+
+
+def clear_layout_shells(**kwargs: Any) -> None:
+    with _layout_shells_lock:
+        _layout_shells.clear()
+
+
+@receiver(setting_changed)
+def _clear_layout_shells_on_setting_change(setting: str, **kwargs: Any) -> None:
+    if setting == "TEMPLATES" or setting.startswith("INERTIA_"):
+        clear_layout_shells()
+
+
+# Template edits during development are picked up without a restart.
+file_changed.connect(clear_layout_shells)
+
+
+def _split_layout(html: str, slots: Iterable[str]) -> list[str] | None:
+    # Alternating text and slot names: [text, slot, text, slot, ..., text].
+    segments = LAYOUT_SLOT.split(html)
+    if sorted(segments[1::2]) != sorted(slots):
+        return None
+    return segments
+
+
+def _fill_layout(segments: list[str], values: dict[str, str]) -> str:
+    return "".join(
+        values[segment] if index % 2 else segment
+        for index, segment in enumerate(segments)
+    )
+
+
 class BaseInertiaResponseMixin:
     request: InertiaRequest
     component: str
     props: dict[str, Any]
     template_data: dict[str, Any]
+    json_encoder: type[JSONEncoder] | None
+    layout_shell: bool | None = None
+    ssr_deadline: float | None = None
+    ssr: bool | None = None
+    # Why a first load fell back to client-side rendering, if it did:
+    # "error", "circuit_open", "busy" or "deadline".
+    ssr_fallback: str | None = None
+    # Whether a first load was served from a prerendered SSR page.
+    prerendered: bool = False
+
+    def _setup(
+        self,
+        request: HttpRequest,
+        component: str,
+        props: dict[str, Any] | None,
+        template_data: dict[str, Any] | None,
+        ssr_deadline: float | None = None,
+        ssr: bool | None = None,
+    ) -> None:
+        self.request = InertiaRequest(request)
+        self.component = component
+        self.props = props or {}
+        self.template_data = template_data or {}
+        if ssr_deadline is not None:
+            self.ssr_deadline = ssr_deadline
+        if ssr is not None:
+            self.ssr = ssr
+
+    def response_headers(self, headers: dict[str, Any] | None) -> dict[str, Any]:
+        _headers = headers or {}
+        if self.request.is_inertia():
+            _headers = {
+                **_headers,
+                "X-Inertia": "true",
+                "Content-Type": "application/json",
+            }
+        return _headers
+
+    def build_content(self) -> str:
+        context = None if self.request.is_inertia() else self.prerendered_context()
+        if context is not None:
+            # Props are not resolved at all; the page is already rendered.
+            return self.render_first_load(context, INERTIA_SSR_TEMPLATE)
+        data = self.encode_page(self.page_data())
+        return data if self.request.is_inertia() else self.build_first_load(data)
+
+    def encode_page(self, page: dict[str, Any]) -> str:
+        return encode_script_json(page, self.json_encoder)
 
     def page_data(self) -> dict[str, Any]:
-        clear_history = self.request.session.pop(INERTIA_SESSION_CLEAR_HISTORY, False)
-        if not isinstance(clear_history, bool):
-            raise TypeError(
-                f"Expected bool for clear_history, got {type(clear_history).__name__}"
-            )
+        clear_history = self._session_flag(
+            "clear_history",
+            self.request.session.pop(INERTIA_SESSION_CLEAR_HISTORY, False),
+        )
+        should_preserve_fragment = self._session_flag(
+            "preserve_fragment",
+            self.request.session.pop(INERTIA_SESSION_PRESERVE_FRAGMENT, False),
+        )
+        resolved_props, metadata = self.resolve_props()
+        return self.build_page(
+            resolved_props, metadata, clear_history, should_preserve_fragment
+        )
 
-        should_preserve_fragment = self.request.session.pop(
-            INERTIA_SESSION_PRESERVE_FRAGMENT, False
+    async def apage_data(self) -> dict[str, Any]:
+        clear_history = self._session_flag(
+            "clear_history",
+            await self.request.session.apop(INERTIA_SESSION_CLEAR_HISTORY, False),
+        )
+        should_preserve_fragment = self._session_flag(
+            "preserve_fragment",
+            await self.request.session.apop(INERTIA_SESSION_PRESERVE_FRAGMENT, False),
+        )
+        resolved_props, metadata = await self.aresolve_props()
+        return self.build_page(
+            resolved_props, metadata, clear_history, should_preserve_fragment
         )
-        if not isinstance(should_preserve_fragment, bool):
-            raise TypeError(
-                f"Expected bool for preserve_fragment, got {type(should_preserve_fragment).__name__}"
-            )
 
-        resolved_props, metadata = self.resolve_props()
+    @staticmethod
+    def _session_flag(name: str, value: Any) -> bool:
+        if not isinstance(value, bool):
+            raise TypeError(f"Expected bool for {name}, got {type(value).__name__}")
+        return value
+
+    def build_page(
+        self,
+        resolved_props: dict[str, Any],
+        metadata: dict[str, Any],
+        clear_history: bool,
+        should_preserve_fragment: bool,
+    ) -> dict[str, Any]:
         _page: dict[str, Any] = {
             "component": self.component,
             "props": resolved_props,
             "url": self.request.get_full_path(),
-            "version": settings.INERTIA_VERSION,
+            "version": self.request.asset_version(),
             "encryptHistory": self.request.should_encrypt_history(),
             "clearHistory": clear_history,
         }
@@ -334,12 +896,18 @@ class BaseInertiaResponseMixin:
 
         return _page
 
-    def resolve_props(self) -> tuple[dict[str, Any], dict[str, Any]]:
+    def props_resolver(self) -> PropsResolver:
         return PropsResolver(
             self.request,
             self.component,
             {**self.request.inertia, **self.props},
-        ).resolve()
+        )
+
+    def resolve_props(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        return self.props_resolver().resolve()
+
+    async def aresolve_props(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        return await self.props_resolver().aresolve()
 
     def build_flash(self) -> dict[str, Any]:
         messages = [
@@ -350,15 +918,19 @@ class BaseInertiaResponseMixin:
 
     def build_first_load(self, data: Any) -> str:
         context, template = self.build_first_load_context_and_template(data)
+        return self.render_first_load(context, template)
 
-        try:
-            layout = settings.INERTIA_LAYOUT
-            if not layout:
-                raise AttributeError("INERTIA_LAYOUT is set, but has a falsy value")
-        except AttributeError as ae:
-            raise ImproperlyConfigured(
-                "INERTIA_LAYOUT must be set in your Django settings"
-            ) from ae
+    async def abuild_first_load(self, data: Any) -> str:
+        context, template = await self.abuild_first_load_context_and_template(data)
+        return await sync_to_async(self.render_first_load)(context, template)
+
+    def render_first_load(self, context: dict[str, Any], template: str) -> str:
+        layout = self.layout()
+
+        if self.uses_layout_shell():
+            html = self.render_from_layout_shell(template, layout, context)
+            if html is not None:
+                return html
 
         return render_to_string(
             template,
@@ -370,28 +942,193 @@ class BaseInertiaResponseMixin:
             using=None,
         )
 
+    def layout(self) -> str:
+        return cast(str, settings.INERTIA_LAYOUT)
+
+    def uses_layout_shell(self) -> bool:
+        if self.layout_shell is None:
+            return bool(settings.INERTIA_LAYOUT_SHELL)
+        return self.layout_shell
+
+    def layout_slots(self, template: str) -> tuple[str, ...]:
+        return ("head", "body") if template == INERTIA_SSR_TEMPLATE else ("page",)
+
+    def render_layout_segments(
+        self,
+        template: str,
+        layout: str,
+        context: dict[str, Any],
+        request: HttpRequest | None,
+    ) -> list[str] | None:
+        """
+        Render ``template`` with a marker in place of each slot and split
+        the result on those markers. Returns ``None`` when the template does
+        not output every slot exactly once.
+        """
+        slots = self.layout_slots(template)
+        markers = {
+            slot: [f"{LAYOUT_SLOT_MARKER}[{slot}]"]
+            if isinstance(context.get(slot), list)
+            else f"{LAYOUT_SLOT_MARKER}[{slot}]"
+            for slot in slots
+        }
+        html = render_to_string(
+            template,
+            {"inertia_layout": layout, **context, **markers},
+            request,
+            using=None,
+        )
+        return _split_layout(html, slots)
+
+    def render_from_layout_shell(
+        self, template: str, layout: str, context: dict[str, Any]
+    ) -> str | None:
+        """
+        Splice the slot values into a cached rendering of the layout.
+
+        Shells are rendered once per template, layout, version, template
+        data, active language and current time zone, without the request,
+        so the layout must not depend on anything else about it.
+        Returns ``None`` when the first load can't be served from a shell.
+        """
+        slots = self.layout_slots(template)
+        values: dict[str, str] = {}
+        for slot in slots:
+            value = context.get(slot)
+            if isinstance(value, list):
+                value = "".join(value)
+            if not isinstance(value, str):
+                return None
+            values[slot] = value
+
+        # Only plain JSON data can stand in for the values it renders.
+        static = {key: value for key, value in context.items() if key not in slots}
+        try:
+            static_key = json_encode(static, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        key = (
+            template,
+            layout,
+            get_version(),
+            static_key,
+            translation.get_language(),
+            timezone.get_current_timezone_name(),
+        )
+
+        with _layout_shells_lock:
+            cached = key in _layout_shells
+            if cached:
+                _layout_shells.move_to_end(key)
+                segments = _layout_shells[key]
+        if not cached:
+            segments = self.render_layout_segments(template, layout, context, None)
+            with _layout_shells_lock:
+                _layout_shells[key] = segments
+                if len(_layout_shells) > LAYOUT_SHELL_CACHE_SIZE:
+                    _layout_shells.popitem(last=False)
+
+        if segments is None:
+            return None
+        return _fill_layout(segments, values)
+
     def build_first_load_context_and_template(
         self, data: Any
     ) -> tuple[dict[str, Any], str]:
-        if settings.INERTIA_SSR_ENABLED:
+        if self.should_ssr():
             try:
-                response = requests.post(
-                    f"{settings.INERTIA_SSR_URL}/render",
-                    data=data,
-                    headers={"Content-Type": "application/json"},
-                )
-                response.raise_for_status()
-                return {
-                    **response.json(),
-                    **self.template_data,
-                }, INERTIA_SSR_TEMPLATE
-            except Exception:
-                logger.exception("SSR render request failed")
+                rendered = render_page(data, deadline=self.get_ssr_deadline())
+                return self.ssr_context(rendered), INERTIA_SSR_TEMPLATE
+            except Exception as exc:
+                self.ssr_failed(exc)
+
+        return self.client_context(data), INERTIA_TEMPLATE
+
+    async def abuild_first_load_context_and_template(
+        self, data: Any
+    ) -> tuple[dict[str, Any], str]:
+        if self.should_ssr():
+            try:
+                rendered = await arender_page(data, deadline=self.get_ssr_deadline())
+                return self.ssr_context(rendered), INERTIA_SSR_TEMPLATE
+            except Exception as exc:
+                self.ssr_failed(exc)
+
+        return self.client_context(data), INERTIA_TEMPLATE
+
+    def should_ssr(self) -> bool:
+        """
+        Whether this first load is rendered by the SSR server: the view's
+        ``ssr`` option if given, otherwise ``INERTIA_SSR_POLICY``.
+        """
+        if not settings.INERTIA_SSR_ENABLED:
+            return False
+        if self.ssr is not None:
+            return self.ssr
+
+        policy = settings.INERTIA_SSR_POLICY
+        if policy is None:
+            return True
+        return bool(policy(self.request, self.component))
+
+    def get_ssr_deadline(self) -> float | None:
+        if self.ssr_deadline is None:
+            return cast(float | None, settings.INERTIA_SSR_DEADLINE)
+        return self.ssr_deadline
+
+    def ssr_failed(self, exc: Exception) -> None:
+        # Called from an ``except`` block, so the traceback is still current.
+        if isinstance(exc, CircuitOpen):
+            # The SSR server is known to be failing; render client-side.
+            self.ssr_fallback = "circuit_open"
+        elif isinstance(exc, SSRBusy):
+            self.ssr_fallback = "busy"
+        elif isinstance(exc, SSRDeadlineExceeded):
+            self.ssr_fallback = "deadline"
+            logger.warning("%s; rendering client-side", exc)
+        else:
+            self.ssr_fallback = "error"
+            logger.exception("SSR render request failed")
 
+    def prerendered_context(self) -> dict[str, Any] | None:
+        """
+        The SSR context for a first load stored by ``inertia_prerender``, if
+        ``INERTIA_PRERENDER`` is on and one exists for this URL and version.
+        """
+        if not settings.INERTIA_PRERENDER or self.request.method not in (
+            "GET",
+            "HEAD",
+        ):
+            return None
+        if self.has_pending_session_state():
+            # Only page_data() consumes these, so the page must be rendered.
+            return None
+        rendered = load_prerendered(self.request.get_full_path())
+        if rendered is None:
+            return None
+        self.prerendered = True
+        return self.ssr_context(rendered)
+
+    def has_pending_session_state(self) -> bool:
+        """Whether session flags or flash messages are waiting for this page."""
+        session = self.request.session
+        return (
+            INERTIA_SESSION_CLEAR_HISTORY in session
+            or INERTIA_SESSION_PRESERVE_FRAGMENT in session
+            or len(get_messages(self.request)) > 0
+        )
+
+    def ssr_context(self, rendered: dict[str, Any]) -> dict[str, Any]:
+        return {
+            **rendered,
+            **self.template_data,
+        }
+
+    def client_context(self, data: Any) -> dict[str, Any]:
         return {
             "page": data,
             **(self.template_data),
-        }, INERTIA_TEMPLATE
+        }
 
 
 class InertiaResponse(BaseInertiaResponseMixin, HttpResponse):
@@ -405,34 +1142,59 @@ class InertiaResponse(BaseInertiaResponseMixin, HttpResponse):
         template_data: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
         *args: Any,
+        ssr_deadline: float | None = None,
+        ssr: bool | None = None,
         **kwargs: Any,
     ) -> None:
-        self.request = InertiaRequest(request)
-        self.component = component
-        self.props = props or {}
-        self.template_data = template_data or {}
-        _headers = headers or {}
+        self._setup(request, component, props, template_data, ssr_deadline, ssr)
+        self._init_response(self.build_content(), headers, args, kwargs)
 
-        data = json_encode(
-            self.page_data(),
-            cls=self.json_encoder or settings.INERTIA_JSON_ENCODER,
-        )
-        # Page data is embedded in a JSON script tag for Inertia v3 clients.
-        # Escape the few characters that could terminate or alter that script.
-        data = (
-            data.replace("&", "\\u0026").replace("<", "\\u003c").replace(">", "\\u003e")
-        )
+    @classmethod
+    async def acreate(
+        cls,
+        request: HttpRequest,
+        component: str,
+        props: dict[str, Any] | None = None,
+        template_data: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        *,
+        ssr_deadline: float | None = None,
+        ssr: bool | None = None,
+        **kwargs: Any,
+    ) -> "InertiaResponse":
+        """
+        Build a response from an async view without leaving the event loop.
 
-        if self.request.is_inertia():
-            _headers = {
-                **_headers,
-                "X-Inertia": "true",
-                "Content-Type": "application/json",
-            }
-            content = data
+        Props are resolved with ``PropsResolver.aresolve`` and SSR renders go
+        through the transport's async side. Only the template render of a
+        first load, which may run context processors, is handed to a thread.
+        """
+        response = cls.__new__(cls)
+        response._setup(request, component, props, template_data, ssr_deadline, ssr)
+        context = None
+        if not response.request.is_inertia():
+            context = await sync_to_async(response.prerendered_context)()
+        if context is not None:
+            content = await sync_to_async(response.render_first_load)(
+                context, INERTIA_SSR_TEMPLATE
+            )
         else:
-            content = self.build_first_load(data)
+            data = response.encode_page(await response.apage_data())
+            if response.request.is_inertia():
+                content = data
+            else:
+                content = await response.abuild_first_load(data)
+        response._init_response(content, headers, (), kwargs)
+        return response
 
+    def _init_response(
+        self,
+        content: str,
+        headers: dict[str, Any] | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        _headers = self.response_headers(headers)
         if args:
             super().__init__(
                 *args,
@@ -448,13 +1210,155 @@ class InertiaResponse(BaseInertiaResponseMixin, HttpResponse):
         patch_vary_headers(self, ("X-Inertia",))
 
 
+class InertiaTemplateResponse(BaseInertiaResponseMixin, SimpleTemplateResponse):
+    """
+    An Inertia response that resolves props and renders its content only
+    when ``render()`` is called, like Django's ``TemplateResponse``.
+
+    Django renders it after the view returns and after any
+    ``process_template_response`` middleware, which may still change its
+    ``component``, ``props`` or ``template_data``, or return a different
+    response instead, in which case the page is never built. Post-render
+    callbacks, such as the cache middleware's, run once it is rendered.
+    """
+
+    json_encoder = None
+    rendering_attrs = [
+        *SimpleTemplateResponse.rendering_attrs,
+        "request",
+        "props",
+        "template_data",
+    ]
+
+    def __init__(
+        self,
+        request: HttpRequest,
+        component: str,
+        props: dict[str, Any] | None = None,
+        template_data: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        *,
+        ssr_deadline: float | None = None,
+        ssr: bool | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._setup(request, component, props, template_data, ssr_deadline, ssr)
+        super().__init__(
+            INERTIA_TEMPLATE, headers=self.response_headers(headers), **kwargs
+        )
+        patch_vary_headers(self, ("X-Inertia",))
+
+    @property
+    def rendered_content(self) -> str:
+        return self.build_content()
+
+
+class InertiaStreamingResponse(BaseInertiaResponseMixin, StreamingHttpResponse):
+    """
+    An Inertia response that encodes the page while it is being sent.
+
+    Props are resolved up front, but the page JSON is produced and escaped
+    in chunks of roughly ``chunk_size`` characters, so very large props never
+    exist as one string in memory. First loads stream the layout around the
+    page data; with SSR enabled the page must be sent to the SSR server
+    whole, so those are rendered in one piece.
+    """
+
+    json_encoder = None
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        request: HttpRequest,
+        component: str,
+        props: dict[str, Any] | None = None,
+        template_data: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        *,
+        ssr_deadline: float | None = None,
+        ssr: bool | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._setup(request, component, props, template_data, ssr_deadline, ssr)
+        chunks = self.encode_page_chunks(self.page_data())
+        if self.request.is_inertia():
+            content = chunks
+        else:
+            content = self.stream_first_load(chunks)
+        super().__init__(
+            streaming_content=content,
+            headers=self.response_headers(headers),
+            **kwargs,
+        )
+        patch_vary_headers(self, ("X-Inertia",))
+
+    def encode_page_chunks(self, page: dict[str, Any]) -> Iterator[str]:
+        encoder = (self.json_encoder or settings.INERTIA_JSON_ENCODER)()
+        buffer: list[str] = []
+        size = 0
+        for piece in encoder.iterencode(page):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= self.chunk_size:
+                yield escape_script_json("".join(buffer))
+                buffer, size = [], 0
+        if buffer:
+            yield escape_script_json("".join(buffer))
+
+    def stream_first_load(self, chunks: Iterator[str]) -> Iterator[str]:
+        if self.should_ssr():
+            return iter([self.build_first_load("".join(chunks))])
+
+        # Render the layout once around a marker and stream the page data in
+        # its place.
+        context, template = self.build_first_load_context_and_template("")
+        segments = self.render_layout_segments(
+            template, self.layout(), context, self.request
+        )
+        if segments is None:
+            raise ImproperlyConfigured(
+                f"{INERTIA_TEMPLATE} must output the page data exactly once"
+            )
+        head, _, tail = segments
+        return itertools.chain([head], chunks, [tail])
+
+
 def render(
     request: HttpRequest,
     component: str,
     props: dict[str, Any] | None = None,
     template_data: dict[str, Any] | None = None,
+    *,
+    ssr_deadline: float | None = None,
+    ssr: bool | None = None,
+) -> InertiaResponse:
+    return InertiaResponse(
+        request,
+        component,
+        props or {},
+        template_data or {},
+        ssr_deadline=ssr_deadline,
+        ssr=ssr,
+    )
+
+
+async def arender(
+    request: HttpRequest,
+    component: str,
+    props: dict[str, Any] | None = None,
+    template_data: dict[str, Any] | None = None,
+    *,
+    ssr_deadline: float | None = None,
+    ssr: bool | None = None,
 ) -> InertiaResponse:
-    return InertiaResponse(request, component, props or {}, template_data or {})
+    return await InertiaResponse.acreate(
+        request,
+        component,
+        props or {},
+        template_data or {},
+        ssr_deadline=ssr_deadline,
+        ssr=ssr,
+    )
 
 
 def location(location: str) -> HttpResponse:
@@ -487,26 +1391,60 @@ def preserve_fragment(request: HttpRequest) -> None:
     request.session[INERTIA_SESSION_PRESERVE_FRAGMENT] = True
 
 
+ViewResult = HttpResponse | InertiaResponse | dict[str, Any]
+
+
 def inertia(
     component: str,
+    *,
+    ssr_deadline: float | None = None,
+    ssr: bool | None = None,
+    lazy: bool = False,
 ) -> Callable[
-    [Callable[..., HttpResponse | InertiaResponse | dict[str, Any]]],
-    Callable[..., HttpResponse],
+    [Callable[..., ViewResult | Awaitable[ViewResult]]],
+    Callable[..., HttpResponse | Awaitable[HttpResponse]],
 ]:
     def decorator(
-        func: Callable[..., HttpResponse | InertiaResponse | dict[str, Any]],
-    ) -> Callable[..., HttpResponse]:
+        func: Callable[..., ViewResult | Awaitable[ViewResult]],
+    ) -> Callable[..., HttpResponse | Awaitable[HttpResponse]]:
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def aprocess_inertia_response(
+                request: HttpRequest, *args: Any, **kwargs: Any
+            ) -> HttpResponse:
+                props = await cast(
+                    Awaitable[ViewResult], func(request, *args, **kwargs)
+                )
+
+                # if a response is returned, return it
+                if isinstance(props, HttpResponse):
+                    return props
+
+                if lazy:
+                    return InertiaTemplateResponse(
+                        request, component, props, ssr_deadline=ssr_deadline, ssr=ssr
+                    )
+                return await InertiaResponse.acreate(
+                    request, component, props, ssr_deadline=ssr_deadline, ssr=ssr
+                )
+
+            return aprocess_inertia_response
+
         @wraps(func)
         def process_inertia_response(
             request: HttpRequest, *args: Any, **kwargs: Any
         ) -> HttpResponse:
-            props = func(request, *args, **kwargs)
+            props = cast(ViewResult, func(request, *args, **kwargs))
 
             # if a response is returned, return it
             if isinstance(props, HttpResponse):
                 return props
 
-            return InertiaResponse(request, component, props)
+            response_class = InertiaTemplateResponse if lazy else InertiaResponse
+            return response_class(
+                request, component, props, ssr_deadline=ssr_deadline, ssr=ssr
+            )
 
         return process_inertia_response
 
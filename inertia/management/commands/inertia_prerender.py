@@ -0,0 +1,82 @@
+import json
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.test import Client
+from django.urls import NoReverseMatch, reverse
+
+from inertia.prerender import is_process_local, store_prerendered
+from inertia.ssr import get_ssr_client
+from inertia.version import get_version
+
+
+class Command(BaseCommand):
+    help = (
+        "Render Inertia pages through the SSR server ahead of time so first "
+        "loads of those URLs can be served without rendering them."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "targets",
+            nargs="+",
+            metavar="url_or_view_name",
+            help="URL paths (starting with /) or names of views without arguments.",
+        )
+        parser.add_argument(
+            "--host",
+            default="localhost",
+            help="Host the pages are requested from (default: localhost).",
+        )
+
+    def handle(self, *args: Any, targets: list[str], host: str, **options: Any) -> None:
+        if is_process_local():
+            raise CommandError(
+                "Prerendered pages would be stored in a cache local to this "
+                "command and never served. Set INERTIA_PRERENDER_DIR, or point "
+                "INERTIA_PRERENDER_CACHE_ALIAS at a shared cache."
+            )
+        client = Client(HTTP_HOST=host)
+        failed = 0
+        for target in targets:
+            try:
+                url = self.prerender(client, target)
+            except CommandError as exc:
+                failed += 1
+                self.stderr.write(f"{target}: {exc}")
+            else:
+                self.stdout.write(f"Prerendered {url}")
+
+        if failed:
+            raise CommandError(f"{failed} of {len(targets)} pages failed to prerender")
+
+    def prerender(self, client: Client, target: str) -> str:
+        if target.startswith("/"):
+            url = target
+        else:
+            try:
+                url = reverse(target)
+            except NoReverseMatch as exc:
+                raise CommandError(f"no URL for view {target!r}") from exc
+
+        response = client.get(
+            url,
+            headers={
+                "X-Inertia": "true",
+                "X-Inertia-Version": str(get_version()),
+            },
+        )
+        if response.status_code != 200 or response.get("X-Inertia") != "true":
+            raise CommandError(
+                f"{url} did not return an Inertia page (status {response.status_code})"
+            )
+
+        data = response.content.decode()
+        page = json.loads(data)
+        try:
+            rendered = get_ssr_client().render(data)
+        except Exception as exc:
+            raise CommandError(f"SSR render failed: {exc}") from exc
+
+        store_prerendered(page["url"], page["version"], rendered)
+        return str(page["url"])
@@ -1,12 +1,13 @@
-from typing import Callable
+from typing import Awaitable, Callable
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.contrib import messages
 from django.http import HttpRequest, HttpResponse
 from django.middleware.csrf import get_token
 from django.utils.cache import patch_vary_headers
 
-from .http import location
-from .settings import settings
+from .http import INERTIA_REQUEST_VERSION, InertiaProtocol, location
+from .version import get_version, tolerates_version
 
 
 class InertiaMiddleware:
@@ -17,7 +18,8 @@ class InertiaMiddleware:
       requests that do not go through Django's normal template rendering path.
     - Convert PUT/PATCH/DELETE redirects to 303 so the subsequent request
       is always treated as a GET by the browser.
-    - Detect asset version mismatches and force a full-page refresh.
+    - Detect asset version mismatches and force a full-page refresh, unless
+      the client's build is still tolerated (see ``tolerates_version``).
 
     Non-Inertia requests (e.g. those made via the useHttp hook in Inertia v3)
     pass through this middleware without modification beyond CSRF cookie
@@ -25,11 +27,52 @@ class InertiaMiddleware:
     appropriate response (e.g. 422 JSON) for useHttp validation errors.
     """
 
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponse]
+        | Callable[[HttpRequest], Awaitable[HttpResponse]],
+    ) -> None:
         self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        response = self.get_response(request)
+        if self.is_async:
+            return self.__acall__(request)  # type: ignore[return-value]
+        # Parse the protocol headers up front so the view's InertiaResponse
+        # reuses the same state instead of parsing them again.
+        InertiaProtocol.for_request(request)
+        response = self.process_request(request)
+        if response is None:
+            response = self.get_response(request)  # type: ignore[assignment]
+        return self.process_response(request, response)  # type: ignore[arg-type]
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        InertiaProtocol.for_request(request)
+        response = self.process_request(request)
+        if response is None:
+            response = await self.get_response(request)  # type: ignore[misc]
+        return self.process_response(request, response)
+
+    def process_request(self, request: HttpRequest) -> HttpResponse | None:
+        # Refresh stale visits before the view runs, so none of its work
+        # (props, queries, encoding) is done only to be thrown away.
+        self.check_version(request)
+        if (
+            self.is_inertia_request(request)
+            and request.method == "GET"
+            and self.is_stale(request)
+        ):
+            return self.force_refresh(request)
+        return None
+
+    def process_response(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
         patch_vary_headers(response, ("X-Inertia",))
 
         # Inertia requests bypass Django's normal template rendering and
@@ -41,9 +84,6 @@ class InertiaMiddleware:
         if not self.is_inertia_request(request):
             return response
 
-        if request.method == "GET" and self.is_stale(request):
-            return self.force_refresh(request)
-
         if self.redirect_has_fragment(response) and not self.is_prefetch(request):
             return self.inertia_redirect(response)
 
@@ -62,7 +102,7 @@ class InertiaMiddleware:
         ]
 
     def is_inertia_request(self, request: HttpRequest) -> bool:
-        return "X-Inertia" in request.headers
+        return InertiaProtocol.for_request(request).is_inertia
 
     def is_redirect_request(self, response: HttpResponse) -> bool:
         return response.status_code in [301, 302]
@@ -73,7 +113,7 @@ class InertiaMiddleware:
         )
 
     def is_prefetch(self, request: HttpRequest) -> bool:
-        return request.headers.get("Purpose") == "prefetch"
+        return InertiaProtocol.for_request(request).is_prefetch
 
     def inertia_redirect(self, response: HttpResponse) -> HttpResponse:
         return HttpResponse(
@@ -82,10 +122,26 @@ class InertiaMiddleware:
             headers={"X-Inertia-Redirect": response.headers["Location"]},
         )
 
+    def check_version(self, request: HttpRequest) -> None:
+        """
+        Decide before the view runs whether a GET from an older build is
+        still served, so its page keeps reporting the client's version.
+        """
+        version = InertiaProtocol.for_request(request).version
+        if (
+            request.method == "GET"
+            and version is not None
+            and version != get_version()
+            and tolerates_version(version)
+        ):
+            setattr(request, INERTIA_REQUEST_VERSION, version)
+
     def is_stale(self, request: HttpRequest) -> bool:
+        version = InertiaProtocol.for_request(request).version
         return (
-            request.headers.get("X-Inertia-Version", settings.INERTIA_VERSION)
-            != settings.INERTIA_VERSION
+            version is not None
+            and version != get_version()
+            and version != getattr(request, INERTIA_REQUEST_VERSION, None)
         )
 
     def force_refresh(self, request: HttpRequest) -> HttpResponse:
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Any, cast
+
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+from .settings import settings
+from .version import get_version
+
+__all__ = ["is_process_local", "load_prerendered", "store_prerendered"]
+
+logger = logging.getLogger(__name__)
+
+PRERENDER_CACHE_PREFIX = "inertia:prerender"
+
+
+def _digest(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def _directory() -> str:
+    return os.fspath(cast(str, settings.INERTIA_PRERENDER_DIR))
+
+
+def _path(url: str) -> str:
+    return os.path.join(_directory(), f"{_digest(url)}.json")
+
+
+def _cache_key(url: str) -> str:
+    return f"{PRERENDER_CACHE_PREFIX}:{_digest(url)}"
+
+
+def _cache() -> BaseCache:
+    return caches[
+        settings.INERTIA_PRERENDER_CACHE_ALIAS or settings.INERTIA_CACHE_ALIAS
+    ]
+
+
+def is_process_local() -> bool:
+    """
+    Whether stored pages would only be visible to this process, because they
+    go to a cache such as ``LocMemCache`` rather than a shared one.
+    """
+    if settings.INERTIA_PRERENDER_DIR:
+        return False
+    return isinstance(_cache(), (LocMemCache, DummyCache))
+
+
+def store_prerendered(url: str, version: str, rendered: dict[str, Any]) -> None:
+    """
+    Store an SSR render of the page at ``url`` built for asset ``version``.
+
+    Entries go to ``INERTIA_PRERENDER_DIR`` when it is set and to the cache
+    otherwise, where they never expire; prerendering again replaces them.
+    """
+    entry = {"url": url, "version": version, "rendered": rendered}
+    if settings.INERTIA_PRERENDER_DIR:
+        os.makedirs(_directory(), exist_ok=True)
+        path = _path(url)
+        # Write then rename so readers never see a partial file.
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(f"{path}.tmp", path)
+    else:
+        _cache().set(_cache_key(url), entry, None)
+
+
+def load_prerendered(url: str) -> dict[str, Any] | None:
+    """
+    Return the stored SSR render of the page at ``url``, or ``None`` when
+    there is none for the current ``INERTIA_VERSION``.
+    """
+    if settings.INERTIA_PRERENDER_DIR:
+        try:
+            with open(_path(url), encoding="utf-8") as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Render the page as usual rather than failing every first load.
+            logger.exception("Could not read the prerendered page for %s", url)
+            return None
+    else:
+        entry = _cache().get(_cache_key(url))
+
+    if (
+        not isinstance(entry, dict)
+        or entry.get("url") != url
+        or entry.get("version") != get_version()
+        or not isinstance(entry.get("rendered"), dict)
+    ):
+        return None
+    return cast(dict[str, Any], entry["rendered"])
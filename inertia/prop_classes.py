@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import inspect
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta, timezone
 from typing import Any, cast
 
@@ -24,12 +26,15 @@ class CallableProp:
         key: str | None = None,
         expires_at: datetime | timedelta | int | float | None = None,
         fresh: bool = False,
+        parallel: bool | None = None,
     ) -> None:
         self.prop = prop
         self._once = once
         self._once_key = key
         self._expires_at = expires_at
         self._fresh = fresh
+        # None defers to the INERTIA_PARALLEL_PROPS setting.
+        self.parallel = parallel
 
     def __call__(self) -> Any:
         return self.prop() if callable(self.prop) else self.prop
@@ -95,8 +100,16 @@ class OnceProp(CallableProp):
         key: str | None = None,
         expires_at: datetime | timedelta | int | float | None = None,
         fresh: bool = False,
+        parallel: bool | None = None,
     ) -> None:
-        super().__init__(prop, once=True, key=key, expires_at=expires_at, fresh=fresh)
+        super().__init__(
+            prop,
+            once=True,
+            key=key,
+            expires_at=expires_at,
+            fresh=fresh,
+            parallel=parallel,
+        )
 
 
 class DeferredProp(CallableProp, MergeableProp, IgnoreOnFirstLoadProp):
@@ -113,6 +126,7 @@ class DeferredProp(CallableProp, MergeableProp, IgnoreOnFirstLoadProp):
         expires_at: datetime | timedelta | int | float | None = None,
         fresh: bool = False,
         rescue: bool = False,
+        parallel: bool | None = None,
     ) -> None:
         super().__init__(
             prop,
@@ -120,6 +134,7 @@ class DeferredProp(CallableProp, MergeableProp, IgnoreOnFirstLoadProp):
             key=key,
             expires_at=expires_at,
             fresh=fresh,
+            parallel=parallel,
         )
         self.group = group
         self.merge = merge or deep_merge
@@ -150,6 +165,7 @@ class MergeProp(CallableProp, MergeableProp):
         key: str | None = None,
         expires_at: datetime | timedelta | int | float | None = None,
         fresh: bool = False,
+        parallel: bool | None = None,
     ) -> None:
         super().__init__(
             prop,
@@ -157,6 +173,7 @@ class MergeProp(CallableProp, MergeableProp):
             key=key,
             expires_at=expires_at,
             fresh=fresh,
+            parallel=parallel,
         )
         if deep_merge:
             if append is not _UNSET or prepend is not _UNSET:
@@ -216,6 +233,47 @@ class ScrollProp(MergeProp):
         return [path]
 
 
+class BatchLoader:
+    """
+    Loads the keys of several props with a single fetch.
+
+    ``fetch`` receives the distinct keys requested by the props resolved
+    together (for example every prop of a deferred group) and returns a
+    mapping of key to value. It may also be a coroutine function.
+    """
+
+    def __init__(self, fetch: Callable[[list[Any]], Any]) -> None:
+        self.fetch = fetch
+
+    def load(self, key: Any) -> BatchLoad:
+        return BatchLoad(self, key)
+
+    def value_for(self, values: Mapping[Any, Any], key: Any) -> Any:
+        try:
+            return values[key]
+        except KeyError:
+            raise KeyError(f"Batch fetch returned no value for {key!r}") from None
+
+
+class BatchLoad:
+    """A single key of a BatchLoader, usable anywhere a prop callable is."""
+
+    def __init__(self, loader: BatchLoader, key: Any) -> None:
+        self.loader = loader
+        self.key = key
+
+    def __call__(self) -> Any:
+        # Outside of the props resolver there is nothing to batch with, so
+        # fetch this key on its own.
+        values = self.loader.fetch([self.key])
+        if inspect.isawaitable(values):
+            return self._pick(values)
+        return self.loader.value_for(values, self.key)
+
+    async def _pick(self, values: Any) -> Any:
+        return self.loader.value_for(await values, self.key)
+
+
 def _as_list(value: str | list[str] | bool | None) -> list[str]:
     if value is None or isinstance(value, bool):
         return []
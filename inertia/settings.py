@@ -1,24 +1,185 @@
+from json import JSONEncoder
 from typing import Any
 
 from django.conf import settings as django_settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
 
 from .utils import InertiaJsonEncoder
 
 __all__ = ["settings"]
 
 
-class InertiaSettings:
+class InertiaDefaults:
     INERTIA_VERSION = "1.0"
+    INERTIA_VERSION_MANIFEST = None
+    INERTIA_VERSION_CHECK_INTERVAL = 1.0
+    INERTIA_COMPATIBLE_VERSIONS: tuple[str, ...] = ()
+    INERTIA_VERSION_GRACE_PERIOD = 0
     INERTIA_JSON_ENCODER = InertiaJsonEncoder
+    INERTIA_JSON_BACKEND = "stdlib"
     INERTIA_SSR_URL = "http://localhost:13714"
     INERTIA_SSR_ENABLED = False
+    INERTIA_SSR_POLICY = None
+    INERTIA_SSR_TRANSPORT = None
+    INERTIA_SSR_POOL_SIZE = 10
+    INERTIA_SSR_CONNECT_TIMEOUT = 1.0
+    INERTIA_SSR_READ_TIMEOUT = 10.0
+    INERTIA_SSR_RETRIES = 1
+    INERTIA_SSR_DEADLINE = None
+    INERTIA_SSR_MAX_CONCURRENCY = None
+    INERTIA_SSR_MAX_GLOBAL_CONCURRENCY = None
+    INERTIA_SSR_QUEUE_TIMEOUT = 0.05
+    INERTIA_SSR_CIRCUIT_BREAKER = True
+    INERTIA_SSR_FAILURE_THRESHOLD = 5
+    INERTIA_SSR_FAILURE_RATE = 0.5
+    INERTIA_SSR_FAILURE_WINDOW = 20
+    INERTIA_SSR_COOLDOWN = 30.0
+    INERTIA_SSR_CACHE = False
+    INERTIA_SSR_CACHE_ALIAS = None
+    INERTIA_SSR_CACHE_TIMEOUT = 300
+    INERTIA_SSR_CACHE_MAX_SIZE = 512 * 1024
+    INERTIA_PRERENDER = False
+    INERTIA_PRERENDER_DIR = None
+    INERTIA_PRERENDER_CACHE_ALIAS = None
     INERTIA_ENCRYPT_HISTORY = False
+    INERTIA_LAYOUT_SHELL = False
+    INERTIA_PARALLEL_PROPS = False
+    INERTIA_PARALLEL_PROPS_MAX_WORKERS = 8
+    INERTIA_CACHE_ALIAS = "default"
+
+
+# Settings that must be positive integers, or None where the default is None.
+POSITIVE_INTEGERS = (
+    "INERTIA_SSR_POOL_SIZE",
+    "INERTIA_SSR_MAX_CONCURRENCY",
+    "INERTIA_SSR_MAX_GLOBAL_CONCURRENCY",
+    "INERTIA_SSR_FAILURE_THRESHOLD",
+    "INERTIA_SSR_FAILURE_WINDOW",
+    "INERTIA_SSR_CACHE_MAX_SIZE",
+    "INERTIA_PARALLEL_PROPS_MAX_WORKERS",
+)
+# Settings that must be numbers of zero or more, or None where the default is None.
+NON_NEGATIVE_NUMBERS = (
+    "INERTIA_VERSION_CHECK_INTERVAL",
+    "INERTIA_VERSION_GRACE_PERIOD",
+    "INERTIA_SSR_CONNECT_TIMEOUT",
+    "INERTIA_SSR_READ_TIMEOUT",
+    "INERTIA_SSR_RETRIES",
+    "INERTIA_SSR_DEADLINE",
+    "INERTIA_SSR_QUEUE_TIMEOUT",
+    "INERTIA_SSR_FAILURE_RATE",
+    "INERTIA_SSR_COOLDOWN",
+    "INERTIA_SSR_CACHE_TIMEOUT",
+)
 
-    def __getattribute__(self, name: str) -> Any:
+
+class InertiaSettings:
+    """
+    A snapshot of the ``INERTIA_*`` settings with defaults and validation
+    applied, built on first use and rebuilt after any of them change.
+
+    Resolved values are kept in the instance dict, so reading a setting is
+    a plain attribute lookup rather than a trip through Django's settings.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached before the snapshot is built, or for names that
+        # aren't Inertia settings.
+        if not name.startswith("INERTIA_") or self.__dict__:
+            raise AttributeError(name)
+        self.load()
         try:
-            return getattr(django_settings, name)
-        except AttributeError:
-            return super().__getattribute__(name)
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            "Inertia settings are read-only; change them in Django's settings."
+        )
+
+    def load(self) -> None:
+        """Resolve and validate the settings, raising ImproperlyConfigured."""
+        values = {
+            name: getattr(InertiaDefaults, name)
+            for name in dir(InertiaDefaults)
+            if name.startswith("INERTIA_")
+        }
+        values.update(
+            (name, getattr(django_settings, name))
+            for name in dir(django_settings)
+            if name.startswith("INERTIA_")
+        )
+
+        if not values.get("INERTIA_LAYOUT"):
+            raise ImproperlyConfigured(
+                "INERTIA_LAYOUT must be set in your Django settings."
+            )
+        values["INERTIA_JSON_ENCODER"] = _import(values, "INERTIA_JSON_ENCODER")
+        encoder = values["INERTIA_JSON_ENCODER"]
+        if not (isinstance(encoder, type) and issubclass(encoder, JSONEncoder)):
+            raise ImproperlyConfigured(
+                "INERTIA_JSON_ENCODER must be a JSONEncoder subclass."
+            )
+        values["INERTIA_SSR_POLICY"] = _import(values, "INERTIA_SSR_POLICY")
+        if values["INERTIA_SSR_POLICY"] is not None and not callable(
+            values["INERTIA_SSR_POLICY"]
+        ):
+            raise ImproperlyConfigured("INERTIA_SSR_POLICY must be callable.")
+        values["INERTIA_SSR_TRANSPORT"] = _import(values, "INERTIA_SSR_TRANSPORT")
+        if isinstance(values["INERTIA_COMPATIBLE_VERSIONS"], str):
+            raise ImproperlyConfigured(
+                "INERTIA_COMPATIBLE_VERSIONS must be a list of versions."
+            )
+        values["INERTIA_COMPATIBLE_VERSIONS"] = frozenset(
+            values["INERTIA_COMPATIBLE_VERSIONS"]
+        )
+
+        for name in POSITIVE_INTEGERS:
+            value = values[name]
+            if value is None and getattr(InertiaDefaults, name) is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ImproperlyConfigured(
+                    f"{name} must be a positive integer, got {value!r}."
+                )
+        for name in NON_NEGATIVE_NUMBERS:
+            value = values[name]
+            if value is None and getattr(InertiaDefaults, name) is None:
+                continue
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or value < 0
+            ):
+                raise ImproperlyConfigured(
+                    f"{name} must be a number of zero or more, got {value!r}."
+                )
+
+        self.__dict__.update(values)
+
+    def reset(self) -> None:
+        """Drop the snapshot; it is rebuilt the next time a setting is read."""
+        self.__dict__.clear()
+
+
+def _import(values: dict[str, Any], name: str) -> Any:
+    value = values[name]
+    if not isinstance(value, str):
+        return value
+    try:
+        return import_string(value)
+    except ImportError as exc:
+        raise ImproperlyConfigured(f"{name} {value!r} could not be imported.") from exc
 
 
 settings = InertiaSettings()
+
+
+@receiver(setting_changed)
+def _reset_settings_on_setting_change(setting: str, **kwargs: Any) -> None:
+    if setting.startswith("INERTIA_"):
+        settings.reset()
@@ -0,0 +1,938 @@
+import asyncio
+import contextvars
+import hashlib
+import http.client
+import itertools
+import logging
+import os
+import random
+import secrets
+import socket
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from json import dumps as json_encode
+from json import loads as json_decode
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, NoReturn, cast
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+from django.core.cache import BaseCache, caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import Signal, receiver
+
+from .settings import settings
+from .version import get_version
+
+try:
+    # Must be early-imported so tests can patch it with
+    # a mock module
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None  # type: ignore[assignment]
+
+__all__ = [
+    "Bulkhead",
+    "CircuitBreaker",
+    "CircuitOpen",
+    "HttpTransport",
+    "SSRBusy",
+    "SSRClient",
+    "SSRDeadlineExceeded",
+    "SSREndpoint",
+    "SSRError",
+    "SSRTransport",
+    "UnixSocketTransport",
+    "arender_page",
+    "circuit_state_changed",
+    "get_ssr_client",
+    "render_page",
+    "reset_ssr_client",
+]
+
+logger = logging.getLogger(__name__)
+
+SSR_CACHE_PREFIX = "inertia:ssr"
+
+# Sent with ``breaker``, ``old_state`` and ``new_state`` whenever a circuit
+# breaker changes state, for metrics.
+circuit_state_changed = Signal()
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling an SSR server that is known to be unhealthy."""
+
+
+class SSRBusy(Exception):
+    """Raised when too many SSR renders are already in flight."""
+
+
+class SSRDeadlineExceeded(Exception):
+    """Raised when an SSR render doesn't finish within its deadline."""
+
+
+class CircuitBreaker:
+    """
+    Stops calling the SSR server once it is failing.
+
+    The circuit opens after ``failure_threshold`` consecutive failures, or
+    when at least ``failure_rate`` of the last ``window`` calls failed. Calls
+    are rejected with ``CircuitOpen`` for ``cooldown`` seconds, then a single
+    probe call is let through (half-open) and its outcome closes or re-opens
+    the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        cooldown: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.failure_rate = failure_rate
+        self.cooldown = cooldown
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.rejected = 0
+        self.opened_at = 0.0
+        self._state = self.CLOSED
+        self._probing = False
+        # Reentrant so state-change receivers can read the breaker.
+        self._lock = threading.RLock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self.consecutive_failures,
+                "recent_failures": self.outcomes.count(False),
+                "recent_calls": len(self.outcomes),
+                "rejected": self.rejected,
+            }
+
+    def before_call(self) -> None:
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+        raise CircuitOpen(f"SSR circuit {self.name} is {state}")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._probing = False
+            self.consecutive_failures = 0
+            self.outcomes.append(True)
+            if self._state != self.CLOSED:
+                self.outcomes.clear()
+                self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._probing = False
+            self.consecutive_failures += 1
+            self.outcomes.append(False)
+            if self._state != self.CLOSED or self._should_open():
+                self.opened_at = time.monotonic()
+                self._transition(self.OPEN)
+
+    def release_probe(self) -> None:
+        """Let another call probe a half-open circuit, recording no outcome."""
+        with self._lock:
+            self._probing = False
+
+    def _should_open(self) -> bool:
+        if self.consecutive_failures >= self.failure_threshold:
+            return True
+        return len(self.outcomes) == self.outcomes.maxlen and self.outcomes.count(
+            False
+        ) >= self.failure_rate * len(self.outcomes)
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self.opened_at >= self.cooldown
+        ):
+            self._transition(self.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        old_state, self._state = self._state, state
+        if old_state == state:
+            return
+        if state == self.OPEN:
+            logger.warning(
+                "SSR circuit %s opened after %d consecutive failures; "
+                "rendering client-side for %ss",
+                self.name,
+                self.consecutive_failures,
+                self.cooldown,
+            )
+        else:
+            logger.info("SSR circuit %s is %s", self.name, state)
+        circuit_state_changed.send(
+            sender=type(self), breaker=self, old_state=old_state, new_state=state
+        )
+
+
+class SSRError(Exception):
+    """Raised when the SSR server answers with an error status."""
+
+
+Connection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class SSRTransport(ABC):
+    """
+    Carries encoded page data to an SSR server and returns its JSON result.
+
+    ``post`` is used by sync views and ``apost`` by async views. Transports
+    are created once per process with the SSR url and connection settings.
+    """
+
+    # Responses worth another attempt, on top of connection errors.
+    retry_statuses: tuple[int, ...] = ()
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        pool_size: int = 10,
+        timeout: tuple[float, float] = (1.0, 10.0),
+        retries: int = 0,
+    ) -> None:
+        self.url = url
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        # Kept-alive connections for apost, per event loop since streams
+        # can't move between loops.
+        self._idle: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, list[Connection]
+        ] = weakref.WeakKeyDictionary()
+        self._idle_pid: int | None = None
+
+    @abstractmethod
+    def post(self, data: str) -> dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def apost(self, data: str) -> dict[str, Any]:
+        pass
+
+    def close(self) -> None:
+        self._close_idle()
+
+    async def _apost_over(
+        self,
+        connect: Callable[[], Awaitable[Connection]],
+        host: str,
+        path: str,
+        data: str,
+    ) -> dict[str, Any]:
+        body = data.encode()
+        request = (
+            f"POST {path} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        for attempt in range(self.retries + 1):
+            writer = None
+            try:
+                reader, writer = await self._aconnection(connect)
+                writer.write(request)
+                await writer.drain()
+                status, content, reusable = await asyncio.wait_for(
+                    _aread_response(reader), self.timeout[1]
+                )
+            except BaseException as exc:
+                if writer is not None:
+                    writer.close()
+                # Connection errors also cover a kept-alive connection the
+                # server has since closed; timeouts are not retried.
+                if (
+                    not isinstance(exc, (ConnectionError, asyncio.IncompleteReadError))
+                    or attempt == self.retries
+                ):
+                    raise
+                continue
+            if reusable:
+                self._release(reader, writer)
+            else:
+                writer.close()
+            if status in self.retry_statuses and attempt < self.retries:
+                continue
+            if status >= 400:
+                raise SSRError(f"SSR server responded with {status}")
+            return cast(dict[str, Any], json_decode(content))
+        raise AssertionError("unreachable")
+
+    def _idle_connections(self) -> list[Connection]:
+        pid = os.getpid()
+        if self._idle_pid != pid:
+            # Sockets inherited across a fork are left to the parent.
+            self._idle = weakref.WeakKeyDictionary()
+            self._idle_pid = pid
+        return self._idle.setdefault(asyncio.get_running_loop(), [])
+
+    async def _aconnection(
+        self, connect: Callable[[], Awaitable[Connection]]
+    ) -> Connection:
+        idle = self._idle_connections()
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        return await asyncio.wait_for(connect(), self.timeout[0])
+
+    def _release(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        idle = self._idle_connections()
+        if len(idle) < self.pool_size:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    def _close_idle(self) -> None:
+        idle, self._idle = self._idle, weakref.WeakKeyDictionary()
+        if self._idle_pid != os.getpid():
+            return
+        for loop, connections in idle.items():
+            if loop.is_closed():
+                continue
+            for _, writer in connections:
+                # close() may be called from outside the connection's loop.
+                loop.call_soon_threadsafe(writer.close)
+
+
+async def _aread_response(reader: asyncio.StreamReader) -> tuple[int, bytes, bool]:
+    """Read a response, and whether its connection can be used again."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("SSR server closed the connection")
+    version, status, *_ = status_line.split()
+    headers: dict[str, str] = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    reusable = version == b"HTTP/1.1" and headers.get("connection") != "close"
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        # Trailers, up to the blank line that ends the response.
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        return int(status), b"".join(chunks), reusable
+    if "content-length" in headers:
+        content = await reader.readexactly(int(headers["content-length"]))
+        return int(status), content, reusable
+    return int(status), await reader.read(), False
+
+
+class HttpTransport(SSRTransport):
+    """
+    HTTP over TCP through a pooled, keep-alive ``requests`` session.
+
+    The session is created on first use and again in any process forked
+    after that, so gunicorn workers never share sockets with their parent.
+    Threads within a process share the session's connection pool.
+    """
+
+    retry_statuses = (502, 503, 504)
+
+    def __init__(self, url: str, **kwargs: Any) -> None:
+        super().__init__(url, **kwargs)
+        self._session: requests.Session | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        pid = os.getpid()
+        if self._session is None or self._pid != pid:
+            with self._lock:
+                if self._session is None or self._pid != pid:
+                    # Sockets inherited across a fork are left to the parent.
+                    self._session = self.create_session()
+                    self._pid = pid
+        return self._session
+
+    def create_session(self) -> "requests.Session":
+        if requests is None:
+            raise ImproperlyConfigured(
+                "SSR requires requests. Install inertia-django[ssr]."
+            )
+
+        # Rendering has no side effects, so POSTs are safe to retry. Read
+        # timeouts are not retried; they would only double the wait.
+        retry = Retry(
+            total=self.retries,
+            read=0,
+            backoff_factor=0.05,
+            status_forcelist=self.retry_statuses,
+            allowed_methods=None,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=self.pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def post(self, data: str) -> dict[str, Any]:
+        response = self.session.post(
+            f"{self.url}/render",
+            data=data,
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return cast(dict[str, Any], response.json())
+
+    async def apost(self, data: str) -> dict[str, Any]:
+        url = urlsplit(self.url)
+        secure = url.scheme == "https"
+        port = url.port or (443 if secure else 80)
+        return await self._apost_over(
+            partial(asyncio.open_connection, url.hostname, port, ssl=secure or None),
+            url.netloc,
+            f"{url.path}/render",
+            data,
+        )
+
+    def close(self) -> None:
+        super().close()
+        with self._lock:
+            if self._session is not None and self._pid == os.getpid():
+                self._session.close()
+            self._session = None
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: tuple[float, float]) -> None:
+        super().__init__("localhost")
+        self.socket_path = socket_path
+        self.connect_timeout, self.read_timeout = timeout
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.connect_timeout)
+            sock.connect(self.socket_path)
+            sock.settimeout(self.read_timeout)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class UnixSocketTransport(SSRTransport):
+    """
+    HTTP over a Unix domain socket, for an SSR server on the same host.
+
+    ``INERTIA_SSR_URL`` takes the form ``unix:///run/inertia-ssr.sock``. Each
+    thread keeps its own keep-alive connection.
+    """
+
+    def __init__(self, url: str, **kwargs: Any) -> None:
+        super().__init__(url, **kwargs)
+        self.socket_path = urlsplit(url).path
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> UnixHTTPConnection:
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            self._local.connection = UnixHTTPConnection(self.socket_path, self.timeout)
+            self._local.pid = pid
+        return cast(UnixHTTPConnection, self._local.connection)
+
+    def post(self, data: str) -> dict[str, Any]:
+        for attempt in range(self.retries + 1):
+            connection = self.connection
+            try:
+                connection.request(
+                    "POST",
+                    "/render",
+                    body=data.encode(),
+                    headers={"Content-Type": "application/json"},
+                )
+                response = connection.getresponse()
+                content = response.read()
+            except Exception as exc:
+                connection.close()
+                # Connection errors also cover a kept-alive connection the
+                # server has since closed; timeouts are not retried.
+                if not isinstance(exc, ConnectionError) or attempt == self.retries:
+                    raise
+                continue
+            if response.status >= 400:
+                raise SSRError(f"SSR server responded with {response.status}")
+            return cast(dict[str, Any], json_decode(content))
+        raise AssertionError("unreachable")
+
+    async def apost(self, data: str) -> dict[str, Any]:
+        return await self._apost_over(
+            partial(asyncio.open_unix_connection, self.socket_path),
+            "localhost",
+            "/render",
+            data,
+        )
+
+    def close(self) -> None:
+        super().close()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+
+
+# Transports by INERTIA_SSR_URL scheme; anything else is sent over HTTP.
+SSR_TRANSPORTS: dict[str, type[SSRTransport]] = {
+    "unix": UnixSocketTransport,
+}
+
+
+def get_transport_class(url: str) -> type[SSRTransport]:
+    if settings.INERTIA_SSR_TRANSPORT:
+        return cast(type[SSRTransport], settings.INERTIA_SSR_TRANSPORT)
+    return SSR_TRANSPORTS.get(urlsplit(url).scheme, HttpTransport)
+
+
+class Bulkhead:
+    """
+    Caps the number of SSR renders in flight.
+
+    ``max_concurrency`` limits renders in this process. ``max_global``
+    limits them across processes with one lease per slot in Django's cache.
+    Each lease expires ``global_timeout`` seconds after it was taken, so a
+    slot held by a worker that died mid-render is released then, whatever
+    the traffic. A render that can't get a slot within ``queue_timeout``
+    seconds raises ``SSRBusy``.
+    """
+
+    cache_key = f"{SSR_CACHE_PREFIX}:in-flight"
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        queue_timeout: float = 0.05,
+        max_global: int | None = None,
+        cache_alias: str | None = None,
+        global_timeout: float = 60,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self.max_global = max_global
+        self.cache_alias = cache_alias
+        self.global_timeout = global_timeout
+        self.lease_keys = [
+            f"{self.cache_key}:{slot}" for slot in range(max_global or 0)
+        ]
+        self.rejected = 0
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrency)
+            if max_concurrency is not None
+            else None
+        )
+
+    def global_in_flight(self) -> int:
+        """The number of global slots currently leased by any process."""
+        if self.max_global is None:
+            return 0
+        return len(self._cache().get_many(self.lease_keys))
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        until = time.monotonic() + self.queue_timeout
+        if self._semaphore is not None and not self._semaphore.acquire(
+            timeout=self.queue_timeout
+        ):
+            self._reject()
+        try:
+            lease = None
+            if self.max_global is not None:
+                while (lease := self._acquire_global()) is None:
+                    if time.monotonic() >= until:
+                        self._reject()
+                    time.sleep(0.005)
+            try:
+                yield
+            finally:
+                if lease is not None:
+                    self._release_global(lease)
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        # Polled so that waiting never blocks the event loop or a thread.
+        until = time.monotonic() + self.queue_timeout
+        while self._semaphore is not None and not self._semaphore.acquire(
+            blocking=False
+        ):
+            if time.monotonic() >= until:
+                self._reject()
+            await asyncio.sleep(0.005)
+        try:
+            lease = None
+            if self.max_global is not None:
+                while (lease := await sync_to_async(self._acquire_global)()) is None:
+                    if time.monotonic() >= until:
+                        self._reject()
+                    await asyncio.sleep(0.005)
+            try:
+                yield
+            finally:
+                if lease is not None:
+                    await sync_to_async(self._release_global)(lease)
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def _reject(self) -> NoReturn:
+        self.rejected += 1
+        raise SSRBusy("No SSR slot became free in time")
+
+    def _cache(self) -> BaseCache:
+        return caches[self.cache_alias or settings.INERTIA_CACHE_ALIAS]
+
+    def _acquire_global(self) -> tuple[str, str] | None:
+        cache = self._cache()
+        keys = self.lease_keys
+        taken = cache.get_many(keys)
+        free = [key for key in keys if key not in taken]
+        # Start at a random free slot so processes don't all race for the
+        # same one.
+        random.shuffle(free)
+        token = secrets.token_hex(8)
+        for key in free:
+            # add() only succeeds if no other process leased the slot since.
+            if cache.add(key, token, self.global_timeout):
+                return key, token
+        return None
+
+    def _release_global(self, lease: tuple[str, str]) -> None:
+        key, token = lease
+        cache = self._cache()
+        # A lease that outlived its timeout may belong to another render now.
+        if cache.get(key) == token:
+            cache.delete(key)
+
+
+class SSREndpoint:
+    """One SSR server: its transport, circuit breaker and renders in flight."""
+
+    def __init__(
+        self, transport: SSRTransport, breaker: CircuitBreaker | None = None
+    ) -> None:
+        self.transport = transport
+        self.breaker = breaker
+        self.in_flight = 0
+
+    @property
+    def url(self) -> str:
+        return self.transport.url
+
+
+class SSRClient:
+    """
+    Renders pages on one or more SSR endpoints, guarded by an optional
+    ``Bulkhead``.
+
+    Each render goes to the endpoint with the fewest renders in flight, with
+    ties taken in turn. An endpoint whose circuit breaker has opened is
+    skipped until its cooldown ends and a probe render succeeds.
+    """
+
+    def __init__(
+        self, endpoints: list[SSREndpoint], bulkhead: Bulkhead | None = None
+    ) -> None:
+        self.endpoints = endpoints
+        self.bulkhead = bulkhead
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "SSRClient":
+        url = settings.INERTIA_SSR_URL
+        urls = [url] if isinstance(url, str) else list(url)
+        bulkhead = (
+            Bulkhead(
+                max_concurrency=settings.INERTIA_SSR_MAX_CONCURRENCY,
+                queue_timeout=settings.INERTIA_SSR_QUEUE_TIMEOUT,
+                max_global=settings.INERTIA_SSR_MAX_GLOBAL_CONCURRENCY,
+            )
+            if settings.INERTIA_SSR_MAX_CONCURRENCY is not None
+            or settings.INERTIA_SSR_MAX_GLOBAL_CONCURRENCY is not None
+            else None
+        )
+        return cls([cls.endpoint_from_settings(url) for url in urls], bulkhead)
+
+    @staticmethod
+    def endpoint_from_settings(url: str) -> SSREndpoint:
+        transport = get_transport_class(url)(
+            url,
+            pool_size=settings.INERTIA_SSR_POOL_SIZE,
+            timeout=(
+                settings.INERTIA_SSR_CONNECT_TIMEOUT,
+                settings.INERTIA_SSR_READ_TIMEOUT,
+            ),
+            retries=settings.INERTIA_SSR_RETRIES,
+        )
+        breaker = (
+            CircuitBreaker(
+                url,
+                failure_threshold=settings.INERTIA_SSR_FAILURE_THRESHOLD,
+                failure_rate=settings.INERTIA_SSR_FAILURE_RATE,
+                window=settings.INERTIA_SSR_FAILURE_WINDOW,
+                cooldown=settings.INERTIA_SSR_COOLDOWN,
+            )
+            if settings.INERTIA_SSR_CIRCUIT_BREAKER
+            else None
+        )
+        return SSREndpoint(transport, breaker)
+
+    def render(self, data: str) -> dict[str, Any]:
+        # Take a slot before choosing an endpoint, so a busy rejection
+        # never strands a half-open probe.
+        if self.bulkhead is None:
+            return self._render(data)
+        with self.bulkhead.slot():
+            return self._render(data)
+
+    async def arender(self, data: str) -> dict[str, Any]:
+        if self.bulkhead is None:
+            return await self._arender(data)
+        async with self.bulkhead.aslot():
+            return await self._arender(data)
+
+    def _render(self, data: str) -> dict[str, Any]:
+        endpoint = self._choose_endpoint()
+        succeeded = None
+        try:
+            result = endpoint.transport.post(data)
+            succeeded = True
+            return result
+        except Exception:
+            succeeded = False
+            raise
+        finally:
+            self._finish(endpoint, succeeded)
+
+    async def _arender(self, data: str) -> dict[str, Any]:
+        endpoint = self._choose_endpoint()
+        succeeded = None
+        try:
+            result = await endpoint.transport.apost(data)
+            succeeded = True
+            return result
+        except Exception:
+            succeeded = False
+            raise
+        finally:
+            self._finish(endpoint, succeeded)
+
+    def _choose_endpoint(self) -> SSREndpoint:
+        with self._lock:
+            start = next(self._turn) % len(self.endpoints)
+            in_turn = self.endpoints[start:] + self.endpoints[:start]
+            # sorted() is stable, so endpoints that are equally busy keep
+            # their turn order.
+            for endpoint in sorted(in_turn, key=lambda endpoint: endpoint.in_flight):
+                if endpoint.breaker is not None:
+                    try:
+                        endpoint.breaker.before_call()
+                    except CircuitOpen:
+                        continue
+                endpoint.in_flight += 1
+                return endpoint
+        raise CircuitOpen("Every SSR endpoint is unavailable")
+
+    def _finish(self, endpoint: SSREndpoint, succeeded: bool | None) -> None:
+        # succeeded is None when the render was cancelled before the server
+        # answered, which says nothing about the server's health.
+        with self._lock:
+            endpoint.in_flight -= 1
+        if endpoint.breaker is None:
+            return
+        if succeeded is None:
+            endpoint.breaker.release_probe()
+        elif succeeded:
+            endpoint.breaker.record_success()
+        else:
+            endpoint.breaker.record_failure()
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Renders in flight and circuit breaker counts for each endpoint."""
+        with self._lock:
+            in_flight = [endpoint.in_flight for endpoint in self.endpoints]
+        return [
+            {
+                "url": endpoint.url,
+                "in_flight": count,
+                "circuit": endpoint.breaker.stats() if endpoint.breaker else None,
+            }
+            for endpoint, count in zip(self.endpoints, in_flight, strict=True)
+        ]
+
+    def close(self) -> None:
+        for endpoint in self.endpoints:
+            endpoint.transport.close()
+
+
+_ssr_executor: ThreadPoolExecutor | None = None
+# One per executor worker, so renders are never queued behind busy workers.
+_ssr_workers: threading.Semaphore | None = None
+_ssr_executor_lock = threading.Lock()
+
+
+def _submit_to_ssr_executor(call: Callable[[], Any]) -> "Future[Any]":
+    global _ssr_executor, _ssr_workers
+    with _ssr_executor_lock:
+        if _ssr_executor is None:
+            _ssr_workers = threading.BoundedSemaphore(settings.INERTIA_SSR_POOL_SIZE)
+            _ssr_executor = ThreadPoolExecutor(
+                max_workers=settings.INERTIA_SSR_POOL_SIZE,
+                thread_name_prefix="inertia-ssr",
+            )
+        executor, workers = _ssr_executor, cast(threading.Semaphore, _ssr_workers)
+    if not workers.acquire(blocking=False):
+        raise SSRBusy("Every SSR worker is busy")
+    future = executor.submit(contextvars.copy_context().run, call)
+    future.add_done_callback(lambda _: workers.release())
+    return future
+
+
+_client: SSRClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_ssr_client() -> SSRClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = SSRClient.from_settings()
+    return _client
+
+
+def reset_ssr_client(**kwargs: Any) -> None:
+    global _client, _ssr_executor
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+    with _ssr_executor_lock:
+        executor, _ssr_executor = _ssr_executor, None
+    if executor is not None:
+        # Renders still running finish on their own threads.
+        executor.shutdown(wait=False)
+
+
+@receiver(setting_changed)
+def _reset_ssr_client_on_setting_change(setting: str, **kwargs: Any) -> None:
+    if setting.startswith("INERTIA_SSR"):
+        reset_ssr_client()
+
+
+def render_page(data: str, deadline: float | None = None) -> dict[str, Any]:
+    """
+    Render encoded page data on the SSR server.
+
+    With ``INERTIA_SSR_CACHE`` enabled, results are stored by a hash of the
+    page data and ``INERTIA_VERSION``, so identical pages are only rendered
+    once per ``INERTIA_SSR_CACHE_TIMEOUT``.
+
+    With a ``deadline``, the render runs on one of ``INERTIA_SSR_POOL_SIZE``
+    worker threads and ``SSRDeadlineExceeded`` is raised if it hasn't
+    finished after that many seconds. An abandoned render that already
+    reached the SSR server completes in the background and keeps its worker
+    until then; ``SSRBusy`` is raised while no worker is free.
+    """
+    if deadline is None:
+        return _render_page(data)
+
+    future = _submit_to_ssr_executor(partial(_render_page, data))
+    done, _ = wait([future], timeout=deadline)
+    if not done:
+        # Renders that haven't started yet are dropped rather than sent.
+        future.cancel()
+        raise SSRDeadlineExceeded(f"SSR render took longer than {deadline}s")
+    return cast(dict[str, Any], future.result())
+
+
+def _render_page(data: str) -> dict[str, Any]:
+    if not settings.INERTIA_SSR_CACHE:
+        return get_ssr_client().render(data)
+
+    cache = caches[settings.INERTIA_SSR_CACHE_ALIAS or settings.INERTIA_CACHE_ALIAS]
+    key = ssr_cache_key(data)
+    result = cache.get(key)
+    if result is None:
+        result = get_ssr_client().render(data)
+        if len(json_encode(result)) <= settings.INERTIA_SSR_CACHE_MAX_SIZE:
+            cache.set(key, result, settings.INERTIA_SSR_CACHE_TIMEOUT)
+    return cast(dict[str, Any], result)
+
+
+async def arender_page(data: str, deadline: float | None = None) -> dict[str, Any]:
+    """Render encoded page data without blocking the event loop."""
+    if deadline is None:
+        return await _arender_page(data)
+
+    task = asyncio.ensure_future(_arender_page(data))
+    done, _ = await asyncio.wait([task], timeout=deadline)
+    if not done:
+        task.cancel()
+        raise SSRDeadlineExceeded(f"SSR render took longer than {deadline}s")
+    return task.result()
+
+
+async def _arender_page(data: str) -> dict[str, Any]:
+    if not settings.INERTIA_SSR_CACHE:
+        return await get_ssr_client().arender(data)
+
+    cache = caches[settings.INERTIA_SSR_CACHE_ALIAS or settings.INERTIA_CACHE_ALIAS]
+    key = ssr_cache_key(data)
+    result = await cache.aget(key)
+    if result is None:
+        result = await get_ssr_client().arender(data)
+        if len(json_encode(result)) <= settings.INERTIA_SSR_CACHE_MAX_SIZE:
+            await cache.aset(key, result, settings.INERTIA_SSR_CACHE_TIMEOUT)
+    return cast(dict[str, Any], result)
+
+
+def ssr_cache_key(data: str) -> str:
+    digest = hashlib.sha256(data.encode()).hexdigest()
+    return f"{SSR_CACHE_PREFIX}:{get_version()}:{digest}"
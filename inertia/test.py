@@ -1,10 +1,14 @@
-from json import dumps, loads
+import re
+from json import loads
 from unittest.mock import patch
 
 from django.template.loader import render_to_string as base_render_to_string
 from django.test import Client, TestCase
 
-from inertia.settings import settings
+from inertia.encoding import encode_script_json
+from inertia.http import LAYOUT_SLOT_MARKER, clear_layout_shells
+from inertia.ssr import reset_ssr_client
+from inertia.version import get_version
 
 
 class ClientWithLastResponse:
@@ -57,16 +61,25 @@ class InertiaTestCase(BaseInertiaTestCase, TestCase):
             "inertia.http.render_to_string", wraps=base_render_to_string
         )
         self.mock_render = self.mock_inertia.start()
+        clear_layout_shells()
+        reset_ssr_client()
 
     def tearDown(self):
         self.mock_inertia.stop()
 
     def page(self):
+        response = self.last_response()
+        if response is not None and response.streaming:
+            return streamed_page(response)
+
         page_data = (
             self.mock_render.call_args[0][1]["page"]
             if self.mock_render.call_args
-            else self.last_response().content
+            else response.content
         )
+        if isinstance(page_data, str) and page_data.startswith(LAYOUT_SLOT_MARKER):
+            # Rendered from a layout shell, so the page is only in the HTML.
+            return html_page(response.content.decode())
 
         return loads(page_data)
 
@@ -111,6 +124,26 @@ class InertiaTestCase(BaseInertiaTestCase, TestCase):
         self.assertEqual(component_name, self.component())
 
 
+PAGE_SCRIPT = re.compile(
+    r'<script data-page="app" type="application/json">(.*?)</script>', re.S
+)
+
+
+def streamed_page(response):
+    # Streaming content can only be consumed once, so keep the parsed page.
+    if not hasattr(response, "_inertia_page"):
+        content = b"".join(response.streaming_content).decode()
+        if response.headers.get("X-Inertia"):
+            response._inertia_page = loads(content)
+        else:
+            response._inertia_page = html_page(content)
+    return response._inertia_page
+
+
+def html_page(content):
+    return loads(PAGE_SCRIPT.search(content).group(1))
+
+
 def inertia_page(
     url,
     component="TestComponent",
@@ -129,7 +162,7 @@ def inertia_page(
         "component": component,
         "props": props,
         "url": f"/{url}/",
-        "version": settings.INERTIA_VERSION,
+        "version": get_version(),
         "encryptHistory": False,
         "clearHistory": False,
     }
@@ -157,12 +190,7 @@ def inertia_page(
 
 def inertia_div(*args, **kwargs):
     page = inertia_page(*args, **kwargs)
-    data = (
-        dumps(page)
-        .replace("&", "\\u0026")
-        .replace("<", "\\u003c")
-        .replace(">", "\\u003e")
-    )
+    data = encode_script_json(page)
     return (
         f'<script data-page="app" type="application/json">{data}</script>'
         '\n  <div id="app"></div>'
@@ -0,0 +1,83 @@
+from asgiref.sync import iscoroutinefunction
+
+from inertia.middleware import InertiaMiddleware
+from inertia.test import InertiaTestCase, inertia_div, inertia_page
+
+INERTIA_HEADERS = {"X-Inertia": "true"}
+
+
+class AsyncRenderingTestCase(InertiaTestCase):
+    """Async views resolve awaitable props concurrently on the event loop.
+
+    The handshake props in the test views wait for each other to start, so
+    they only resolve when awaited together.
+    """
+
+    async def test_async_props_are_awaited_concurrently(self):
+        response = await self.async_client.get("/async/", headers=INERTIA_HEADERS)
+
+        self.assertJSONResponse(
+            response,
+            inertia_page(
+                "async",
+                props={
+                    "name": "Brandon",
+                    "sport": "Hockey",
+                    "team": {"name": "Penguins", "city": "Pittsburgh"},
+                },
+                deferred_props={"default": ["stats"]},
+            ),
+        )
+
+    async def test_async_deferred_props_are_rescued(self):
+        response = await self.async_client.get(
+            "/async/",
+            headers={
+                **INERTIA_HEADERS,
+                "X-Inertia-Partial-Data": "stats",
+                "X-Inertia-Partial-Component": "TestComponent",
+            },
+        )
+        page = response.json()
+
+        self.assertEqual(page["props"], {})
+        self.assertEqual(page["rescuedProps"], ["stats"])
+
+    async def test_async_view_first_load(self):
+        response = await self.async_client.get("/arender/")
+
+        self.assertContains(
+            response,
+            inertia_div(
+                "arender",
+                props={"name": "Brandon"},
+                template_data={"name": "Brian", "sport": "Basketball"},
+            ),
+        )
+        self.assertContains(response, "template data:Brian, Basketball")
+
+    async def test_async_view_responses_are_returned(self):
+        response = await self.async_client.get(
+            "/async-redirect/", headers=INERTIA_HEADERS
+        )
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_sync_views_await_async_props(self):
+        self.assertJSONResponse(
+            self.inertia.get("/sync-async-props/"),
+            inertia_page(
+                "sync-async-props",
+                props={
+                    "sport": "Hockey",
+                    "team": {"name": "Penguins", "city": "Pittsburgh"},
+                },
+            ),
+        )
+
+    def test_middleware_adapts_to_async_get_response(self):
+        async def get_response(request):
+            return None
+
+        self.assertTrue(iscoroutinefunction(InertiaMiddleware(get_response)))
+        self.assertFalse(iscoroutinefunction(InertiaMiddleware(lambda request: None)))
@@ -0,0 +1,72 @@
+from django.core.cache import cache
+
+from inertia import batch_loader
+from inertia.test import InertiaTestCase, inertia_page
+from inertia.tests.testapp import views
+
+
+class BatchLoaderTestCase(InertiaTestCase):
+    """Props loaded through a batch loader on the same level share one fetch."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        views.batch_fetches.clear()
+
+    def test_deferred_group_is_fetched_once(self):
+        response = self.inertia.get(
+            "/batch/",
+            HTTP_X_INERTIA_PARTIAL_DATA="penguins,bulls,again,missing",
+            HTTP_X_INERTIA_PARTIAL_COMPONENT="TestComponent",
+        )
+        page = response.json()
+
+        self.assertEqual(page["props"], {"penguins": 3, "bulls": 1, "again": 3})
+        self.assertEqual(page["rescuedProps"], ["missing"])
+        self.assertEqual(views.batch_fetches, [["Penguins", "Bulls", "Kings"]])
+
+    def test_only_requested_keys_are_fetched(self):
+        response = self.inertia.get(
+            "/batch/",
+            HTTP_X_INERTIA_PARTIAL_DATA="bulls",
+            HTTP_X_INERTIA_PARTIAL_COMPONENT="TestComponent",
+        )
+
+        self.assertEqual(response.json()["props"], {"bulls": 1})
+        self.assertEqual(views.batch_fetches, [["Bulls"]])
+
+    def test_list_items_are_batched(self):
+        self.assertJSONResponse(
+            self.inertia.get("/batch/"),
+            inertia_page(
+                "batch",
+                props={"name": "Brandon", "history": [1, 3]},
+                deferred_props={"stats": ["penguins", "bulls", "again", "missing"]},
+            ),
+        )
+        self.assertEqual(views.batch_fetches, [["Bulls", "Penguins"]])
+
+    async def test_async_fetch_is_awaited_once(self):
+        response = await self.async_client.get(
+            "/async-batch/", headers={"X-Inertia": "true"}
+        )
+
+        self.assertEqual(response.json()["props"], {"penguins": 3, "bulls": 1})
+        self.assertEqual(views.batch_fetches, [["Penguins", "Bulls"]])
+
+    def test_cached_loads_are_fetched_through_the_cache(self):
+        for _ in range(3):
+            response = self.inertia.get("/cached-batch/")
+            self.assertEqual(response.json()["props"], {"penguins": 3, "bulls": 1})
+
+        self.assertEqual(
+            views.batch_fetches,
+            [["Bulls"], ["Penguins"], ["Penguins"], ["Penguins"]],
+        )
+
+    def test_loads_can_be_called_on_their_own(self):
+        goals = batch_loader(views.goals_for)
+
+        self.assertEqual(goals.load("Bulls")(), 1)
+        with self.assertRaisesMessage(KeyError, "no value for 'Kings'"):
+            goals.load("Kings")()
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory
+
+from inertia import cached, invalidate_cached
+from inertia.http import resolving_request
+from inertia.test import InertiaTestCase
+from inertia.tests.testapp import views
+
+
+class CachedPropsTestCase(InertiaTestCase):
+    """Cached props are computed once and shared across requests."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        views.navigation_builds.clear()
+
+    def navigation(self, url="/cached/", team=""):
+        response = self.inertia.get(url, HTTP_X_TEAM=team)
+        return response.json()["props"]["navigation"]
+
+    def test_values_are_reused_across_requests(self):
+        self.assertEqual(self.navigation()["build"], 1)
+        self.assertEqual(self.navigation()["build"], 1)
+        self.assertEqual(len(views.navigation_builds), 1)
+
+    def test_values_vary_on_the_request(self):
+        self.assertEqual(self.navigation(team="penguins")["build"], 1)
+        self.assertEqual(self.navigation(team="bulls")["build"], 2)
+        self.assertEqual(self.navigation(team="penguins")["build"], 1)
+
+    def test_invalidating_a_key_drops_every_variant(self):
+        self.navigation(team="penguins")
+        self.navigation(team="bulls")
+
+        invalidate_cached("navigation")
+
+        self.assertEqual(self.navigation(team="penguins")["build"], 3)
+        self.assertEqual(self.navigation(team="bulls")["build"], 4)
+
+    def test_invalidating_a_tag(self):
+        self.navigation()
+        invalidate_cached(tags=["unrelated"])
+        self.assertEqual(self.navigation()["build"], 1)
+
+        invalidate_cached(tags=["menus"])
+        self.assertEqual(self.navigation()["build"], 2)
+
+    def test_composes_with_defer(self):
+        page = self.inertia.get("/cached/").json()
+        self.assertEqual(page["deferredProps"], {"default": ["counters"]})
+
+        partial = self.inertia.get(
+            "/cached/",
+            HTTP_X_INERTIA_PARTIAL_DATA="counters",
+            HTTP_X_INERTIA_PARTIAL_COMPONENT="TestComponent",
+        ).json()
+        self.assertEqual(partial["props"], {"counters": 1})
+
+    @patch("inertia.cache._submit_to_props_executor", side_effect=lambda call: call())
+    def test_stale_values_are_served_while_revalidating(self, mock_submit):
+        url = "/stale-cached/"
+
+        self.assertEqual(self.navigation(url)["build"], 1)
+        mock_submit.assert_not_called()
+
+        # The entry is already stale, so this request gets the old value and
+        # triggers a refresh (run inline here).
+        self.assertEqual(self.navigation(url)["build"], 1)
+        mock_submit.assert_called_once()
+
+        self.assertEqual(self.navigation(url)["build"], 2)
+
+    def test_varying_outside_a_response_is_an_error(self):
+        prop = cached(lambda: "Hockey", key="sport", vary_on=["user"])
+
+        with self.assertRaisesMessage(RuntimeError, "varies on the request"):
+            prop()
+
+    def test_varying_on_a_missing_request_attribute_is_an_error(self):
+        prop = cached(lambda: "Hockey", key="sport", vary_on=["tenant"])
+        token = resolving_request.set(RequestFactory().get("/"))
+        self.addCleanup(resolving_request.reset, token)
+
+        with self.assertRaisesMessage(ImproperlyConfigured, "'tenant'"):
+            prop()
@@ -0,0 +1,197 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from json import loads
+from unittest import skipUnless
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.utils.translation import gettext_lazy
+
+from inertia.encoding import (
+    JsonBackend,
+    OrjsonBackend,
+    StdlibJsonBackend,
+    encode_json,
+    escape_script_json,
+    get_json_backend,
+    orjson,
+)
+from inertia.test import InertiaTestCase, inertia_div
+from inertia.tests.testapp.models import Sport, User
+from inertia.utils import InertiaJsonEncoder
+
+
+class UnsupportedValue:
+    pass
+
+
+requires_orjson = skipUnless(orjson, "orjson is not installed")
+
+
+@requires_orjson
+class JsonBackendParityTestCase(TestCase):
+    """The orjson backend produces the same documents as the stdlib one."""
+
+    def assertParity(self, obj):
+        expected = StdlibJsonBackend().encode(obj, InertiaJsonEncoder)
+        actual = OrjsonBackend().encode(obj, InertiaJsonEncoder)
+        self.assertEqual(loads(actual), loads(expected))
+
+    def test_models_querysets_and_inertia_meta(self):
+        user = User.objects.create(
+            name="Brandon",
+            password="something-top-secret",
+            birthdate=date(1987, 2, 15),
+            registered_at=datetime(2022, 10, 31, 10, 13, 1),
+        )
+        sport = Sport(id=3, name="Hockey", season="Winter")
+
+        self.assertParity(
+            {
+                "user": user,
+                "sport": sport,
+                "users": User.objects.all(),
+                "names": User.objects.values_list("name", flat=True),
+            }
+        )
+
+    def test_django_types_use_the_encoder_formatting(self):
+        self.assertParity(
+            {
+                "naive": datetime(2022, 10, 31, 10, 13, 1, 123456),
+                "aware": datetime(2022, 10, 31, 10, 13, 1, tzinfo=timezone.utc),
+                "date": date(1987, 2, 15),
+                "time": time(10, 13, 1, 500000),
+                "duration": timedelta(days=1, seconds=5),
+                "decimal": Decimal("10.50"),
+                "uuid": uuid.UUID("12345678123456781234567812345678"),
+                "lazy": gettext_lazy("Hello"),
+            }
+        )
+
+    def test_plain_data(self):
+        self.assertParity(
+            {
+                "text": "<script>R&D</script> café  ",
+                "numbers": [1, -2, 3.5, 2**40],
+                "flags": [True, False, None],
+                "tuple": (1, "two"),
+                "nested": {"a": {"b": [{"c": "d"}]}},
+                1: "integer keys",
+            }
+        )
+
+    def test_integers_beyond_64_bits(self):
+        self.assertParity({"n": 2**70, "negative": -(2**64)})
+
+    def test_nan_and_infinities(self):
+        expected = StdlibJsonBackend().encode(
+            {"nan": float("nan"), "inf": [float("inf")]}, InertiaJsonEncoder
+        )
+        actual = OrjsonBackend().encode(
+            {"nan": float("nan"), "inf": [float("inf")]}, InertiaJsonEncoder
+        )
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual, '{"nan": NaN, "inf": [Infinity]}')
+
+    def test_nan_from_the_encoder_default(self):
+        sport = Sport(id=3, name="Hockey", season="Winter")
+        sport.rating = float("nan")
+
+        class RatingEncoder(InertiaJsonEncoder):
+            def default(self, value):
+                if isinstance(value, Sport):
+                    return {"name": value.name, "rating": value.rating}
+                return super().default(value)
+
+        self.assertEqual(
+            OrjsonBackend().encode({"sport": sport, "none": None}, RatingEncoder),
+            StdlibJsonBackend().encode({"sport": sport, "none": None}, RatingEncoder),
+        )
+
+    def test_unsupported_values_raise_type_error(self):
+        for backend in (StdlibJsonBackend(), OrjsonBackend()):
+            with self.subTest(backend=backend), self.assertRaises(TypeError):
+                backend.encode({"value": UnsupportedValue()}, InertiaJsonEncoder)
+
+
+class JsonBackendSettingTestCase(TestCase):
+    def test_default_backend_is_stdlib(self):
+        self.assertIsInstance(get_json_backend(), StdlibJsonBackend)
+
+    @requires_orjson
+    @override_settings(INERTIA_JSON_BACKEND="orjson")
+    def test_backend_can_be_selected_by_name(self):
+        self.assertIsInstance(get_json_backend(), OrjsonBackend)
+
+    @requires_orjson
+    @override_settings(INERTIA_JSON_BACKEND="auto")
+    def test_auto_prefers_orjson_when_installed(self):
+        self.assertIsInstance(get_json_backend(), OrjsonBackend)
+
+    @override_settings(INERTIA_JSON_BACKEND="inertia.encoding.StdlibJsonBackend")
+    def test_backend_can_be_a_dotted_path(self):
+        self.assertIsInstance(get_json_backend(), StdlibJsonBackend)
+
+    def test_backends_must_implement_encode(self):
+        class EmptyBackend(JsonBackend):
+            pass
+
+        with self.assertRaises(TypeError):
+            EmptyBackend()
+
+    @override_settings(INERTIA_JSON_BACKEND="not.a.backend")
+    def test_unknown_backends_are_improperly_configured(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_json_backend()
+
+    def test_encode_json_uses_the_given_encoder(self):
+        sport = Sport(id=3, name="Hockey", season="Winter")
+
+        self.assertEqual(
+            loads(encode_json({"sport": sport}, InertiaJsonEncoder))["sport"]["name"],
+            "Hockey",
+        )
+
+
+@requires_orjson
+@override_settings(INERTIA_JSON_BACKEND="orjson")
+class OrjsonRenderingTestCase(InertiaTestCase):
+    def test_first_load_is_escaped(self):
+        response = self.client.get("/props/")
+
+        self.assertContains(
+            response, inertia_div("props", props={"name": "Brandon", "sport": "Hockey"})
+        )
+
+    def test_inertia_response_has_the_same_page(self):
+        with override_settings(INERTIA_JSON_BACKEND="stdlib"):
+            expected = self.inertia.get("/props/").json()
+
+        self.assertEqual(self.inertia.get("/props/").json(), expected)
+
+
+class ScriptEscapingTestCase(TestCase):
+    def test_script_breaking_characters_are_escaped(self):
+        self.assertEqual(
+            escape_script_json('{"a": "</script>&\u2028\u2029"}'),
+            '{"a": "\\u003c/script\\u003e\\u0026\\u2028\\u2029"}',
+        )
+
+    def test_pages_without_escapes_are_not_copied(self):
+        data = '{"a": "plain"}'
+
+        self.assertIs(escape_script_json(data), data)
+
+    @requires_orjson
+    def test_backends_produce_the_same_script_safe_page(self):
+        page = {"text": "</script><b>R&D</b> \u2028 \u2029 café"}
+
+        for backend in (StdlibJsonBackend(), OrjsonBackend()):
+            with self.subTest(backend=backend):
+                data = backend.encode_script(page, InertiaJsonEncoder)
+
+                self.assertFalse({"<", ">", "&", "\u2028", "\u2029"} & set(data))
+                self.assertEqual(loads(data), page)
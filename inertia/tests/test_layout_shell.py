@@ -0,0 +1,98 @@
+from unittest.mock import Mock, patch
+
+from django.test import override_settings
+from django.utils import timezone, translation
+
+from inertia.http import LAYOUT_SLOT_MARKER, _split_layout
+from inertia.test import InertiaTestCase, inertia_div
+
+PROPS_DIV = inertia_div("props", props={"name": "Brandon", "sport": "Hockey"})
+
+
+@override_settings(INERTIA_LAYOUT_SHELL=True)
+class LayoutShellTestCase(InertiaTestCase):
+    """First loads splice the page into a layout rendered once ahead of time."""
+
+    def test_shell_output_matches_a_full_render(self):
+        with override_settings(INERTIA_LAYOUT_SHELL=False):
+            expected = self.client.get("/template_data/").content
+
+        self.assertEqual(self.client.get("/template_data/").content, expected)
+
+    def test_layout_is_rendered_once_per_template_data(self):
+        self.client.get("/props/")
+        response = self.client.get("/props/")
+
+        self.assertContains(response, PROPS_DIV)
+        self.assertEqual(self.mock_render.call_count, 1)
+
+        self.client.get("/template_data/")
+        self.assertEqual(self.mock_render.call_count, 2)
+
+    def test_shells_are_rendered_without_the_request(self):
+        self.client.get("/props/")
+
+        self.assertIsNone(self.mock_render.call_args[0][2])
+
+    def test_page_helpers_read_pages_from_shells(self):
+        self.client.get("/template_data/")
+        self.client.get("/template_data/")
+
+        self.assertComponentUsed("TestComponent")
+        self.assertHasExactTemplateData({"name": "Brian", "sport": "Basketball"})
+
+    def test_template_data_that_is_not_plain_json_is_not_cached(self):
+        with patch(
+            "inertia.http.BaseInertiaResponseMixin.build_first_load_context_and_template",
+            return_value=({"page": "{}", "user": object()}, "inertia.html"),
+        ):
+            self.client.get("/props/")
+            self.client.get("/props/")
+
+        self.assertEqual(self.mock_render.call_count, 2)
+        self.assertIsNotNone(self.mock_render.call_args[0][2])
+
+    def test_shells_are_kept_per_language_and_time_zone(self):
+        self.client.get("/props/")
+        with translation.override("fr"):
+            self.client.get("/props/")
+        with timezone.override("Europe/Paris"):
+            self.client.get("/props/")
+        self.client.get("/props/")
+
+        self.assertEqual(self.mock_render.call_count, 3)
+
+    def test_changing_inertia_settings_clears_shells(self):
+        self.client.get("/props/")
+        with override_settings(INERTIA_LAYOUT="layout.html"):
+            self.client.get("/props/")
+
+        self.assertEqual(self.mock_render.call_count, 2)
+
+    @override_settings(INERTIA_SSR_ENABLED=True, INERTIA_SSR_URL="ssr-url")
+    @patch("inertia.ssr.requests")
+    def test_ssr_head_and_body_are_spliced_into_the_shell(self, mock_requests):
+        for body in ("<div>First</div>", "<div>Second</div>"):
+            mock_response = Mock()
+            mock_response.json.return_value = {
+                "body": body,
+                "head": "<title>Head works</title>",
+            }
+            mock_requests.Session.return_value.post.return_value = mock_response
+
+            response = self.client.get("/template_data/")
+
+            self.assertContains(response, body)
+            self.assertContains(response, "head--<title>Head works</title>--head")
+            self.assertContains(response, "Brian, Basketball")
+
+        self.assertEqual(self.mock_render.call_count, 1)
+
+
+class SplitLayoutTestCase(InertiaTestCase):
+    def test_slots_must_appear_exactly_once(self):
+        marker = f"{LAYOUT_SLOT_MARKER}[page]"
+
+        self.assertEqual(_split_layout(f"a{marker}b", ["page"]), ["a", "page", "b"])
+        self.assertIsNone(_split_layout("ab", ["page"]))
+        self.assertIsNone(_split_layout(f"a{marker}b{marker}", ["page"]))
@@ -1,5 +1,39 @@
+from unittest.mock import Mock
+
+from django.contrib import messages
+from django.shortcuts import redirect
+from django.test import override_settings
+from django.urls import path
+
+from inertia import inertia
 from inertia.test import InertiaTestCase
 
+view_calls = Mock()
+
+
+@inertia("TestComponent")
+def counted_view(request):
+    view_calls()
+    return {}
+
+
+@inertia("TestComponent")
+async def async_counted_view(request):
+    view_calls()
+    return {}
+
+
+def flash_view(request):
+    messages.success(request, "Profile saved!")
+    return redirect("/counted/")
+
+
+urlpatterns = [
+    path("counted/", counted_view),
+    path("async-counted/", async_counted_view),
+    path("flash/", flash_view),
+]
+
 
 class MiddlewareTestCase(InertiaTestCase):
     def test_anything(self):
@@ -40,3 +74,43 @@ class MiddlewareTestCase(InertiaTestCase):
         self.assertEqual(response.status_code, 409)
         self.assertIn("X-Inertia-Location", response.headers)
         self.assertEqual("http://foobar.com/", response.headers["X-Inertia-Location"])
+
+
+@override_settings(ROOT_URLCONF=__name__, INERTIA_VERSION="2.0")
+class StaleVersionTestCase(InertiaTestCase):
+    def setUp(self):
+        super().setUp()
+        view_calls.reset_mock()
+
+    def test_the_view_does_not_run_for_stale_requests(self):
+        response = self.inertia.get("/counted/", HTTP_X_INERTIA_VERSION="1.0")
+
+        self.assertEqual(response.status_code, 409)
+        view_calls.assert_not_called()
+
+    def test_the_view_runs_for_current_requests(self):
+        response = self.inertia.get("/counted/", HTTP_X_INERTIA_VERSION="2.0")
+
+        self.assertEqual(response.status_code, 200)
+        view_calls.assert_called_once_with()
+
+    async def test_async_views_do_not_run_for_stale_requests(self):
+        response = await self.async_client.get(
+            "/async-counted/",
+            headers={"X-Inertia": "true", "X-Inertia-Version": "1.0"},
+        )
+
+        self.assertEqual(response.status_code, 409)
+        view_calls.assert_not_called()
+
+    def test_stale_requests_keep_flash_messages(self):
+        self.inertia.get("/flash/", HTTP_X_INERTIA_VERSION="2.0")
+
+        response = self.inertia.get("/counted/", HTTP_X_INERTIA_VERSION="1.0")
+        self.assertEqual(response.status_code, 409)
+
+        response = self.inertia.get("/counted/", HTTP_X_INERTIA_VERSION="2.0")
+        self.assertEqual(
+            response.json()["flash"],
+            {"messages": [{"level": "success", "message": "Profile saved!"}]},
+        )
@@ -0,0 +1,50 @@
+from django.test import override_settings
+
+from inertia import defer
+from inertia.test import InertiaTestCase, inertia_page
+
+
+class ParallelPropsTestCase(InertiaTestCase):
+    """Props marked parallel are resolved concurrently on a thread pool.
+
+    The test views only succeed when their props run at the same time, since
+    each one waits on a shared barrier before returning.
+    """
+
+    def test_parallel_props_resolve_concurrently_in_declared_order(self):
+        response = self.inertia.get(
+            "/parallel/",
+            HTTP_X_INERTIA_PARTIAL_DATA="sport,missing,stats,teams",
+            HTTP_X_INERTIA_PARTIAL_COMPONENT="TestComponent",
+        )
+        page = response.json()
+
+        self.assertEqual(
+            page["props"],
+            {"teams": ["Penguins"], "stats": {"goals": 3}, "sport": "Hockey"},
+        )
+        self.assertEqual(list(page["props"]), ["teams", "stats", "sport"])
+        self.assertEqual(page["rescuedProps"], ["missing"])
+
+    def test_parallel_props_are_still_deferred_on_first_load(self):
+        self.assertJSONResponse(
+            self.inertia.get("/parallel/"),
+            inertia_page(
+                "parallel",
+                props={"name": "Brandon"},
+                deferred_props={"stats": ["teams", "stats", "missing", "sport"]},
+            ),
+        )
+
+    @override_settings(INERTIA_PARALLEL_PROPS=True)
+    def test_setting_resolves_all_callable_props_in_parallel(self):
+        self.assertJSONResponse(
+            self.inertia.get("/parallel-setting/"),
+            inertia_page(
+                "parallel-setting", props={"sport": "Hockey", "team": "Penguins"}
+            ),
+        )
+
+    def test_props_default_to_the_setting(self):
+        self.assertIsNone(defer(lambda: "Hockey").parallel)
+        self.assertFalse(defer(lambda: "Hockey", parallel=False).parallel)
@@ -0,0 +1,228 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.contrib import messages
+from django.contrib.messages.storage import default_storage
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import AsyncRequestFactory, RequestFactory, override_settings
+
+from inertia import InertiaResponse
+from inertia.http import (
+    INERTIA_SESSION_CLEAR_HISTORY,
+    INERTIA_SESSION_PRESERVE_FRAGMENT,
+)
+from inertia.prerender import load_prerendered
+from inertia.test import InertiaTestCase, inertia_page
+
+
+@override_settings(
+    INERTIA_SSR_URL="ssr-url",
+    INERTIA_VERSION="1.0",
+    INERTIA_PRERENDER=True,
+)
+class PrerenderTestCase(InertiaTestCase):
+    def setUp(self):
+        super().setUp()
+        # The command refuses caches local to its own process.
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(
+            override_settings(
+                CACHES={
+                    "default": {
+                        "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
+                    },
+                    "prerender": {
+                        "BACKEND": (
+                            "django.core.cache.backends.filebased.FileBasedCache"
+                        ),
+                        "LOCATION": directory,
+                    },
+                },
+                INERTIA_PRERENDER_CACHE_ALIAS="prerender",
+            )
+        )
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        patcher = patch("inertia.ssr.requests")
+        self.mock_requests = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.post = self.mock_requests.Session.return_value.post
+        self.post.return_value.json.return_value = {
+            "head": ["<title>Prerendered</title>"],
+            "body": "<div>Prerendered body</div>",
+        }
+
+    def prerender(self, *targets):
+        call_command(
+            "inertia_prerender", *targets, stdout=StringIO(), stderr=StringIO()
+        )
+
+    def test_it_renders_the_page_through_ssr(self):
+        self.prerender("/props/")
+
+        self.post.assert_called_once_with(
+            "ssr-url/render",
+            data=json.dumps(
+                inertia_page("props", props={"name": "Brandon", "sport": "Hockey"})
+            ),
+            headers={"Content-Type": "application/json"},
+            timeout=(1.0, 10.0),
+        )
+        self.assertEqual(
+            load_prerendered("/props/"),
+            {
+                "head": ["<title>Prerendered</title>"],
+                "body": "<div>Prerendered body</div>",
+            },
+        )
+
+    def test_it_accepts_view_names(self):
+        self.prerender("props")
+
+        self.assertIsNotNone(load_prerendered("/props/"))
+
+    def test_first_loads_are_served_prerendered(self):
+        self.prerender("/props/")
+
+        with patch("inertia.http.PropsResolver.resolve") as resolve:
+            response = self.client.get("/props/")
+
+        resolve.assert_not_called()
+        self.post.assert_called_once()
+        self.assertTrue(response.prerendered)
+        self.assertTemplateUsed(response, "inertia_ssr.html")
+        self.assertContains(response, "<div>Prerendered body</div>")
+        self.assertContains(response, "head--<title>Prerendered</title>--head")
+
+    def test_async_first_loads_are_served_prerendered(self):
+        self.prerender("/props/")
+        request = AsyncRequestFactory().get("/props/")
+        request.session = {}
+
+        response = async_to_sync(InertiaResponse.acreate)(request, "Props")
+
+        self.assertTrue(response.prerendered)
+        self.assertIn(b"<div>Prerendered body</div>", response.content)
+
+    def test_pending_session_state_is_rendered_and_consumed(self):
+        self.prerender("/props/")
+
+        for key in (INERTIA_SESSION_CLEAR_HISTORY, INERTIA_SESSION_PRESERVE_FRAGMENT):
+            with self.subTest(key=key):
+                request = RequestFactory().get("/props/")
+                request.session = {key: True}
+
+                response = InertiaResponse(request, "Props")
+
+                self.assertFalse(response.prerendered)
+                self.assertEqual(request.session, {})
+
+    def test_flash_messages_are_rendered_and_consumed(self):
+        self.prerender("/props/")
+        request = RequestFactory().get("/props/")
+        request.session = {}
+        request._messages = default_storage(request)
+        messages.success(request, "Profile saved!")
+
+        response = InertiaResponse(request, "Props")
+
+        self.assertFalse(response.prerendered)
+        self.assertContains(response, "Profile saved!")
+        self.assertTrue(request._messages.used)
+
+    def test_inertia_requests_are_not_served_prerendered(self):
+        self.prerender("/props/")
+
+        response = self.inertia.get("/props/")
+
+        self.assertFalse(response.prerendered)
+        self.assertJSONResponse(
+            response,
+            inertia_page("props", props={"name": "Brandon", "sport": "Hockey"}),
+        )
+
+    def test_pages_are_not_served_for_another_version(self):
+        self.prerender("/props/")
+
+        with override_settings(INERTIA_VERSION="2.0"):
+            response = self.client.get("/props/")
+            self.assertIsNone(load_prerendered("/props/"))
+
+        self.assertFalse(response.prerendered)
+        self.assertNotContains(response, "Prerendered body")
+
+    @override_settings(INERTIA_PRERENDER=False)
+    def test_pages_are_only_served_when_enabled(self):
+        self.prerender("/props/")
+
+        response = self.client.get("/props/")
+
+        self.assertFalse(response.prerendered)
+
+    def test_pages_can_be_stored_on_disk(self):
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            override_settings(INERTIA_PRERENDER_DIR=directory),
+        ):
+            self.prerender("/props/")
+            cache.clear()
+
+            response = self.client.get("/props/")
+
+        self.assertTrue(response.prerendered)
+        self.assertContains(response, "<div>Prerendered body</div>")
+
+    @patch("inertia.prerender.logger")
+    def test_unreadable_pages_are_rendered_as_usual(self, mock_logger):
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            override_settings(INERTIA_PRERENDER_DIR=directory),
+        ):
+            self.prerender("/props/")
+            [name] = os.listdir(directory)
+            with open(os.path.join(directory, name), "w") as file:
+                file.write('{"url": "/pro')
+
+            response = self.client.get("/props/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.prerendered)
+        mock_logger.exception.assert_called_once()
+
+    @override_settings(INERTIA_PRERENDER_CACHE_ALIAS=None)
+    def test_process_local_caches_are_refused(self):
+        with self.assertRaisesMessage(CommandError, "INERTIA_PRERENDER_DIR"):
+            self.prerender("/props/")
+
+        self.post.assert_not_called()
+
+    def test_failed_pages_are_reported_after_the_rest(self):
+        stderr = StringIO()
+
+        with self.assertRaisesMessage(CommandError, "2 of 3 pages failed"):
+            call_command(
+                "inertia_prerender",
+                "missing-view",
+                "/redirect/",
+                "/props/",
+                stdout=StringIO(),
+                stderr=stderr,
+            )
+
+        self.assertIn("no URL for view 'missing-view'", stderr.getvalue())
+        self.assertIn("did not return an Inertia page", stderr.getvalue())
+        self.assertIsNotNone(load_prerendered("/props/"))
+
+    def test_ssr_failures_fail_the_page(self):
+        self.post.side_effect = ValueError("boom")
+
+        with self.assertRaises(CommandError):
+            self.prerender("/props/")
+
+        self.assertIsNone(load_prerendered("/props/"))
@@ -1,6 +1,11 @@
-from django.test import override_settings
+from django.apps import apps
+from django.conf import settings as django_settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
 
+from inertia.settings import settings
 from inertia.test import InertiaTestCase
+from inertia.utils import InertiaJsonEncoder
 
 
 class SettingsTestCase(InertiaTestCase):
@@ -18,3 +23,72 @@ class SettingsTestCase(InertiaTestCase):
     def test_layout(self):
         response = self.client.get("/empty/")
         self.assertTemplateUsed(response, "layout.html")
+
+
+class SettingsSnapshotTestCase(SimpleTestCase):
+    def test_settings_are_resolved_once(self):
+        self.assertEqual(settings.INERTIA_VERSION, "1.0")
+
+        self.assertEqual(vars(settings)["INERTIA_VERSION"], "1.0")
+        self.assertEqual(vars(settings)["INERTIA_SSR_POOL_SIZE"], 10)
+
+    def test_snapshot_is_rebuilt_when_settings_change(self):
+        self.assertEqual(settings.INERTIA_VERSION, "1.0")
+
+        with override_settings(INERTIA_VERSION="2.0"):
+            self.assertEqual(settings.INERTIA_VERSION, "2.0")
+
+        self.assertEqual(settings.INERTIA_VERSION, "1.0")
+
+    def test_settings_are_read_only(self):
+        with self.assertRaises(AttributeError):
+            settings.INERTIA_VERSION = "2.0"
+
+    def test_layout_is_required(self):
+        with override_settings():
+            del django_settings.INERTIA_LAYOUT
+
+            with self.assertRaisesMessage(ImproperlyConfigured, "INERTIA_LAYOUT"):
+                settings.load()
+
+    @override_settings(INERTIA_LAYOUT="")
+    def test_layout_must_not_be_empty(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "INERTIA_LAYOUT"):
+            settings.load()
+
+    def test_unknown_names_are_missing(self):
+        self.assertFalse(hasattr(settings, "INERTIA_UNKNOWN"))
+
+    @override_settings(INERTIA_JSON_ENCODER="inertia.utils.InertiaJsonEncoder")
+    def test_json_encoder_accepts_a_dotted_path(self):
+        self.assertIs(settings.INERTIA_JSON_ENCODER, InertiaJsonEncoder)
+
+    @override_settings(INERTIA_SSR_POLICY="inertia.tests.test_ssr.ssr_for_crawlers")
+    def test_ssr_policy_accepts_a_dotted_path(self):
+        self.assertTrue(callable(settings.INERTIA_SSR_POLICY))
+
+    def test_misconfiguration_is_reported(self):
+        cases = {
+            "INERTIA_JSON_ENCODER": "inertia.utils.Missing",
+            "INERTIA_SSR_POLICY": 42,
+            "INERTIA_SSR_POOL_SIZE": 0,
+            "INERTIA_SSR_MAX_CONCURRENCY": "8",
+            "INERTIA_SSR_READ_TIMEOUT": -1,
+        }
+        for name, value in cases.items():
+            with (
+                self.subTest(name),
+                override_settings(**{name: value}),
+                self.assertRaisesMessage(ImproperlyConfigured, name),
+            ):
+                settings.load()
+
+    @override_settings(INERTIA_JSON_ENCODER=dict)
+    def test_json_encoder_must_be_an_encoder(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "JSONEncoder subclass"):
+            settings.load()
+
+    @override_settings(INERTIA_SSR_POOL_SIZE=0)
+    def test_misconfiguration_fails_at_startup(self):
+        with self.assertRaises(ImproperlyConfigured):
+            apps.get_app_config("inertia").ready()
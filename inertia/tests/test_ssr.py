@@ -1,18 +1,135 @@
+import asyncio
 import json
+import os
+import socketserver
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
 
-from django.test import override_settings
+import requests
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
 
+from inertia.ssr import (
+    Bulkhead,
+    CircuitBreaker,
+    CircuitOpen,
+    HttpTransport,
+    SSRBusy,
+    SSRClient,
+    SSRDeadlineExceeded,
+    SSRError,
+    SSRTransport,
+    UnixSocketTransport,
+    circuit_state_changed,
+    get_ssr_client,
+    get_transport_class,
+    render_page,
+)
 from inertia.test import InertiaTestCase, inertia_div, inertia_page
 
 
+class StubSSRHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        self.server.attempts += 1
+        time.sleep(self.server.latency)
+        length = int(self.headers["Content-Length"])
+        page = json.loads(self.rfile.read(length))
+        if not self.server.keep_alive:
+            # Close without saying so, like a server dropping idle connections.
+            self.close_connection = True
+        if self.server.attempts <= self.server.failures:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = json.dumps({"head": [], "body": page["component"]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if self.server.chunked:
+            # Like the Inertia SSR server, which streams its JSON.
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in (body[:10], body[10:]):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def address_string(self):
+        return "stub"
+
+    def log_message(self, *args):
+        pass
+
+
+class StubSSRServerMixin:
+    daemon_threads = True
+
+    def __init__(self, address, failures=0, chunked=False, latency=0, keep_alive=True):
+        super().__init__(address, StubSSRHandler)
+        self.keep_alive = keep_alive
+        self.latency = latency
+        self.connections = 0
+        self.attempts = 0
+        self.failures = failures
+        self.chunked = chunked
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, args=(0.01,), daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+    def handle_error(self, request, client_address):
+        # Clients that gave up on a slow render have hung up.
+        pass
+
+
+class StubSSRServer(StubSSRServerMixin, ThreadingHTTPServer):
+    def __init__(self, **kwargs):
+        super().__init__(("127.0.0.1", 0), **kwargs)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class UnixStubSSRServer(StubSSRServerMixin, socketserver.ThreadingUnixStreamServer):
+    def __init__(self, **kwargs):
+        self.directory = tempfile.TemporaryDirectory()
+        super().__init__(os.path.join(self.directory.name, "ssr.sock"), **kwargs)
+
+    @property
+    def url(self):
+        return f"unix://{self.server_address}"
+
+    def __exit__(self, *args):
+        super().__exit__(*args)
+        self.directory.cleanup()
+
+
 @override_settings(
     INERTIA_SSR_ENABLED=True,
     INERTIA_SSR_URL="ssr-url",
     INERTIA_VERSION="1.0",
 )
 class SSRTestCase(InertiaTestCase):
-    @patch("inertia.http.requests")
+    @patch("inertia.ssr.requests")
     def test_it_returns_ssr_calls(self, mock_request):
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -20,22 +137,23 @@ class SSRTestCase(InertiaTestCase):
             "head": "<title>Head works</title>",
         }
 
-        mock_request.post.return_value = mock_response
+        mock_request.Session.return_value.post.return_value = mock_response
 
         response = self.client.get("/props/")
 
-        mock_request.post.assert_called_once_with(
+        mock_request.Session.return_value.post.assert_called_once_with(
             "ssr-url/render",
             data=json.dumps(
                 inertia_page("props", props={"name": "Brandon", "sport": "Hockey"})
             ),
             headers={"Content-Type": "application/json"},
+            timeout=(1.0, 10.0),
         )
         self.assertTemplateUsed("inertia_ssr.html")
         self.assertContains(response, "<div>Body Works</div>")
         self.assertContains(response, "head--<title>Head works</title>--head")
 
-    @patch("inertia.http.requests")
+    @patch("inertia.ssr.requests")
     def test_it_returns_ssr_calls_with_template_data(self, mock_request):
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -43,7 +161,7 @@ class SSRTestCase(InertiaTestCase):
             "head": "<title>Head works</title>",
         }
 
-        mock_request.post.return_value = mock_response
+        mock_request.Session.return_value.post.return_value = mock_response
 
         response = self.client.get("/template_data/")
 
@@ -52,24 +170,24 @@ class SSRTestCase(InertiaTestCase):
         self.assertContains(response, "head--<title>Head works</title>--head")
         self.assertContains(response, "Brian, Basketball")
 
-    @patch("inertia.http.requests")
+    @patch("inertia.ssr.requests")
     def test_it_uses_inertia_if_inertia_requests_are_made(self, mock_requests):
         response = self.inertia.get("/props/")
 
-        mock_requests.post.assert_not_called()
+        mock_requests.Session.return_value.post.assert_not_called()
         self.assertJSONResponse(
             response,
             inertia_page("props", props={"name": "Brandon", "sport": "Hockey"}),
         )
 
-    @patch("inertia.http.requests")
+    @patch("inertia.ssr.requests")
     def test_it_fallsback_on_failure(self, mock_requests):
         def uh_oh(*args, **kwargs):
             raise ValueError()  # SSR errors are logged and fall back to client-side rendering
 
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = uh_oh
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         response = self.client.get("/props/")
         self.assertContains(
@@ -77,14 +195,699 @@ class SSRTestCase(InertiaTestCase):
         )
 
     @patch("inertia.http.logger")
-    @patch("inertia.http.requests")
+    @patch("inertia.ssr.requests")
     def test_it_logs_exception_on_ssr_failure(self, mock_requests, mock_logger):
         error = ValueError("SSR rendering failed")
 
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = error
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         self.client.get("/props/")
 
         mock_logger.exception.assert_called_once_with("SSR render request failed")
+
+
+class SSRTransportTestCase(SimpleTestCase):
+    page = '{"component": "Home"}'
+
+    def test_http_renders_reuse_one_pooled_connection(self):
+        with StubSSRServer() as server:
+            transport = HttpTransport(server.url, timeout=(1, 1))
+            results = [transport.post(self.page) for _ in range(3)]
+            transport.close()
+
+        self.assertEqual(results, [{"head": [], "body": "Home"}] * 3)
+        self.assertEqual(server.connections, 1)
+
+    def test_unavailable_responses_are_retried(self):
+        with StubSSRServer(failures=1) as server:
+            transport = HttpTransport(server.url, timeout=(1, 1), retries=1)
+            self.assertEqual(transport.post(self.page)["body"], "Home")
+            transport.close()
+
+        self.assertEqual(server.attempts, 2)
+
+    def test_session_is_recreated_after_a_fork(self):
+        transport = HttpTransport("http://ssr")
+        session = transport.session
+
+        self.assertIs(transport.session, session)
+        with patch("inertia.ssr.os.getpid", return_value=-1):
+            self.assertIsNot(transport.session, session)
+
+    def test_unix_socket_renders_keep_their_connection_alive(self):
+        with UnixStubSSRServer(chunked=True) as server:
+            transport = UnixSocketTransport(server.url, timeout=(1, 1))
+            results = [transport.post(self.page) for _ in range(3)]
+            transport.close()
+
+        self.assertEqual(results, [{"head": [], "body": "Home"}] * 3)
+        self.assertEqual(server.connections, 1)
+
+    def test_unix_socket_errors_are_raised(self):
+        with UnixStubSSRServer(failures=1) as server:
+            transport = UnixSocketTransport(server.url, timeout=(1, 1))
+            with self.assertRaises(SSRError):
+                transport.post(self.page)
+            transport.close()
+
+    def test_async_transports_read_plain_and_chunked_responses(self):
+        for server_class in (StubSSRServer, UnixStubSSRServer):
+            for chunked in (False, True):
+                with (
+                    self.subTest(server=server_class.__name__, chunked=chunked),
+                    server_class(chunked=chunked) as server,
+                ):
+                    transport = get_transport_class(server.url)(
+                        server.url, timeout=(1, 1)
+                    )
+                    result = async_to_sync(transport.apost)(self.page)
+
+                    self.assertEqual(result, {"head": [], "body": "Home"})
+
+    def test_async_renders_reuse_pooled_connections(self):
+        for server_class in (StubSSRServer, UnixStubSSRServer):
+            for chunked in (False, True):
+                with (
+                    self.subTest(server=server_class.__name__, chunked=chunked),
+                    server_class(chunked=chunked) as server,
+                ):
+                    transport = get_transport_class(server.url)(
+                        server.url, timeout=(1, 1)
+                    )
+
+                    async def render_three_times(transport):
+                        return [await transport.apost(self.page) for _ in range(3)]
+
+                    results = async_to_sync(render_three_times)(transport)
+
+                    self.assertEqual(results, [{"head": [], "body": "Home"}] * 3)
+                    self.assertEqual(server.connections, 1)
+
+    def test_async_unavailable_responses_are_retried(self):
+        with StubSSRServer(failures=1) as server:
+            transport = HttpTransport(server.url, timeout=(1, 1), retries=1)
+            result = async_to_sync(transport.apost)(self.page)
+
+        self.assertEqual(result["body"], "Home")
+        self.assertEqual(server.attempts, 2)
+
+    def test_async_renders_survive_closed_connections(self):
+        with UnixStubSSRServer(keep_alive=False) as server:
+            transport = UnixSocketTransport(server.url, timeout=(1, 1), retries=1)
+
+            async def render_twice():
+                return [await transport.apost(self.page) for _ in range(2)]
+
+            results = async_to_sync(render_twice)()
+
+        self.assertEqual(results, [{"head": [], "body": "Home"}] * 2)
+        self.assertEqual(server.connections, 2)
+
+    def test_transports_must_implement_post_and_apost(self):
+        class SyncOnlyTransport(SSRTransport):
+            def post(self, data):
+                return {}
+
+        with self.assertRaises(TypeError):
+            SyncOnlyTransport("http://ssr")
+
+    def test_async_errors_are_raised(self):
+        with StubSSRServer(failures=1) as server, self.assertRaises(SSRError):
+            async_to_sync(HttpTransport(server.url).apost)(self.page)
+
+    def test_transports_are_chosen_by_url_scheme(self):
+        self.assertIs(get_transport_class("http://ssr"), HttpTransport)
+        self.assertIs(get_transport_class("ssr-url"), HttpTransport)
+        self.assertIs(get_transport_class("unix:///run/ssr.sock"), UnixSocketTransport)
+        with override_settings(INERTIA_SSR_TRANSPORT="inertia.ssr.UnixSocketTransport"):
+            self.assertIs(get_transport_class("http://ssr"), UnixSocketTransport)
+
+    @override_settings(INERTIA_SSR_URL="http://one", INERTIA_SSR_POOL_SIZE=3)
+    def test_client_is_shared_and_rebuilt_when_settings_change(self):
+        client = get_ssr_client()
+
+        self.assertIs(get_ssr_client(), client)
+        transport = client.endpoints[0].transport
+        self.assertEqual((transport.url, transport.pool_size), ("http://one", 3))
+        with override_settings(INERTIA_SSR_URL="http://two"):
+            self.assertEqual(get_ssr_client().endpoints[0].url, "http://two")
+
+
+class AsyncSSRTestCase(InertiaTestCase):
+    def test_async_views_render_through_the_async_transport(self):
+        with (
+            UnixStubSSRServer(chunked=True) as server,
+            override_settings(INERTIA_SSR_ENABLED=True, INERTIA_SSR_URL=server.url),
+            patch.object(
+                UnixSocketTransport, "post", side_effect=AssertionError("sync")
+            ),
+        ):
+            response = self.client.get("/async/")
+
+        self.assertTemplateUsed("inertia_ssr.html")
+        self.assertContains(response, "TestComponent")
+
+    @patch("inertia.http.logger")
+    def test_async_views_fall_back_when_ssr_fails(self, mock_logger):
+        with (
+            UnixStubSSRServer(failures=1) as server,
+            override_settings(INERTIA_SSR_ENABLED=True, INERTIA_SSR_URL=server.url),
+        ):
+            response = self.client.get("/async/")
+
+        self.assertTemplateUsed("inertia.html")
+        self.assertContains(response, '<script data-page="app"')
+        mock_logger.exception.assert_called_once_with("SSR render request failed")
+
+
+@override_settings(
+    INERTIA_SSR_ENABLED=True,
+    INERTIA_SSR_URL="ssr-url",
+    INERTIA_SSR_CACHE=True,
+)
+class SSRCacheTestCase(InertiaTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def mock_ssr(self, mock_requests, body="<div>Body Works</div>"):
+        mock_response = Mock()
+        mock_response.json.return_value = {"body": body, "head": []}
+        mock_requests.Session.return_value.post.return_value = mock_response
+        return mock_requests.Session.return_value.post
+
+    @patch("inertia.ssr.requests")
+    def test_identical_pages_are_rendered_once(self, mock_requests):
+        post = self.mock_ssr(mock_requests)
+
+        self.client.get("/props/")
+        response = self.client.get("/props/")
+
+        self.assertContains(response, "<div>Body Works</div>")
+        post.assert_called_once()
+
+        self.client.get("/template_data/")
+        self.assertEqual(post.call_count, 2)
+
+    @patch("inertia.ssr.requests")
+    def test_versions_do_not_share_results(self, mock_requests):
+        post = self.mock_ssr(mock_requests)
+
+        self.client.get("/props/")
+        with override_settings(INERTIA_VERSION="2.0"):
+            self.client.get("/props/")
+
+        self.assertEqual(post.call_count, 2)
+
+    @override_settings(INERTIA_SSR_CACHE_MAX_SIZE=10)
+    @patch("inertia.ssr.requests")
+    def test_results_over_the_size_cap_are_not_cached(self, mock_requests):
+        post = self.mock_ssr(mock_requests)
+
+        self.client.get("/props/")
+        self.client.get("/props/")
+
+        self.assertEqual(post.call_count, 2)
+
+    @patch("inertia.ssr.requests")
+    def test_failures_are_not_cached(self, mock_requests):
+        post = self.mock_ssr(mock_requests)
+        post.return_value.raise_for_status.side_effect = ValueError()
+
+        self.client.get("/props/")
+        self.client.get("/props/")
+
+        self.assertEqual(post.call_count, 2)
+
+
+class CircuitBreakerTestCase(SimpleTestCase):
+    def setUp(self):
+        self.now = 1000.0
+        clock = patch("inertia.ssr.time.monotonic", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def fail(self, breaker, times=1):
+        for _ in range(times):
+            breaker.before_call()
+            breaker.record_failure()
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("ssr", failure_threshold=3)
+
+        self.fail(breaker, 2)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.fail(breaker)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpen):
+            breaker.before_call()
+        self.assertEqual(breaker.stats()["rejected"], 1)
+
+    def test_opens_when_the_failure_rate_is_exceeded(self):
+        breaker = CircuitBreaker(
+            "ssr", failure_threshold=10, failure_rate=0.5, window=4
+        )
+
+        for succeeded in (True, False, True, False):
+            breaker.before_call()
+            if succeeded:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_lets_one_probe_through_after_the_cooldown(self):
+        breaker = CircuitBreaker("ssr", failure_threshold=1, cooldown=30)
+        self.fail(breaker)
+
+        self.now += 30
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        breaker.before_call()
+        with self.assertRaises(CircuitOpen):
+            breaker.before_call()
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_failed_probes_reopen_the_circuit(self):
+        breaker = CircuitBreaker("ssr", failure_threshold=1, cooldown=30)
+        self.fail(breaker)
+        self.now += 30
+
+        self.fail(breaker)
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_released_probes_let_another_call_through(self):
+        breaker = CircuitBreaker("ssr", failure_threshold=1, cooldown=30)
+        self.fail(breaker)
+        self.now += 30
+
+        breaker.before_call()
+        breaker.release_probe()
+        breaker.before_call()
+
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+
+    def test_state_changes_are_signalled(self):
+        changes = []
+
+        def receiver(breaker, old_state, new_state, **kwargs):
+            changes.append((old_state, new_state, breaker.state))
+
+        circuit_state_changed.connect(receiver)
+        self.addCleanup(circuit_state_changed.disconnect, receiver)
+        breaker = CircuitBreaker("ssr", failure_threshold=1, cooldown=30)
+
+        self.fail(breaker)
+        self.now += 30
+        breaker.before_call()
+        breaker.record_success()
+
+        self.assertEqual(
+            changes,
+            [
+                ("closed", "open", "open"),
+                ("open", "half_open", "half_open"),
+                ("half_open", "closed", "closed"),
+            ],
+        )
+
+
+@override_settings(
+    INERTIA_SSR_ENABLED=True,
+    INERTIA_SSR_URL="ssr-url",
+    INERTIA_SSR_FAILURE_THRESHOLD=2,
+)
+class SSRCircuitBreakerTestCase(InertiaTestCase):
+    @patch("inertia.http.logger")
+    @patch("inertia.ssr.requests")
+    def test_open_circuit_skips_ssr_without_logging(self, mock_requests, mock_logger):
+        post = mock_requests.Session.return_value.post
+        post.side_effect = ConnectionError()
+
+        for _ in range(3):
+            response = self.client.get("/props/")
+
+        self.assertContains(
+            response, inertia_div("props", props={"name": "Brandon", "sport": "Hockey"})
+        )
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(mock_logger.exception.call_count, 2)
+        self.assertEqual(
+            get_ssr_client().endpoints[0].breaker.state, CircuitBreaker.OPEN
+        )
+
+    @override_settings(INERTIA_SSR_CIRCUIT_BREAKER=False)
+    @patch("inertia.ssr.requests")
+    def test_breaker_can_be_disabled(self, mock_requests):
+        post = mock_requests.Session.return_value.post
+        post.side_effect = ConnectionError()
+
+        for _ in range(3):
+            self.client.get("/props/")
+
+        self.assertEqual(post.call_count, 3)
+
+
+class SSRDeadlineTestCase(InertiaTestCase):
+    def ssr_settings(self, server, **settings):
+        return override_settings(
+            INERTIA_SSR_ENABLED=True, INERTIA_SSR_URL=server.url, **settings
+        )
+
+    @patch("inertia.http.logger")
+    def test_slow_renders_fall_back_to_client_side_rendering(self, mock_logger):
+        with (
+            StubSSRServer(latency=1) as server,
+            self.ssr_settings(server, INERTIA_SSR_DEADLINE=0.05),
+        ):
+            started = time.monotonic()
+            response = self.client.get("/props/")
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertContains(
+            response, inertia_div("props", props={"name": "Brandon", "sport": "Hockey"})
+        )
+        self.assertEqual(response.ssr_fallback, "deadline")
+        mock_logger.warning.assert_called_once()
+        mock_logger.exception.assert_not_called()
+
+    def test_renders_within_the_deadline_are_used(self):
+        with (
+            StubSSRServer() as server,
+            self.ssr_settings(server, INERTIA_SSR_DEADLINE=5),
+        ):
+            response = self.client.get("/props/")
+
+        self.assertTemplateUsed("inertia_ssr.html")
+        self.assertIsNone(response.ssr_fallback)
+
+    def test_views_can_set_their_own_deadline(self):
+        with StubSSRServer(latency=1) as server, self.ssr_settings(server):
+            response = self.client.get("/ssr-deadline/")
+
+        self.assertEqual(response.ssr_fallback, "deadline")
+
+    def test_async_views_respect_the_deadline(self):
+        with (
+            StubSSRServer(latency=1) as server,
+            self.ssr_settings(server, INERTIA_SSR_DEADLINE=0.05),
+        ):
+            response = self.client.get("/async/")
+
+        self.assertTemplateUsed("inertia.html")
+        self.assertEqual(response.ssr_fallback, "deadline")
+
+    def test_abandoned_renders_are_not_queued(self):
+        with (
+            StubSSRServer(latency=0.3) as server,
+            self.ssr_settings(server, INERTIA_SSR_POOL_SIZE=1),
+        ):
+            with self.assertRaises(SSRDeadlineExceeded):
+                render_page('{"component": "Home"}', deadline=0.01)
+            for _ in range(5):
+                with self.assertRaises(SSRBusy):
+                    render_page('{"component": "Home"}', deadline=0.01)
+            time.sleep(0.5)
+
+            self.assertEqual(server.attempts, 1)
+            # The worker is free again once the abandoned render finishes.
+            self.assertEqual(
+                render_page('{"component": "Home"}', deadline=5),
+                {
+                    "head": [],
+                    "body": "Home",
+                },
+            )
+
+
+class BulkheadTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_renders_beyond_the_limit_are_rejected(self):
+        bulkhead = Bulkhead(max_concurrency=1, queue_timeout=0.01)
+
+        with bulkhead.slot(), self.assertRaises(SSRBusy), bulkhead.slot():
+            pass
+        with bulkhead.slot():
+            pass
+
+        self.assertEqual(bulkhead.rejected, 1)
+
+    def test_waiting_renders_get_freed_slots(self):
+        bulkhead = Bulkhead(max_concurrency=1, queue_timeout=1)
+        entered = threading.Event()
+
+        def hold():
+            with bulkhead.slot():
+                entered.set()
+                time.sleep(0.05)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        entered.wait()
+        with bulkhead.slot():
+            pass
+        thread.join()
+
+        self.assertEqual(bulkhead.rejected, 0)
+
+    def test_global_limit_is_shared_through_the_cache(self):
+        # Two bulkheads stand in for two worker processes.
+        first = Bulkhead(max_global=1, queue_timeout=0.01)
+        second = Bulkhead(max_global=1, queue_timeout=0.01)
+
+        with first.slot(), self.assertRaises(SSRBusy), second.slot():
+            pass
+        with second.slot():
+            self.assertEqual(second.global_in_flight(), 1)
+
+        self.assertEqual(second.global_in_flight(), 0)
+
+    def test_async_slots_are_limited_too(self):
+        bulkhead = Bulkhead(max_concurrency=1, max_global=5, queue_timeout=0.01)
+
+        async def render_twice():
+            async with bulkhead.aslot(), bulkhead.aslot():
+                pass
+
+        with self.assertRaises(SSRBusy):
+            async_to_sync(render_twice)()
+        self.assertEqual(bulkhead.global_in_flight(), 0)
+
+    def test_leaked_global_slots_expire_under_traffic(self):
+        leaking = Bulkhead(max_global=1, queue_timeout=0.01, global_timeout=0.2)
+        # A worker killed mid-render never releases its slot.
+        leaked = leaking.slot()
+        leaked.__enter__()
+
+        bulkhead = Bulkhead(max_global=1, queue_timeout=0.01, global_timeout=0.2)
+        started = time.monotonic()
+        while time.monotonic() - started < 0.15:
+            with self.assertRaises(SSRBusy), bulkhead.slot():
+                pass
+        time.sleep(0.1)
+
+        with bulkhead.slot():
+            self.assertEqual(bulkhead.global_in_flight(), 1)
+        self.assertEqual(bulkhead.global_in_flight(), 0)
+
+
+@override_settings(
+    INERTIA_SSR_ENABLED=True,
+    INERTIA_SSR_URL="ssr-url",
+    INERTIA_SSR_MAX_CONCURRENCY=1,
+    INERTIA_SSR_QUEUE_TIMEOUT=0.01,
+)
+class SSRBulkheadTestCase(InertiaTestCase):
+    @patch("inertia.http.logger")
+    @patch("inertia.ssr.requests")
+    def test_busy_renders_fall_back_immediately(self, mock_requests, mock_logger):
+        bulkhead = get_ssr_client().bulkhead
+
+        with bulkhead.slot():
+            response = self.client.get("/props/")
+
+        self.assertEqual(response.ssr_fallback, "busy")
+        mock_requests.Session.return_value.post.assert_not_called()
+        mock_logger.exception.assert_not_called()
+        self.assertEqual(
+            get_ssr_client().endpoints[0].breaker.state, CircuitBreaker.CLOSED
+        )
+
+
+class SSREndpointsTestCase(SimpleTestCase):
+    page = '{"component": "Home"}'
+
+    def setUp(self):
+        self.servers = [StubSSRServer() for _ in range(3)]
+        for server in self.servers:
+            self.enterContext(server)
+
+    def make_client(self, **settings):
+        with override_settings(
+            INERTIA_SSR_URL=[server.url for server in self.servers],
+            INERTIA_SSR_RETRIES=0,
+            **settings,
+        ):
+            client = SSRClient.from_settings()
+        self.addCleanup(client.close)
+        return client
+
+    def test_renders_take_turns_across_idle_endpoints(self):
+        client = self.make_client()
+
+        for _ in range(6):
+            client.render(self.page)
+
+        self.assertEqual([server.attempts for server in self.servers], [2, 2, 2])
+
+    def test_least_busy_endpoint_is_chosen(self):
+        client = self.make_client()
+        client.endpoints[0].in_flight = 2
+        client.endpoints[1].in_flight = 1
+
+        for _ in range(3):
+            client.render(self.page)
+
+        self.assertEqual([server.attempts for server in self.servers], [0, 0, 3])
+
+    def test_failing_endpoints_are_ejected_and_readmitted(self):
+        client = self.make_client(
+            INERTIA_SSR_FAILURE_THRESHOLD=1, INERTIA_SSR_COOLDOWN=30
+        )
+        self.servers[0].failures = 1
+
+        with self.assertRaises(requests.HTTPError):
+            client.render(self.page)
+        for _ in range(4):
+            client.render(self.page)
+
+        self.assertEqual(self.servers[0].attempts, 1)
+        self.assertEqual(self.servers[1].attempts + self.servers[2].attempts, 4)
+        with patch("inertia.ssr.time.monotonic", return_value=time.monotonic() + 30):
+            for _ in range(3):
+                client.render(self.page)
+        self.assertGreater(self.servers[0].attempts, 1)
+
+    def test_every_endpoint_unavailable_opens_the_client(self):
+        client = self.make_client(INERTIA_SSR_FAILURE_THRESHOLD=1)
+        for server in self.servers:
+            server.failures = 1
+
+        for _ in range(3):
+            with self.assertRaises(requests.HTTPError):
+                client.render(self.page)
+
+        with self.assertRaises(CircuitOpen):
+            client.render(self.page)
+
+    def test_stats_are_reported_per_endpoint(self):
+        client = self.make_client(INERTIA_SSR_FAILURE_THRESHOLD=1)
+        self.servers[0].failures = 1
+
+        with self.assertRaises(requests.HTTPError):
+            client.render(self.page)
+
+        stats = client.stats()
+        self.assertEqual(
+            [endpoint["url"] for endpoint in stats],
+            [server.url for server in self.servers],
+        )
+        self.assertEqual(
+            [endpoint["circuit"]["state"] for endpoint in stats],
+            [CircuitBreaker.OPEN, CircuitBreaker.CLOSED, CircuitBreaker.CLOSED],
+        )
+        self.assertEqual([endpoint["in_flight"] for endpoint in stats], [0, 0, 0])
+
+    def test_cancelled_renders_release_the_endpoint(self):
+        server = self.servers[0]
+        with override_settings(
+            INERTIA_SSR_URL=server.url,
+            INERTIA_SSR_RETRIES=0,
+            INERTIA_SSR_FAILURE_THRESHOLD=1,
+        ):
+            client = SSRClient.from_settings()
+        self.addCleanup(client.close)
+        server.failures = 1
+        with self.assertRaises(requests.HTTPError):
+            client.render(self.page)
+        # Skip the cooldown so the next render is the half-open probe.
+        client.endpoints[0].breaker.opened_at -= 3600
+
+        async def abandon_render():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.arender(self.page), 0.05)
+
+        server.latency = 1
+        async_to_sync(abandon_render)()
+        server.latency = 0
+
+        self.assertEqual(client.stats()[0]["in_flight"], 0)
+        self.assertEqual(client.render(self.page), {"head": [], "body": "Home"})
+        self.assertEqual(client.stats()[0]["circuit"]["state"], CircuitBreaker.CLOSED)
+
+
+def ssr_for_crawlers(request, component):
+    return "bot" in request.headers.get("User-Agent", "").lower()
+
+
+@override_settings(
+    INERTIA_SSR_ENABLED=True,
+    INERTIA_SSR_URL="ssr-url",
+    INERTIA_SSR_POLICY="inertia.tests.test_ssr.ssr_for_crawlers",
+)
+class SSRPolicyTestCase(InertiaTestCase):
+    def mock_ssr(self, mock_requests):
+        mock_response = Mock()
+        mock_response.json.return_value = {"body": "<div>SSR</div>", "head": []}
+        mock_requests.Session.return_value.post.return_value = mock_response
+        return mock_requests.Session.return_value.post
+
+    @patch("inertia.ssr.requests")
+    def test_policy_decides_per_request(self, mock_requests):
+        post = self.mock_ssr(mock_requests)
+
+        response = self.client.get("/props/")
+        self.assertNotContains(response, "<div>SSR</div>")
+        self.assertIsNone(response.ssr_fallback)
+        post.assert_not_called()
+
+        response = self.client.get("/props/", HTTP_USER_AGENT="Googlebot/2.1")
+        self.assertContains(response, "<div>SSR</div>")
+
+    @patch("inertia.ssr.requests")
+    def test_policy_can_be_a_callable_of_the_component(self, mock_requests):
+        self.mock_ssr(mock_requests)
+
+        with override_settings(
+            INERTIA_SSR_POLICY=lambda request, component: component == "Other"
+        ):
+            response = self.client.get("/props/")
+
+        self.assertNotContains(response, "<div>SSR</div>")
+
+    @patch("inertia.ssr.requests")
+    def test_views_override_the_policy(self, mock_requests):
+        post = self.mock_ssr(mock_requests)
+
+        response = self.client.get("/always-ssr/")
+        self.assertContains(response, "<div>SSR</div>")
+
+        response = self.client.get("/no-ssr/", HTTP_USER_AGENT="Googlebot/2.1")
+        self.assertNotContains(response, "<div>SSR</div>")
+        post.assert_called_once()
+
+    @override_settings(INERTIA_SSR_ENABLED=False)
+    @patch("inertia.ssr.requests")
+    def test_ssr_enabled_is_still_the_master_switch(self, mock_requests):
+        post = self.mock_ssr(mock_requests)
+
+        self.client.get("/always-ssr/")
+
+        post.assert_not_called()
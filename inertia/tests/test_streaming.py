@@ -0,0 +1,68 @@
+from unittest.mock import Mock, patch
+
+from django.test import override_settings
+
+from inertia.test import InertiaTestCase, inertia_div, inertia_page
+
+ROWS = [{"id": i, "note": "<b>R&D</b>"} for i in range(20)]
+
+
+class StreamingResponseTestCase(InertiaTestCase):
+    """InertiaStreamingResponse encodes and escapes the page in chunks."""
+
+    def test_inertia_requests_stream_the_page_json(self):
+        response = self.inertia.get("/streaming/")
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response.headers["Content-Type"], "application/json")
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+
+        self.assertGreater(len(chunks), 1)
+        content = "".join(chunks)
+        self.assertNotIn("<", content)
+        self.assertIn("\\u003cb\\u003eR\\u0026D\\u003c/b\\u003e", content)
+        self.assertEqual(
+            content.encode(),
+            self.client.get("/streaming/", HTTP_X_INERTIA=True).getvalue(),
+        )
+
+    def test_first_load_streams_the_layout_around_the_page(self):
+        response = self.client.get("/streaming/")
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertIn(
+            inertia_div(
+                "streaming",
+                props={"rows": ROWS, "total": 20},
+                template_data={"name": "Brian", "sport": "Basketball"},
+            ),
+            content,
+        )
+        self.assertIn("template data:Brian, Basketball", content)
+
+    def test_page_helpers_read_streamed_pages(self):
+        self.client.get("/streaming/")
+
+        self.assertEqual(self.props(), {"rows": ROWS, "total": 20})
+        self.assertComponentUsed("TestComponent")
+
+        self.inertia.get("/streaming/")
+        self.assertEqual(
+            self.page(),
+            inertia_page("streaming", props={"rows": ROWS, "total": 20}),
+        )
+
+    @override_settings(INERTIA_SSR_ENABLED=True, INERTIA_SSR_URL="ssr-url")
+    @patch("inertia.ssr.requests")
+    def test_ssr_first_loads_render_in_one_piece(self, mock_requests):
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "body": "<div>Body Works</div>",
+            "head": "<title>Head works</title>",
+        }
+        mock_requests.Session.return_value.post.return_value = mock_response
+
+        response = self.client.get("/streaming/")
+
+        self.assertIn(b"<div>Body Works</div>", response.getvalue())
+        mock_requests.Session.return_value.post.assert_called_once()
@@ -0,0 +1,132 @@
+import pickle
+from unittest.mock import patch
+
+from django.http import HttpResponse
+from django.template.response import ContentNotRenderedError
+from django.test import RequestFactory, override_settings
+
+from inertia import InertiaTemplateResponse
+from inertia.test import InertiaTestCase, inertia_div, inertia_page
+from inertia.tests import settings as test_settings
+
+
+class ChangePropsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_template_response(self, request, response):
+        response.props["sport"] = "Basketball"
+        return response
+
+
+class ReplacedResponse(HttpResponse):
+    def render(self):
+        return self
+
+
+class ReplaceResponseMiddleware(ChangePropsMiddleware):
+    def process_template_response(self, request, response):
+        return ReplacedResponse("replaced")
+
+
+class TemplateResponseTestCase(InertiaTestCase):
+    def request(self, **headers):
+        request = RequestFactory().get("/template-response/", headers=headers)
+        request.session = {}
+        return request
+
+    def test_pages_are_rendered_by_django(self):
+        response = self.inertia.get("/template-response/")
+
+        self.assertTrue(response.is_rendered)
+        self.assertJSONResponse(
+            response,
+            inertia_page(
+                "template-response",
+                props={"name": "Brandon", "sport": "Hockey"},
+            ),
+        )
+
+    def test_first_loads_are_rendered_by_django(self):
+        response = self.client.get("/template-response/")
+
+        self.assertContains(
+            response,
+            inertia_div(
+                "template-response",
+                props={"name": "Brandon", "sport": "Hockey"},
+            ),
+        )
+
+    def test_async_views_are_rendered_by_django(self):
+        response = self.inertia.get("/async-template-response/")
+
+        self.assertEqual(
+            response.json()["props"], {"name": "Brandon", "sport": "Hockey"}
+        )
+
+    def test_nothing_is_resolved_until_rendered(self):
+        with patch("inertia.http.PropsResolver.resolve") as resolve:
+            response = InertiaTemplateResponse(
+                self.request(X_Inertia="true"), "TestComponent", {"name": "Brandon"}
+            )
+
+            resolve.assert_not_called()
+            self.assertFalse(response.is_rendered)
+            with self.assertRaises(ContentNotRenderedError):
+                _ = response.content
+
+        self.assertEqual(response.headers["X-Inertia"], "true")
+        self.assertEqual(response.headers["Content-Type"], "application/json")
+
+    def test_rendering_happens_once(self):
+        response = InertiaTemplateResponse(
+            self.request(X_Inertia="true"), "TestComponent", {"name": "Brandon"}
+        )
+
+        with patch.object(
+            InertiaTemplateResponse, "build_content", return_value="{}"
+        ) as build_content:
+            response.render()
+            response.render()
+
+        build_content.assert_called_once_with()
+
+    @override_settings(
+        MIDDLEWARE=[
+            *test_settings.MIDDLEWARE,
+            "inertia.tests.test_template_response.ChangePropsMiddleware",
+        ]
+    )
+    def test_middleware_can_change_props_before_rendering(self):
+        response = self.inertia.get("/template-response/")
+
+        self.assertEqual(
+            response.json()["props"], {"name": "Brandon", "sport": "Basketball"}
+        )
+
+    @override_settings(
+        MIDDLEWARE=[
+            *test_settings.MIDDLEWARE,
+            "inertia.tests.test_template_response.ReplaceResponseMiddleware",
+        ]
+    )
+    def test_replaced_responses_are_never_rendered(self):
+        with patch("inertia.http.PropsResolver.resolve") as resolve:
+            response = self.inertia.get("/template-response/")
+
+        resolve.assert_not_called()
+        self.assertEqual(response.content, b"replaced")
+
+    def test_rendered_responses_can_be_pickled(self):
+        response = InertiaTemplateResponse(
+            self.request(X_Inertia="true"), "TestComponent", {"name": "Brandon"}
+        )
+        response.render()
+
+        restored = pickle.loads(pickle.dumps(response))
+
+        self.assertEqual(restored.content, response.content)
@@ -31,6 +31,19 @@ class V3PropsCompatibilityTestCase(InertiaTestCase):
             page["onceProps"], {"locale": {"prop": "config.locale", "expiresAt": None}}
         )
 
+    def test_partial_only_and_except_combine_on_nested_paths(self):
+        page = self.inertia.get(
+            "/v3/nested/",
+            HTTP_X_INERTIA_PARTIAL_COMPONENT="TestComponent",
+            HTTP_X_INERTIA_PARTIAL_DATA="user,config.timezone",
+            HTTP_X_INERTIA_PARTIAL_EXCEPT="user.token",
+        ).json()
+
+        self.assertEqual(
+            page["props"],
+            {"config": {"timezone": "UTC"}, "user": {"name": "Brandon"}},
+        )
+
     def test_merge_prepend_does_not_require_append_false(self):
         nested = merge(lambda: [], prepend="items")
         root = merge(lambda: [], prepend=True)
@@ -1,7 +1,73 @@
 import json
 
+from django.test import RequestFactory, SimpleTestCase
+
+from inertia.http import InertiaProtocol, InertiaRequest
 from inertia.test import InertiaTestCase, inertia_page
 
+# ---------------------------------------------------------------------------
+# Parsed protocol state
+# ---------------------------------------------------------------------------
+
+
+class InertiaProtocolTestCase(SimpleTestCase):
+    """Tests for the per-request InertiaProtocol state object."""
+
+    def test_headers_are_parsed_once(self):
+        request = RequestFactory().get(
+            "/",
+            HTTP_X_INERTIA="true",
+            HTTP_X_INERTIA_VERSION="2.0",
+            HTTP_X_INERTIA_PARTIAL_COMPONENT="TestComponent",
+            HTTP_X_INERTIA_PARTIAL_DATA="name, items,",
+            HTTP_X_INERTIA_RESET="items",
+            HTTP_X_INERTIA_EXCEPT_ONCE_PROPS="plans,locale",
+            HTTP_X_INERTIA_INFINITE_SCROLL_MERGE_INTENT="prepend",
+            HTTP_PURPOSE="prefetch",
+        )
+        protocol = InertiaProtocol.for_request(request)
+
+        self.assertEqual(
+            protocol,
+            InertiaProtocol(
+                is_inertia=True,
+                version="2.0",
+                partial_component="TestComponent",
+                partial_keys=("name", "items"),
+                partial_except_keys=None,
+                reset_keys=frozenset({"items"}),
+                except_once_prop_keys=frozenset({"plans", "locale"}),
+                merge_intent="prepend",
+                is_prefetch=True,
+                reset_keys_in_order=("items",),
+                except_once_prop_keys_in_order=("plans", "locale"),
+            ),
+        )
+        self.assertIs(InertiaProtocol.for_request(request), protocol)
+        self.assertIs(InertiaRequest(request).protocol, protocol)
+
+    def test_request_key_lists_keep_the_header_order(self):
+        request = InertiaRequest(
+            RequestFactory().get(
+                "/",
+                HTTP_X_INERTIA_RESET="posts, comments, authors",
+                HTTP_X_INERTIA_EXCEPT_ONCE_PROPS="zones,plans,locale",
+            )
+        )
+
+        self.assertEqual(request.reset_keys(), ["posts", "comments", "authors"])
+        self.assertEqual(request.except_once_prop_keys(), ["zones", "plans", "locale"])
+
+    def test_plain_requests_have_empty_state(self):
+        protocol = InertiaProtocol.for_request(RequestFactory().get("/"))
+
+        self.assertFalse(protocol.is_inertia)
+        self.assertIsNone(protocol.version)
+        self.assertIsNone(protocol.partial_keys)
+        self.assertFalse(protocol.is_partial_render("TestComponent"))
+        self.assertEqual(protocol.merge_intent, "append")
+
+
 # ---------------------------------------------------------------------------
 # preserveFragment
 # ---------------------------------------------------------------------------
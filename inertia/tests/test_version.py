@@ -0,0 +1,154 @@
+import hashlib
+import os
+import tempfile
+from unittest.mock import Mock, patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from inertia.test import InertiaTestCase
+from inertia.version import get_version
+
+
+class VersionTestCase(InertiaTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.manifest = os.path.join(directory.name, "manifest.json")
+        self.write_manifest('{"app.js": "app-1234.js"}')
+
+    def write_manifest(self, content):
+        with open(self.manifest, "w") as file:
+            file.write(content)
+        return hashlib.md5(content.encode()).hexdigest()
+
+    def test_static_versions_are_used_as_is(self):
+        self.assertEqual(get_version(), "1.0")
+
+    @override_settings(INERTIA_VERSION_CHECK_INTERVAL=60)
+    def test_callables_are_called_once_per_interval(self):
+        version = Mock(return_value="abc")
+
+        with override_settings(INERTIA_VERSION=version):
+            self.assertEqual(get_version(), "abc")
+            self.assertEqual(get_version(), "abc")
+
+        version.assert_called_once_with()
+
+    @override_settings(INERTIA_VERSION_CHECK_INTERVAL=0)
+    def test_callables_are_called_again_after_the_interval(self):
+        version = Mock(side_effect=["abc", "def"])
+
+        with override_settings(INERTIA_VERSION=version):
+            self.assertEqual(get_version(), "abc")
+            self.assertEqual(get_version(), "def")
+
+    def test_manifests_are_hashed(self):
+        expected = hashlib.md5(b'{"app.js": "app-1234.js"}').hexdigest()
+
+        with override_settings(INERTIA_VERSION_MANIFEST=self.manifest):
+            self.assertEqual(get_version(), expected)
+
+    @override_settings(INERTIA_VERSION_CHECK_INTERVAL=0)
+    def test_manifests_are_only_hashed_again_when_they_change(self):
+        with (
+            override_settings(INERTIA_VERSION_MANIFEST=self.manifest),
+            patch("inertia.version.hashlib", wraps=hashlib) as mock_hashlib,
+        ):
+            get_version()
+            get_version()
+            self.assertEqual(mock_hashlib.md5.call_count, 1)
+
+            version = self.write_manifest('{"app.js": "app-5678.js"}')
+
+            self.assertEqual(get_version(), version)
+            self.assertEqual(mock_hashlib.md5.call_count, 2)
+
+    @override_settings(INERTIA_VERSION_CHECK_INTERVAL=60)
+    def test_manifests_are_checked_once_per_interval(self):
+        with override_settings(INERTIA_VERSION_MANIFEST=self.manifest):
+            version = get_version()
+            self.write_manifest('{"app.js": "app-5678.js"}')
+
+            self.assertEqual(get_version(), version)
+
+    @override_settings(INERTIA_VERSION_CHECK_INTERVAL=0)
+    def test_the_last_version_is_kept_while_the_manifest_is_missing(self):
+        with override_settings(INERTIA_VERSION_MANIFEST=self.manifest):
+            version = get_version()
+            os.remove(self.manifest)
+
+            with self.assertLogs("inertia.version", "WARNING"):
+                self.assertEqual(get_version(), version)
+
+    def test_a_missing_manifest_is_improperly_configured(self):
+        os.remove(self.manifest)
+
+        with (
+            override_settings(INERTIA_VERSION_MANIFEST=self.manifest),
+            self.assertRaisesMessage(ImproperlyConfigured, self.manifest),
+        ):
+            get_version()
+
+    def test_the_version_is_used_for_pages_and_stale_checks(self):
+        with override_settings(INERTIA_VERSION_MANIFEST=self.manifest):
+            version = get_version()
+
+            response = self.inertia.get("/empty/", HTTP_X_INERTIA_VERSION=version)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["version"], version)
+
+            response = self.inertia.get("/empty/", HTTP_X_INERTIA_VERSION="1.0")
+            self.assertEqual(response.status_code, 409)
+
+
+class VersionGraceTestCase(InertiaTestCase):
+    @override_settings(INERTIA_VERSION="2.0", INERTIA_COMPATIBLE_VERSIONS=["1.0"])
+    def test_compatible_versions_are_served(self):
+        response = self.inertia.get("/empty/", HTTP_X_INERTIA_VERSION="1.0")
+
+        self.assertEqual(response.status_code, 200)
+        # The client keeps its version, so it is refreshed once it's dropped.
+        self.assertEqual(response.json()["version"], "1.0")
+
+    @override_settings(INERTIA_VERSION="2.0", INERTIA_COMPATIBLE_VERSIONS=["1.0"])
+    def test_other_versions_are_still_stale(self):
+        response = self.inertia.get("/empty/", HTTP_X_INERTIA_VERSION="0.9")
+
+        self.assertEqual(response.status_code, 409)
+
+    @override_settings(INERTIA_VERSION="2.0", INERTIA_COMPATIBLE_VERSIONS=["1.0"])
+    def test_current_clients_get_the_current_version(self):
+        response = self.inertia.get("/empty/", HTTP_X_INERTIA_VERSION="2.0")
+
+        self.assertEqual(response.json()["version"], "2.0")
+
+    @override_settings(INERTIA_VERSION="2.0", INERTIA_VERSION_GRACE_PERIOD=60)
+    def test_reloads_are_spread_over_the_grace_period(self):
+        with patch("inertia.version.time.monotonic", return_value=1000):
+            # The first stale request starts the grace period.
+            with patch("inertia.version.random.random", return_value=0.0):
+                response = self.inertia.get("/empty/", HTTP_X_INERTIA_VERSION="1.0")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["version"], "1.0")
+
+        with (
+            patch("inertia.version.time.monotonic", return_value=1030),
+            patch("inertia.version.random.random", side_effect=[0.4, 0.6]),
+        ):
+            # Halfway through, half of the stale requests are reloaded.
+            response = self.inertia.get("/empty/", HTTP_X_INERTIA_VERSION="1.0")
+            self.assertEqual(response.status_code, 409)
+            response = self.inertia.get("/empty/", HTTP_X_INERTIA_VERSION="1.0")
+            self.assertEqual(response.status_code, 200)
+
+        with patch("inertia.version.time.monotonic", return_value=1060):
+            response = self.inertia.get("/empty/", HTTP_X_INERTIA_VERSION="1.0")
+            self.assertEqual(response.status_code, 409)
+
+    @override_settings(INERTIA_VERSION="2.0", INERTIA_COMPATIBLE_VERSIONS=["1.0"])
+    def test_only_gets_are_tolerated(self):
+        response = self.inertia.post("/empty/", HTTP_X_INERTIA_VERSION="1.0")
+
+        self.assertNotIn("_inertia_version", vars(response.wsgi_request))
@@ -8,8 +8,11 @@ urlpatterns = [
     path("messages/", views.messages_test),
     path("no-messages/", views.no_messages_test),
     path("redirect/", views.redirect_test),
-    path("props/", views.props_test),
+    path("props/", views.props_test, name="props"),
     path("template_data/", views.template_data_test),
+    path("ssr-deadline/", views.ssr_deadline_test),
+    path("no-ssr/", views.no_ssr_test),
+    path("always-ssr/", views.always_ssr_test),
     path("lazy/", views.lazy_test),
     path("optional/", views.optional_test),
     path("defer/", views.defer_test),
@@ -42,4 +45,18 @@ urlpatterns = [
     path("v3/scroll/", views.v3_scroll_test),
     path("v3/deferred-scroll/", views.v3_deferred_scroll_test),
     path("v3/deferred-once/", views.v3_deferred_once_test),
+    path("parallel/", views.parallel_test),
+    path("parallel-setting/", views.parallel_setting_test),
+    path("async/", views.async_props_test),
+    path("async-redirect/", views.async_redirect_test),
+    path("arender/", views.arender_test),
+    path("sync-async-props/", views.sync_view_async_props_test),
+    path("batch/", views.batch_test),
+    path("async-batch/", views.async_batch_test),
+    path("cached-batch/", views.cached_batch_test),
+    path("cached/", views.cached_test),
+    path("stale-cached/", views.stale_cached_test),
+    path("streaming/", views.streaming_test),
+    path("template-response/", views.template_response_test),
+    path("async-template-response/", views.async_template_response_test),
 ]
@@ -1,10 +1,17 @@
+import asyncio
+import threading
+
 from django.contrib import messages
 from django.http.response import HttpResponse
 from django.shortcuts import redirect
 from django.utils.decorators import decorator_from_middleware
 
 from inertia import (
+    InertiaStreamingResponse,
     always,
+    arender,
+    batch_loader,
+    cached,
     deep_merge,
     defer,
     inertia,
@@ -68,6 +75,20 @@ def props_test(request):
     }
 
 
+@inertia("TestComponent", ssr_deadline=0.05)
+def ssr_deadline_test(request):
+    return {"name": "Brandon"}
+
+
+@inertia("TestComponent", ssr=False)
+def no_ssr_test(request):
+    return {"name": "Brandon"}
+
+
+def always_ssr_test(request):
+    return render(request, "TestComponent", {"name": "Brandon"}, ssr=True)
+
+
 def template_data_test(request):
     return render(
         request,
@@ -343,3 +364,221 @@ def messages_test(request):
 @inertia("TestComponent")
 def no_messages_test(request):
     return {}
+
+
+# ---------------------------------------------------------------------------
+# Parallel prop resolution
+# ---------------------------------------------------------------------------
+
+
+def _rendezvous(barrier, value):
+    """Only returns once every party of the barrier has arrived, so it can
+    only succeed when the props sharing the barrier run concurrently."""
+
+    def resolve():
+        barrier.wait()
+        return value
+
+    return resolve
+
+
+def _broken():
+    raise ValueError("search backend unavailable")
+
+
+@inertia("TestComponent")
+def parallel_test(request):
+    barrier = threading.Barrier(3, timeout=5)
+    return {
+        "name": "Brandon",
+        "teams": defer(_rendezvous(barrier, ["Penguins"]), "stats", parallel=True),
+        "stats": defer(_rendezvous(barrier, {"goals": 3}), "stats", parallel=True),
+        "missing": defer(_broken, "stats", rescue=True, parallel=True),
+        "sport": defer(_rendezvous(barrier, "Hockey"), "stats", parallel=True),
+    }
+
+
+@inertia("TestComponent")
+def parallel_setting_test(request):
+    barrier = threading.Barrier(2, timeout=5)
+    return {
+        "sport": _rendezvous(barrier, "Hockey"),
+        "team": _rendezvous(barrier, "Penguins"),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Async views and awaitable props
+# ---------------------------------------------------------------------------
+
+
+def _async_handshake():
+    """Two coroutine functions that each wait for the other to start, so they
+    only finish when awaited concurrently."""
+    sport_started, team_started = asyncio.Event(), asyncio.Event()
+
+    async def sport():
+        sport_started.set()
+        await asyncio.wait_for(team_started.wait(), timeout=5)
+        return "Hockey"
+
+    async def team():
+        team_started.set()
+        await asyncio.wait_for(sport_started.wait(), timeout=5)
+        return {"name": "Penguins", "city": lambda: "Pittsburgh"}
+
+    return sport, team
+
+
+async def _async_broken():
+    raise ValueError("stats service unavailable")
+
+
+@inertia("TestComponent")
+async def async_props_test(request):
+    sport, team = _async_handshake()
+    return {
+        "name": "Brandon",
+        "sport": sport,
+        "team": team,
+        "stats": defer(_async_broken, rescue=True),
+    }
+
+
+@inertia("TestComponent")
+async def async_redirect_test(request):
+    return redirect(empty_test)
+
+
+async def arender_test(request):
+    return await arender(
+        request,
+        "TestComponent",
+        {"name": "Brandon"},
+        template_data={"name": "Brian", "sport": "Basketball"},
+    )
+
+
+@inertia("TestComponent")
+def sync_view_async_props_test(request):
+    sport, team = _async_handshake()
+    return {"sport": sport, "team": team}
+
+
+# ---------------------------------------------------------------------------
+# Batch loaders
+# ---------------------------------------------------------------------------
+
+GOALS = {"Penguins": 3, "Bulls": 1}
+batch_fetches = []
+
+
+def goals_for(teams):
+    batch_fetches.append(teams)
+    return {team: GOALS[team] for team in teams if team in GOALS}
+
+
+async def agoals_for(teams):
+    return goals_for(teams)
+
+
+@inertia("TestComponent")
+def batch_test(request):
+    goals = batch_loader(goals_for)
+    return {
+        "name": "Brandon",
+        "penguins": defer(goals.load("Penguins"), "stats"),
+        "bulls": defer(goals.load("Bulls"), "stats"),
+        "again": defer(goals.load("Penguins"), "stats"),
+        "missing": defer(goals.load("Kings"), "stats", rescue=True),
+        "history": [goals.load("Bulls"), goals.load("Penguins")],
+    }
+
+
+@inertia("TestComponent")
+async def async_batch_test(request):
+    goals = batch_loader(agoals_for)
+    return {
+        "penguins": goals.load("Penguins"),
+        "bulls": goals.load("Bulls"),
+    }
+
+
+@inertia("TestComponent")
+def cached_batch_test(request):
+    goals = batch_loader(goals_for)
+    return {
+        "penguins": goals.load("Penguins"),
+        "bulls": cached(goals.load("Bulls"), key="bulls-goals", ttl=60),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Cached props
+# ---------------------------------------------------------------------------
+
+navigation_builds = []
+
+
+def build_navigation():
+    navigation_builds.append(1)
+    return {"links": ["Teams", "Players"], "build": len(navigation_builds)}
+
+
+@inertia("TestComponent")
+def cached_test(request):
+    return {
+        "navigation": cached(
+            build_navigation,
+            key="navigation",
+            ttl=60,
+            vary_on=[lambda request: request.headers.get("X-Team", "")],
+            tags=["menus"],
+        ),
+        "counters": defer(cached(lambda: len(navigation_builds), key="counters")),
+    }
+
+
+@inertia("TestComponent")
+def stale_cached_test(request):
+    return {
+        "navigation": cached(
+            build_navigation, key="stale-navigation", ttl=0, stale_while_revalidate=60
+        )
+    }
+
+
+# ---------------------------------------------------------------------------
+# Streaming responses
+# ---------------------------------------------------------------------------
+
+
+class SmallChunkStreamingResponse(InertiaStreamingResponse):
+    chunk_size = 16
+
+
+def streaming_test(request):
+    return SmallChunkStreamingResponse(
+        request,
+        "TestComponent",
+        {
+            "rows": [{"id": i, "note": "<b>R&D</b>"} for i in range(20)],
+            "total": lambda: 20,
+        },
+        template_data={"name": "Brian", "sport": "Basketball"},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Lazily rendered responses
+# ---------------------------------------------------------------------------
+
+
+@inertia("TestComponent", lazy=True)
+def template_response_test(request):
+    return {"name": "Brandon", "sport": lambda: "Hockey"}
+
+
+@inertia("TestComponent", lazy=True)
+async def async_template_response_test(request):
+    return {"name": "Brandon", "sport": lambda: "Hockey"}
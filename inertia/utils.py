@@ -1,6 +1,6 @@
 import warnings
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Callable
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
@@ -9,6 +9,7 @@ from django.forms.models import model_to_dict as base_model_to_dict
 
 from .prop_classes import (
     AlwaysProp,
+    BatchLoader,
     DeferredProp,
     MergeProp,
     OnceProp,
@@ -60,8 +61,11 @@ def once(
     *,
     key: str | None = None,
     expires_at: datetime | timedelta | int | float | None = None,
+    parallel: bool | None = None,
 ) -> OnceProp:
-    return OnceProp(prop, key=key, expires_at=expires_at, fresh=fresh)
+    return OnceProp(
+        prop, key=key, expires_at=expires_at, fresh=fresh, parallel=parallel
+    )
 
 
 def defer(
@@ -76,6 +80,7 @@ def defer(
     expires_at: datetime | timedelta | int | float | None = None,
     fresh: bool = False,
     rescue: bool = False,
+    parallel: bool | None = None,
 ) -> DeferredProp:
     return DeferredProp(
         prop,
@@ -88,6 +93,7 @@ def defer(
         expires_at=expires_at,
         fresh=fresh,
         rescue=rescue,
+        parallel=parallel,
     )
 
 
@@ -116,3 +122,7 @@ def scroll(
         "currentPage": metadata["currentPage"],
     }
     return ScrollProp(prop, normalized, wrapper=wrapper, defer=defer, group=group)
+
+
+def batch_loader(fetch: Callable[[list[Any]], Any]) -> BatchLoader:
+    return BatchLoader(fetch)
@@ -0,0 +1,133 @@
+import hashlib
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, NamedTuple
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .settings import settings
+
+__all__ = ["get_version", "reset_version", "tolerates_version"]
+
+logger = logging.getLogger(__name__)
+
+
+class _Resolved(NamedTuple):
+    version: Any
+    # What the version was derived from: the manifest's stat signature, or
+    # None for a callable.
+    signature: tuple[int, int, int] | None
+    checked_at: float
+
+
+_resolved: _Resolved | None = None
+_lock = threading.Lock()
+# The current version and when this process first saw it, for the grace
+# period after a deploy.
+_seen: tuple[Any, float] | None = None
+
+
+def get_version() -> Any:
+    """
+    The current asset version.
+
+    ``INERTIA_VERSION`` is used as is unless it is callable, in which case
+    it is called at most once per ``INERTIA_VERSION_CHECK_INTERVAL`` seconds.
+    With ``INERTIA_VERSION_MANIFEST`` set, the version is a hash of that file
+    instead; it is only hashed again once the file's modification time, size
+    or inode have changed, which is checked once per interval.
+    """
+    manifest = settings.INERTIA_VERSION_MANIFEST
+    if manifest is None and not callable(settings.INERTIA_VERSION):
+        return settings.INERTIA_VERSION
+
+    resolved = _resolved
+    now = time.monotonic()
+    if (
+        resolved is not None
+        and now - resolved.checked_at < settings.INERTIA_VERSION_CHECK_INTERVAL
+    ):
+        return resolved.version
+
+    with _lock:
+        # Another thread may have refreshed it while we waited.
+        resolved = _resolved
+        if (
+            resolved is not None
+            and now - resolved.checked_at < settings.INERTIA_VERSION_CHECK_INTERVAL
+        ):
+            return resolved.version
+        return _refresh(manifest, resolved, now).version
+
+
+def _refresh(manifest: Any, previous: _Resolved | None, now: float) -> _Resolved:
+    global _resolved
+    if manifest is None:
+        _resolved = _Resolved(settings.INERTIA_VERSION(), None, now)
+        return _resolved
+
+    try:
+        stat = os.stat(manifest)
+    except OSError as exc:
+        if previous is None:
+            raise ImproperlyConfigured(
+                f"INERTIA_VERSION_MANIFEST {str(manifest)!r} could not be read "
+                f"({exc.strerror}); build the assets or unset the setting."
+            ) from exc
+        # Keep serving the last version while a deploy replaces the file.
+        logger.warning("Could not stat INERTIA_VERSION_MANIFEST %r", manifest)
+        _resolved = previous._replace(checked_at=now)
+        return _resolved
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    if previous is not None and previous.signature == signature:
+        _resolved = previous._replace(checked_at=now)
+        return _resolved
+
+    with open(manifest, "rb") as file:
+        version = hashlib.md5(file.read(), usedforsecurity=False).hexdigest()
+    _resolved = _Resolved(version, signature, now)
+    return _resolved
+
+
+def tolerates_version(version: str) -> bool:
+    """
+    Whether a request from a client on an older ``version`` may still be
+    served instead of forcing a full reload.
+
+    Versions in ``INERTIA_COMPATIBLE_VERSIONS`` always are. Any other version
+    is, during ``INERTIA_VERSION_GRACE_PERIOD`` seconds after this process
+    first saw the current version, with a chance that falls from 1 to 0 over
+    the period, so reloads after a deploy are spread out rather than all at
+    once.
+    """
+    global _seen
+    if version in settings.INERTIA_COMPATIBLE_VERSIONS:
+        return True
+    grace_period = settings.INERTIA_VERSION_GRACE_PERIOD
+    if not grace_period:
+        return False
+
+    current = get_version()
+    now = time.monotonic()
+    seen = _seen
+    if seen is None or seen[0] != current:
+        seen = _seen = (current, now)
+    return bool(random.random() * grace_period >= now - seen[1])
+
+
+def reset_version(**kwargs: Any) -> None:
+    global _resolved, _seen
+    with _lock:
+        _resolved = None
+        _seen = None
+
+
+@receiver(setting_changed)
+def _reset_version_on_setting_change(setting: str, **kwargs: Any) -> None:
+    if setting.startswith("INERTIA_VERSION"):
+        reset_version()